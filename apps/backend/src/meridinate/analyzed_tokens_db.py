@@ -1155,6 +1155,69 @@ def init_database():
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_wlt_tag ON wallet_leaderboard_tags(tag, wallet_address)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_wltier_tag ON wallet_leaderboard_tiers(tier_tag, wallet_address)")
 
+        # ================================================================
+        # Top Holder Index (wallet -> tokens it is a top holder of)
+        # ================================================================
+        # Normalized copy of analyzed_tokens.top_holders_json so the wallet
+        # top-holder endpoints can answer with an index probe instead of parsing
+        # every token's JSON blob. Kept in sync by triggers, so every writer of
+        # top_holders_json (upserts, refreshes, hard deletes) is covered.
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'token_top_holders'")
+        top_holders_index_is_new = cursor.fetchone() is None
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS token_top_holders (
+                token_id INTEGER NOT NULL,
+                wallet_address TEXT NOT NULL,
+                rank INTEGER NOT NULL,
+                PRIMARY KEY (wallet_address, token_id)
+            )
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_tth_token ON token_top_holders(token_id)")
+
+        # Rank is the 1-indexed position of the wallet's first entry in the list;
+        # malformed JSON and non-object entries are skipped rather than failing the write
+        top_holders_insert = """
+            INSERT OR IGNORE INTO token_top_holders (token_id, wallet_address, rank)
+            SELECT {token_id}, address, rank FROM (
+                SELECT
+                    CASE WHEN type = 'object' THEN json_extract(value, '$.address') END as address,
+                    key + 1 as rank
+                FROM json_each(CASE WHEN json_valid({holders_json}) THEN {holders_json} ELSE '[]' END)
+                ORDER BY key
+            )
+            WHERE address IS NOT NULL
+        """
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_tth_insert
+            AFTER INSERT ON analyzed_tokens
+            WHEN NEW.top_holders_json IS NOT NULL
+            BEGIN
+                {top_holders_insert.format(token_id="NEW.id", holders_json="NEW.top_holders_json")};
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_tth_update
+            AFTER UPDATE OF top_holders_json ON analyzed_tokens
+            BEGIN
+                DELETE FROM token_top_holders WHERE token_id = OLD.id;
+                {top_holders_insert.format(token_id="NEW.id", holders_json="NEW.top_holders_json")};
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_tth_delete
+            AFTER DELETE ON analyzed_tokens
+            BEGIN
+                DELETE FROM token_top_holders WHERE token_id = OLD.id;
+            END
+        """)
+        if top_holders_index_is_new:
+            cursor.execute("SELECT id, top_holders_json FROM analyzed_tokens WHERE top_holders_json IS NOT NULL")
+            cursor.executemany(
+                top_holders_insert.format(token_id="?1", holders_json="?2"),
+                cursor.fetchall(),
+            )
+            print("[Database] Migrating: Built token_top_holders index from top_holders_json")
+
         # Verify all required columns exist (safeguard against data loss)
         print("[Database] Verifying schema integrity...")
         cursor.execute("PRAGMA table_info(analyzed_tokens)")
@@ -1576,6 +1639,41 @@ def save_wallet_activity(
             return False
 
 
+def save_wallet_activities_bulk(activities: List[Dict]) -> int:
+    """
+    Save many wallet activity events in one transaction.
+
+    Each dict has the save_wallet_activity keyword arguments. Activities for
+    untracked wallets and duplicate transaction signatures are skipped, as in
+    save_wallet_activity (the first activity for a signature wins).
+
+    Returns:
+        Number of activities inserted
+    """
+    if not activities:
+        return 0
+
+    with get_db_connection() as conn:
+        before = conn.total_changes
+        conn.executemany(
+            """
+            INSERT OR IGNORE INTO wallet_activity (
+                wallet_id, transaction_signature, timestamp,
+                activity_type, description, sol_amount,
+                token_amount, recipient_address
+            )
+            SELECT id, :transaction_signature, :timestamp,
+                   :activity_type, :description, :sol_amount,
+                   :token_amount, :recipient_address
+            FROM early_buyer_wallets
+            WHERE wallet_address = :wallet_address
+            LIMIT 1
+        """,
+            activities,
+        )
+        return conn.total_changes - before
+
+
 def delete_analyzed_token(token_id: int) -> bool:
     """
     Delete an analyzed token and all associated data.
@@ -2407,6 +2505,36 @@ def get_stale_mtew_positions(older_than_minutes: int = 15, limit: int = 100) ->
         return positions
 
 
+def get_position_keys_for_wallets(wallet_addresses: List[str]) -> set:
+    """
+    Get the (wallet_address, token_address) pairs that have a position, for the given wallets.
+
+    Used by webhook callbacks to drop transfers for untracked wallets/tokens with
+    one indexed query instead of a position lookup per transfer.
+
+    Args:
+        wallet_addresses: Wallet addresses seen in a webhook payload
+
+    Returns:
+        Set of (wallet_address, token_address) tuples (any position, held or sold)
+    """
+    if not wallet_addresses:
+        return set()
+
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            SELECT DISTINCT p.wallet_address, t.token_address
+            FROM mtew_token_positions p
+            JOIN analyzed_tokens t ON p.token_id = t.id
+            WHERE p.wallet_address IN (SELECT value FROM json_each(?))
+        """,
+            (json.dumps(list(wallet_addresses)),),
+        )
+        return {(row[0], row[1]) for row in cursor.fetchall()}
+
+
 def get_position_by_token_address(wallet_address: str, token_address: str) -> Optional[Dict]:
     """
     Look up any position by wallet address and token mint address.
@@ -2748,6 +2876,40 @@ def update_mtew_position(
         return cursor.rowcount > 0
 
 
+def update_mtew_positions_holding_bulk(updates: List[Dict]) -> int:
+    """
+    Apply many still-holding position refreshes in one transaction.
+
+    Same effect as update_mtew_position(still_holding=True, ...) per entry; used
+    by the position checker so a run commits once instead of once per position.
+
+    Args:
+        updates: Dicts with wallet_address, token_id, current_balance,
+                 current_balance_usd and pnl_ratio
+
+    Returns:
+        Number of positions updated
+    """
+    if not updates:
+        return 0
+
+    with get_db_connection() as conn:
+        before = conn.total_changes
+        conn.executemany(
+            """
+            UPDATE mtew_token_positions
+            SET still_holding = 1,
+                current_balance = :current_balance,
+                current_balance_usd = :current_balance_usd,
+                pnl_ratio = :pnl_ratio,
+                position_checked_at = CURRENT_TIMESTAMP
+            WHERE wallet_address = :wallet_address AND token_id = :token_id
+        """,
+            updates,
+        )
+        return conn.total_changes - before
+
+
 def record_position_buy(
     wallet_address: str,
     token_id: int,
@@ -146,6 +146,14 @@ class ResponseCache:
             result = await fetch_fn()
             future.set_result(result)
             return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            # Waiters re-raise the same error instead of awaiting a future that never resolves
+            future.set_exception(e)
+            future.exception()  # mark retrieved so an unawaited future doesn't log a warning
+            raise
         finally:
             # Remove from pending requests
             if key in self.pending_requests:
@@ -23,15 +23,30 @@ Usage:
     breakdown = credit_tracker.get_usage_by_operation()
 """
 
+import asyncio
+import json
 import sqlite3
 import threading
+from collections import deque
 from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
 from meridinate import settings
+from meridinate.state import run_db
+
+# Seconds queue_operation() entries wait so bursts are written in one transaction
+OPERATION_FLUSH_INTERVAL_SECONDS = 2.0
+
+# operation_log keeps only the latest 100 entries
+_PRUNE_OPERATION_LOG_SQL = """
+    DELETE FROM operation_log
+    WHERE id NOT IN (
+        SELECT id FROM operation_log ORDER BY timestamp DESC LIMIT 100
+    )
+"""
 
 
 class CreditOperation(str, Enum):
@@ -183,6 +198,8 @@ class CreditTracker:
 
         self._db_path = settings.DATABASE_FILE
         self._session_credits = 0
+        self._pending_operations: deque = deque()
+        self._flush_task: Optional[asyncio.Task] = None
         self._init_schema()
         self._initialized = True
 
@@ -288,8 +305,6 @@ class CreditTracker:
         Returns:
             The transaction ID
         """
-        import json
-
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
@@ -338,8 +353,6 @@ class CreditTracker:
 
     def _update_daily_aggregate(self, cursor: sqlite3.Cursor, operation: str, credits: int):
         """Update the daily aggregate table incrementally."""
-        import json
-
         today = datetime.now().strftime("%Y-%m-%d")
 
         # Get existing aggregate
@@ -383,8 +396,6 @@ class CreditTracker:
         Returns:
             CreditUsageStats for the day
         """
-        import json
-
         if date is None:
             date = datetime.now()
 
@@ -435,8 +446,6 @@ class CreditTracker:
         Returns:
             Aggregated CreditUsageStats for the range
         """
-        import json
-
         if end_date is None:
             end_date = datetime.now()
 
@@ -495,8 +504,6 @@ class CreditTracker:
         Returns:
             List of CreditTransaction objects
         """
-        import json
-
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
@@ -580,8 +587,6 @@ class CreditTracker:
         Returns:
             The operation log entry ID
         """
-        import json
-
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
@@ -595,15 +600,89 @@ class CreditTracker:
             entry_id = cursor.lastrowid
 
             # Prune old entries to keep only the latest 100
-            cursor.execute("""
-                DELETE FROM operation_log
-                WHERE id NOT IN (
-                    SELECT id FROM operation_log ORDER BY timestamp DESC LIMIT 100
-                )
-            """)
+            cursor.execute(_PRUNE_OPERATION_LOG_SQL)
 
             return entry_id
 
+    def record_operations(self, entries: List[Dict[str, Any]]) -> int:
+        """
+        Write several operation log entries in one transaction with a single prune.
+
+        Args:
+            entries: Dicts with operation, label, credits, call_count, context_json
+                and timestamp (as queued by queue_operation)
+
+        Returns:
+            Number of entries written
+        """
+        if not entries:
+            return 0
+
+        with self._get_connection() as conn:
+            conn.executemany("""
+                INSERT INTO operation_log (operation, label, credits, call_count, timestamp, context_json)
+                VALUES (:operation, :label, :credits, :call_count, :timestamp, :context_json)
+            """, entries)
+            conn.execute(_PRUNE_OPERATION_LOG_SQL)
+
+        return len(entries)
+
+    def queue_operation(
+        self,
+        operation: str,
+        label: str,
+        credits: int = 0,
+        call_count: int = 1,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Non-blocking record_operation() for code running on the event loop.
+
+        The entry is buffered and written with any others queued in the next
+        OPERATION_FLUSH_INTERVAL_SECONDS, in one transaction on the DB executor.
+        Its timestamp is taken now, so log order is unaffected by the delay.
+        Must be called from a running event loop.
+        """
+        self._pending_operations.append({
+            "operation": operation,
+            "label": label,
+            "credits": credits,
+            "call_count": call_count,
+            "context_json": json.dumps(context) if context else None,
+            # Same format as the column's CURRENT_TIMESTAMP default (UTC)
+            "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+        })
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_after_delay())
+
+    async def _flush_after_delay(self):
+        await asyncio.sleep(OPERATION_FLUSH_INTERVAL_SECONDS)
+        await self.flush_operations()
+
+    async def flush_operations(self) -> int:
+        """
+        Write all queued operation log entries now (also called on app shutdown).
+
+        Returns:
+            Number of entries written
+        """
+        task = self._flush_task
+        if task is not None and task is not asyncio.current_task() and not task.done():
+            task.cancel()
+        self._flush_task = None
+
+        entries = []
+        while self._pending_operations:
+            entries.append(self._pending_operations.popleft())
+        if not entries:
+            return 0
+
+        try:
+            return await run_db(self.record_operations, entries)
+        except Exception as e:
+            print(f"[CreditTracker] Failed to write {len(entries)} queued operations: {e}")
+            return 0
+
     def get_recent_operations(self, limit: int = 30) -> List[OperationLogEntry]:
         """
         Get recent high-level operations from the persistent log.
@@ -614,8 +693,6 @@ class CreditTracker:
         Returns:
             List of OperationLogEntry objects ordered by timestamp descending
         """
-        import json
-
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
@@ -0,0 +1,154 @@
+"""
+Shared aiosqlite connection pool
+
+Async routers used to open a fresh aiosqlite.connect() per request, which spawns
+a worker thread and throws away SQLite's per-connection page cache on close.
+This pool keeps one read-write connection plus a fixed set of read-only
+connections open for the life of the process. Under WAL the readers run
+concurrently with each other and with the single writer.
+
+Usage:
+    from meridinate.db_pool import get_db_pool
+
+    async with get_db_pool().read() as conn:
+        cursor = await conn.execute("SELECT ...")
+
+    async with get_db_pool().write() as conn:
+        await conn.execute("UPDATE ...")  # committed on exit, rolled back on error
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
+
+import aiosqlite
+
+from meridinate import settings
+
+DEFAULT_READERS = 8
+
+# Same per-connection PRAGMAs as analyzed_tokens_db.get_db_connection, plus
+# in-memory temp tables and a 256MB mmap window for read-heavy endpoints.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+class DatabasePool:
+    """
+    Process-wide pool of long-lived aiosqlite connections.
+
+    Connections are opened lazily on first use (or eagerly via open() at app
+    startup) and re-opened if settings.DATABASE_FILE changes, so tests that point
+    the app at a temporary database keep working. aiosqlite connections are not
+    bound to an event loop, but asyncio queues and locks are; those primitives
+    are rebuilt whenever the pool is used from a different running loop.
+    """
+
+    def __init__(self, readers: int = DEFAULT_READERS):
+        self.readers = readers
+        self._db_path: Optional[str] = None
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._reader_conns: List[aiosqlite.Connection] = []
+        self._idle: Optional[asyncio.Queue] = None
+        self._write_lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._open_lock = asyncio.Lock()
+
+    async def _connect(self, db_path: str, read_only: bool) -> aiosqlite.Connection:
+        conn = await aiosqlite.connect(db_path, timeout=5.0)
+        conn.row_factory = aiosqlite.Row
+        for pragma in _CONNECTION_PRAGMAS:
+            await conn.execute(pragma)
+        if read_only:
+            await conn.execute("PRAGMA query_only=ON")
+        return conn
+
+    def _bind_loop(self):
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+        self._loop = loop
+        self._open_lock = asyncio.Lock()
+        self._write_lock = asyncio.Lock()
+        self._idle = asyncio.Queue()
+        for conn in self._reader_conns:
+            self._idle.put_nowait(conn)
+
+    async def open(self):
+        """Open (or re-open) connections for the current settings.DATABASE_FILE."""
+        self._bind_loop()
+        db_path = settings.DATABASE_FILE
+        if self._db_path == db_path and self._writer is not None:
+            return
+
+        async with self._open_lock:
+            if self._db_path == db_path and self._writer is not None:
+                return
+            await self._close_connections()
+
+            self._writer = await self._connect(db_path, read_only=False)
+            self._reader_conns = [await self._connect(db_path, read_only=True) for _ in range(self.readers)]
+            for conn in self._reader_conns:
+                self._idle.put_nowait(conn)
+            self._db_path = db_path
+
+    async def _close_connections(self):
+        conns = ([self._writer] if self._writer is not None else []) + self._reader_conns
+        self._writer = None
+        self._reader_conns = []
+        self._db_path = None
+        if self._idle is not None:
+            self._idle = asyncio.Queue()
+        for conn in conns:
+            try:
+                await conn.close()
+            except Exception:
+                pass
+
+    async def close(self):
+        """Close every pooled connection (called on app shutdown)."""
+        async with self._open_lock:
+            await self._close_connections()
+
+    @asynccontextmanager
+    async def read(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a read-only connection (rows are aiosqlite.Row)."""
+        await self.open()
+        idle = self._idle
+        conn = await idle.get()
+        try:
+            yield conn
+        finally:
+            # Only return the connection if the pool wasn't re-opened meanwhile
+            if conn in self._reader_conns:
+                idle.put_nowait(conn)
+
+    @asynccontextmanager
+    async def write(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Hold the single writer connection; commits on exit, rolls back on error."""
+        await self.open()
+        async with self._write_lock:
+            conn = self._writer
+            try:
+                yield conn
+                await conn.commit()
+            except BaseException:
+                await conn.rollback()
+                raise
+
+
+_pool: Optional[DatabasePool] = None
+
+
+def get_db_pool() -> DatabasePool:
+    """Get the process-wide database pool"""
+    global _pool
+    if _pool is None:
+        _pool = DatabasePool()
+    return _pool
@@ -5,6 +5,7 @@ Provides functions to analyze tokens and extract early bidder data
 
 from __future__ import annotations
 
+import asyncio
 import os
 import re
 import sys
@@ -12,6 +13,7 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
 import base58
+import httpx
 import requests
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
@@ -20,6 +22,7 @@ import builtins
 from meridinate.debug_config import is_debug_enabled
 from meridinate.cache import ResponseCache
 from meridinate.credit_tracker import get_credit_tracker, CreditOperation
+from meridinate.http_client import get_async_http_client
 
 # ============================================================================
 # OPSEC: PRODUCTION MODE - Disable Sensitive Logging
@@ -219,6 +222,50 @@ class HeliusAPI:
             print(f"[Helius] Wallet API balances error for {wallet_address[:8]}: {str(e)}")
             return None, 0
 
+    async def _wallet_api_call_async(self, path: str, method: str = "GET", json_body: dict = None) -> dict:
+        """Async counterpart of _wallet_api_call on the shared httpx client."""
+        url = f"https://api.helius.xyz/v1/{path}"
+        params = {"api-key": self.api_key}
+        client = get_async_http_client()
+        try:
+            if method == "POST":
+                response = await client.post(url, params=params, json=json_body, timeout=30)
+            else:
+                response = await client.get(url, params=params, timeout=30)
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return {"error": "not_found", "status": 404}
+            raise Exception(f"Wallet API call failed ({path}): {str(e)}")
+        except Exception as e:
+            raise Exception(f"Wallet API call failed ({path}): {str(e)}")
+
+    async def get_wallet_balances_async(self, wallet_address: str) -> tuple[Optional[Dict], int]:
+        """
+        Async version of get_wallet_balances for fan-out from the event loop.
+
+        Same return contract: (balances dict, credits_used), (None, 100) for an
+        API-level error, (None, 0) if the request itself failed.
+        """
+        try:
+            result = await self._wallet_api_call_async(
+                f"wallet/{wallet_address}/balances?showNative=true&limit=100"
+            )
+            if "error" in result:
+                return None, 100
+
+            await asyncio.to_thread(
+                get_credit_tracker().record,
+                CreditOperation.WALLET_API_BALANCES,
+                credits=100,
+                wallet_address=wallet_address,
+            )
+            return result, 100
+        except Exception as e:
+            print(f"[Helius] Wallet API balances error for {wallet_address[:8]}: {str(e)}")
+            return None, 0
+
     def get_wallet_funded_by(self, wallet_address: str) -> tuple[Optional[Dict], int]:
         """
         Get the original funding source of a wallet.
@@ -553,6 +600,68 @@ class HeliusAPI:
                 print(f"[DexScreener] Error fetching price: {str(e)}")
             return None
 
+    async def _dexscreener_pair_async(self, mint_address: str) -> Optional[Dict]:
+        """Fetch the main DexScreener pair for a mint on the shared httpx client."""
+        url = f"https://api.dexscreener.com/token-pairs/v1/solana/{mint_address}"
+        response = await get_async_http_client().get(url, timeout=10)
+
+        if response.status_code == 429:
+            print("[DexScreener] Rate limit exceeded (429) - try again in ~1 minute")
+            return None
+
+        response.raise_for_status()
+
+        data = response.json()
+        if isinstance(data, list) and len(data) > 0:
+            # DexScreener returns array of pairs, take the first one (usually the main pool)
+            return data[0]
+        print("[DexScreener] No pairs found for this token")
+        return None
+
+    async def _refresh_dexscreener_async(self, mint_address: str):
+        """
+        Fetch a mint's pair once and cache both its price and market cap.
+
+        Concurrent callers for the same mint share one in-flight request
+        (a burst of webhook transfers for one token makes a single call).
+        """
+
+        async def fetch():
+            try:
+                pair = await self._dexscreener_pair_async(mint_address)
+            except Exception as e:
+                if "429" not in str(e):
+                    print(f"[DexScreener] Error fetching pair: {str(e)}")
+                return
+            if not pair:
+                return
+            price_usd = pair.get("priceUsd")
+            if price_usd is not None:
+                self._dexscreener_cache.set(f"dexscreener_price:{mint_address}", float(price_usd))
+            market_cap = pair.get("marketCap")
+            if market_cap is not None and market_cap > 0:
+                self._dexscreener_cache.set(f"dexscreener_mc:{mint_address}", float(market_cap))
+
+        await self._dexscreener_cache.deduplicate_request(f"dexscreener_pair:{mint_address}", fetch)
+
+    async def aget_market_cap_from_dexscreener(self, mint_address: str) -> Optional[float]:
+        """Async version of get_market_cap_from_dexscreener (same cache)."""
+        cache_key = f"dexscreener_mc:{mint_address}"
+        cached_value, _ = self._dexscreener_cache.get(cache_key)
+        if cached_value is None:
+            await self._refresh_dexscreener_async(mint_address)
+            cached_value, _ = self._dexscreener_cache.get(cache_key)
+        return cached_value
+
+    async def aget_token_price_from_dexscreener(self, mint_address: str) -> Optional[float]:
+        """Async version of get_token_price_from_dexscreener (same cache)."""
+        cache_key = f"dexscreener_price:{mint_address}"
+        cached_value, _ = self._dexscreener_cache.get(cache_key)
+        if cached_value is None:
+            await self._refresh_dexscreener_async(mint_address)
+            cached_value, _ = self._dexscreener_cache.get(cache_key)
+        return cached_value
+
     def get_market_cap_with_fallback(self, mint_address: str) -> tuple[Optional[float], int]:
         """
         Get market cap with DexScreener primary + Helius fallback.
@@ -2177,3 +2286,95 @@ class WebhookManager:
             return response.json()
         except Exception as e:
             raise Exception(f"Failed to list webhooks: {str(e)}")
+
+    # ------------------------------------------------------------------
+    # Async variants (shared httpx client, no executor thread per call)
+    # ------------------------------------------------------------------
+
+    async def _request_async(self, method: str, path: str = "", json_body: dict = None):
+        client = get_async_http_client()
+        response = await client.request(
+            method,
+            f"{self.webhook_url}{path}",
+            params={"api-key": self.api_key},
+            json=json_body,
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            timeout=30,
+        )
+        response.raise_for_status()
+        return response
+
+    async def acreate_webhook(
+        self,
+        webhook_url: str,
+        wallet_addresses: List[str],
+        webhook_type: str = "enhanced",
+        transaction_types: List[str] = None,
+    ) -> Dict:
+        """Async version of create_webhook."""
+        if transaction_types is None:
+            transaction_types = ["TRANSFER", "SWAP", "NFT_SALE", "TOKEN_MINT"]
+
+        payload = {
+            "webhookURL": webhook_url,
+            "transactionTypes": transaction_types,
+            "accountAddresses": wallet_addresses,
+            "webhookType": webhook_type,
+        }
+
+        try:
+            result = (await self._request_async("POST", json_body=payload)).json()
+            print(f"[Webhook] Created webhook {result.get('webhookID')} for {len(wallet_addresses)} addresses")
+            return result
+        except Exception as e:
+            raise Exception(f"Failed to create webhook: {str(e)}")
+
+    async def adelete_webhook(self, webhook_id: str) -> bool:
+        """Async version of delete_webhook."""
+        try:
+            await self._request_async("DELETE", f"/{webhook_id}")
+            print(f"[Webhook] Deleted webhook {webhook_id}")
+            return True
+        except Exception as e:
+            raise Exception(f"Failed to delete webhook: {str(e)}")
+
+    async def aget_webhook(self, webhook_id: str) -> Dict:
+        """Async version of get_webhook."""
+        try:
+            return (await self._request_async("GET", f"/{webhook_id}")).json()
+        except Exception as e:
+            raise Exception(f"Failed to get webhook: {str(e)}")
+
+    async def alist_webhooks(self) -> List[Dict]:
+        """Async version of list_webhooks."""
+        try:
+            return (await self._request_async("GET")).json()
+        except Exception as e:
+            raise Exception(f"Failed to list webhooks: {str(e)}")
+
+
+# ============================================================================
+# Shared instances
+# ============================================================================
+# Each HeliusAPI/WebhookManager owns a requests.Session (and HeliusAPI its
+# DexScreener/SOL price caches), so hot paths reuse one instance per API key
+# instead of paying a new TCP+TLS handshake and a cold cache on every call.
+
+_shared_helius: Optional[HeliusAPI] = None
+_shared_webhook_manager: Optional[WebhookManager] = None
+
+
+def get_shared_helius(api_key: str) -> HeliusAPI:
+    """Get the process-wide HeliusAPI for api_key (lazy initialization)."""
+    global _shared_helius
+    if _shared_helius is None or _shared_helius.api_key != api_key:
+        _shared_helius = HeliusAPI(api_key)
+    return _shared_helius
+
+
+def get_webhook_manager(api_key: str) -> WebhookManager:
+    """Get the process-wide WebhookManager for api_key (lazy initialization)."""
+    global _shared_webhook_manager
+    if _shared_webhook_manager is None or _shared_webhook_manager.api_key != api_key:
+        _shared_webhook_manager = WebhookManager(api_key)
+    return _shared_webhook_manager
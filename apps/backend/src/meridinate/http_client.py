@@ -0,0 +1,57 @@
+"""
+Shared async HTTP client
+
+Provides one pooled httpx.AsyncClient for async call sites (Helius, DexScreener, ...)
+so they reuse keep-alive connections instead of opening a new TCP/TLS session
+per request, and never park an executor thread on blocking I/O.
+"""
+
+import asyncio
+from typing import Optional
+
+import httpx
+
+# Connection pool sizing (shared by every host the backend talks to)
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 64
+# Idle keep-alive lifetime; httpx's 5s default drops connections between webhook bursts
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 30.0
+HTTP_TIMEOUT_SECONDS = 30.0
+
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide async HTTP client (lazy initialization).
+
+    Pooled connections belong to the event loop that opened them, so a new client
+    is created if this is called from a different running loop (e.g. per-test
+    loops); in the server there is exactly one.
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            # Multiplex concurrent requests to one host over a single connection
+            # (needs the h2 package from httpx[http2]); gzip is negotiated by default
+            http2=True,
+            timeout=HTTP_TIMEOUT_SECONDS,
+        )
+        _client_loop = loop
+    return _client
+
+
+async def close_async_http_client():
+    """Close the shared client (called on app shutdown)."""
+    global _client, _client_loop
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
@@ -212,6 +212,12 @@ def create_app() -> FastAPI:
         if RATE_LIMIT_ENABLED:
             print("[OK] Rate limiting enabled (slowapi + Redis)")
 
+        # Open pooled aiosqlite connections up front so the first requests don't pay for it
+        from meridinate.db_pool import get_db_pool
+        db_pool = get_db_pool()
+        await db_pool.open()
+        print(f"[OK] SQLite connection pool opened (1 writer + {db_pool.readers} readers)")
+
         # Start Position tracker scheduler
         from meridinate.scheduler import start_scheduler
         start_scheduler()
@@ -266,6 +272,16 @@ def create_app() -> FastAPI:
         except Exception:
             pass
 
+        from meridinate.credit_tracker import get_credit_tracker
+        await get_credit_tracker().flush_operations()
+
+        from meridinate.db_pool import get_db_pool
+        await get_db_pool().close()
+        print("[OK] SQLite connection pool closed")
+
+        from meridinate.http_client import close_async_http_client
+        await close_async_http_client()
+
     return app
 
 
@@ -10,6 +10,7 @@ from meridinate.models.ingest_settings import (
     IngestSettings,
     IngestSettingsUpdate,
     ScoreWeights,
+    complete_score_weights,
 )
 
 __all__ = [
@@ -18,4 +19,5 @@ __all__ = [
     "IngestSettings",
     "IngestSettingsUpdate",
     "ScoreWeights",
+    "complete_score_weights",
 ]
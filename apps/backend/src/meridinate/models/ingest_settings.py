@@ -7,7 +7,7 @@ Used by both the settings persistence layer and API endpoints.
 
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 # ============================================================================
@@ -44,6 +44,16 @@ class ScoreWeights(BaseModel):
     positions_negative_pnl: int = Field(default=-8, description="points if our_positions_pnl < 0")
 
 
+def complete_score_weights(weights: Optional[dict]) -> dict:
+    """
+    Fill missing score weights with defaults and coerce values to int.
+
+    Applied once when settings are loaded or updated, so the scorer always sees
+    every rule's weight. Raises pydantic.ValidationError on non-integer weights.
+    """
+    return ScoreWeights(**(weights or {})).model_dump()
+
+
 # ============================================================================
 # Default Values
 # ============================================================================
@@ -280,6 +290,11 @@ class IngestSettingsUpdate(BaseModel):
     control_cohort_daily_quota: Optional[int] = Field(None, ge=0)
     score_weights: Optional[dict] = None
 
+    @field_validator("score_weights")
+    @classmethod
+    def _complete_score_weights(cls, value: Optional[dict]) -> Optional[dict]:
+        return complete_score_weights(value) if value is not None else None
+
     # Real-time detection settings
     realtime_watch_window_seconds: Optional[int] = Field(None, ge=60, le=600)
     realtime_mc_min_at_close: Optional[float] = Field(None, ge=0)
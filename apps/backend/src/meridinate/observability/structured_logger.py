@@ -10,11 +10,15 @@ Provides JSON-formatted logging with:
 - Contextual metadata
 """
 
+import atexit
+import copy
 import json
 import logging
+import queue
 import sys
 from contextvars import ContextVar
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Dict, Optional
 
 # Context variables for request/job tracking
@@ -37,19 +41,20 @@ class StructuredFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            # record.created, not now(): formatting runs later on the listener thread
+            "timestamp": datetime.utcfromtimestamp(record.created).isoformat() + "Z",
             "level": record.levelname,
             "message": record.getMessage(),
             "logger": record.name,
         }
 
-        # Add request_id if set
-        request_id = request_id_ctx.get()
+        # Request/job IDs are stamped onto the record by ContextQueueHandler.prepare
+        # on the logging thread; context variables are empty on the listener thread
+        request_id = getattr(record, "request_id", None)
         if request_id:
             log_data["request_id"] = request_id
 
-        # Add job_id if set
-        job_id = job_id_ctx.get()
+        job_id = getattr(record, "job_id", None)
         if job_id:
             log_data["job_id"] = job_id
 
@@ -81,12 +86,51 @@ class StructuredFormatter(logging.Formatter):
                 "exc_info",
                 "exc_text",
                 "stack_info",
+                "request_id",
+                "job_id",
             ]:
                 log_data[key] = value
 
         return json.dumps(log_data)
 
 
+class ContextQueueHandler(QueueHandler):
+    """
+    Queue handler that defers formatting and stdout writes to a listener thread.
+
+    The caller only merges the message args and stamps the current request/job
+    IDs (context variables aren't visible from the listener thread); JSON
+    encoding and the locked stdout write/flush happen off the hot path.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+
+        request_id = request_id_ctx.get()
+        if request_id:
+            record.request_id = request_id
+        job_id = job_id_ctx.get()
+        if job_id:
+            record.job_id = job_id
+        return record
+
+
+_listener: Optional[QueueListener] = None
+
+
+def _stop_listener():
+    """Flush queued records on interpreter exit."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+
 def setup_logger(name: str = "gun_del_sol", level: int = logging.INFO, json_output: bool = True) -> logging.Logger:
     """
     Setup a structured logger instance
@@ -96,14 +140,19 @@ def setup_logger(name: str = "gun_del_sol", level: int = logging.INFO, json_outp
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         json_output: If True, output JSON-formatted logs; otherwise use text
 
+    Records are enqueued by a ContextQueueHandler and written to stdout by a
+    background QueueListener, so logging never blocks on the stdout lock.
+
     Returns:
         Configured logger instance
     """
+    global _listener
     logger = logging.getLogger(name)
     logger.setLevel(level)
 
     # Remove existing handlers
     logger.handlers = []
+    _stop_listener()
 
     # Create console handler
     handler = logging.StreamHandler(sys.stdout)
@@ -116,7 +165,11 @@ def setup_logger(name: str = "gun_del_sol", level: int = logging.INFO, json_outp
         formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 
     handler.setFormatter(formatter)
-    logger.addHandler(handler)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(ContextQueueHandler(log_queue))
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
 
     return logger
 
@@ -142,24 +195,24 @@ def clear_context():
 
 
 # Convenience functions for logging
-def log_info(message: str, **kwargs):
-    """Log info message with optional metadata"""
-    logger.info(message, extra=kwargs)
+def log_info(message: str, *args, **kwargs):
+    """Log info message with optional %-style args (formatted only if emitted) and metadata"""
+    logger.info(message, *args, extra=kwargs)
 
 
-def log_warning(message: str, **kwargs):
-    """Log warning message with optional metadata"""
-    logger.warning(message, extra=kwargs)
+def log_warning(message: str, *args, **kwargs):
+    """Log warning message with optional %-style args (formatted only if emitted) and metadata"""
+    logger.warning(message, *args, extra=kwargs)
 
 
-def log_error(message: str, exc_info=None, **kwargs):
-    """Log error message with optional metadata"""
-    logger.error(message, exc_info=exc_info, extra=kwargs)
+def log_error(message: str, *args, exc_info=None, **kwargs):
+    """Log error message with optional %-style args (formatted only if emitted) and metadata"""
+    logger.error(message, *args, exc_info=exc_info, extra=kwargs)
 
 
-def log_debug(message: str, **kwargs):
-    """Log debug message with optional metadata"""
-    logger.debug(message, extra=kwargs)
+def log_debug(message: str, *args, **kwargs):
+    """Log debug message with optional %-style args (formatted only if emitted) and metadata"""
+    logger.debug(message, *args, extra=kwargs)
 
 
 # Analysis-specific logging functions
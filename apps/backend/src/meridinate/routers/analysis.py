@@ -195,9 +195,9 @@ def run_token_analysis_sync(
 
         # Invalidate multi-token wallets cache so NEW badges show up immediately
         try:
-            from meridinate.routers.wallets import cache as wallets_cache
+            from meridinate.services.wallet_cache import invalidate_multi_token_wallets_cache
 
-            wallets_cache.invalidate("multi_early_buyer_wallets")
+            invalidate_multi_token_wallets_cache()
         except Exception as cache_err:
             log_error("Failed to invalidate multi-token wallets cache after analysis", error=str(cache_err))
 
@@ -498,11 +498,11 @@ async def get_scheduled_jobs(request: Request):
     return ScheduledJobsListResponse(
         jobs=[
             ScheduledJobResponse(
-                id=job["id"],
-                name=job["name"],
-                enabled=job["enabled"],
-                next_run_at=job["next_run_at"],
-                interval_minutes=job["interval_minutes"],
+                id=job.id,
+                name=job.name,
+                enabled=job.enabled,
+                next_run_at=job.next_run_at,
+                interval_minutes=job.interval_minutes,
             )
             for job in jobs
         ],
@@ -544,13 +544,13 @@ async def get_status_bar(request: Request):
 
     timers = {}
     for job in jobs:
-        timers[job["id"]] = {
-            "name": job["name"],
-            "enabled": job["enabled"],
-            "next_run_at": job["next_run_at"],
-            "interval_minutes": job["interval_minutes"],
-            "is_running": job["id"] in running_ids,
-            "paused": job.get("paused", False),
+        timers[job.id] = {
+            "name": job.name,
+            "enabled": job.enabled,
+            "next_run_at": job.next_run_at,
+            "interval_minutes": job.interval_minutes,
+            "is_running": job.id in running_ids,
+            "paused": job.paused,
         }
 
     # Token polling tier breakdown
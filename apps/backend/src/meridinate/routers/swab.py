@@ -382,51 +382,54 @@ async def trigger_position_check(
     - max_positions: Maximum positions to check (default 50)
     - max_credits: Maximum credits to spend (defaults to remaining daily budget)
     """
+    from meridinate.scheduler import position_check_lock
     from meridinate.tasks.position_tracker import check_mtew_positions
 
     try:
-        # Get settings for credit budget
-        settings = db.get_swab_settings()
-
-        # Use remaining daily budget if not specified
-        if max_credits is None:
-            max_credits = settings["daily_credit_budget"] - settings["credits_used_today"]
-            if max_credits <= 0:
-                return CheckResultResponse(
-                    positions_checked=0,
-                    still_holding=0,
-                    sold=0,
-                    errors=0,
-                    credits_used=0,
-                    duration_ms=0,
-                    wallets_recalculated=0,
-                )
+        # Wait for a running scheduled check so the budget is read after it has spent
+        async with position_check_lock:
+            # Get settings for credit budget
+            settings = db.get_swab_settings()
+
+            # Use remaining daily budget if not specified
+            if max_credits is None:
+                max_credits = settings["daily_credit_budget"] - settings["credits_used_today"]
+                if max_credits <= 0:
+                    return CheckResultResponse(
+                        positions_checked=0,
+                        still_holding=0,
+                        sold=0,
+                        errors=0,
+                        credits_used=0,
+                        duration_ms=0,
+                        wallets_recalculated=0,
+                    )
 
-        log_info(f"Manual position check triggered: max_positions={max_positions}, max_credits={max_credits}")
+            log_info(f"Manual position check triggered: max_positions={max_positions}, max_credits={max_credits}")
 
-        result = await check_mtew_positions(
-            older_than_minutes=settings["stale_threshold_minutes"],
-            max_positions=max_positions,
-            max_credits=max_credits,
-        )
+            result = await check_mtew_positions(
+                older_than_minutes=settings["stale_threshold_minutes"],
+                max_positions=max_positions,
+                max_credits=max_credits,
+            )
 
-        # Update position tracker credits used
-        db.update_swab_last_check(credits_used=result.get("credits_used", 0))
-
-        # Log high-level operation for persistent history
-        from meridinate.credit_tracker import get_credit_tracker
-        get_credit_tracker().record_operation(
-            operation="position_check",
-            label="Position Check",
-            credits=result.get("credits_used", 0),
-            call_count=result.get("positions_checked", 0),
-            context={
-                "still_holding": result.get("still_holding", 0),
-                "sold": result.get("sold", 0),
-            }
-        )
+            # Update position tracker credits used
+            db.update_swab_last_check(credits_used=result.get("credits_used", 0))
+
+            # Log high-level operation for persistent history
+            from meridinate.credit_tracker import get_credit_tracker
+            get_credit_tracker().record_operation(
+                operation="position_check",
+                label="Position Check",
+                credits=result.get("credits_used", 0),
+                call_count=result.get("positions_checked", 0),
+                context={
+                    "still_holding": result.get("still_holding", 0),
+                    "sold": result.get("sold", 0),
+                }
+            )
 
-        return CheckResultResponse(**result)
+            return CheckResultResponse(**result)
     except Exception as e:
         log_error(f"Error during position check: {e}")
         raise HTTPException(status_code=500, detail=str(e))
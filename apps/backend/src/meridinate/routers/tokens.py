@@ -22,6 +22,7 @@ from meridinate import analyzed_tokens_db as db
 from meridinate import settings
 from meridinate.settings import CURRENT_INGEST_SETTINGS
 from meridinate.cache import ResponseCache
+from meridinate.services.wallet_cache import invalidate_multi_token_wallets_cache
 from meridinate.utils.models import (
     AnalysisHistory,
     MessageResponse,
@@ -450,7 +451,7 @@ def compute_token_signal_labels(token_id: int) -> List[str]:
 
     except Exception:
         # Signal labels are best-effort; don't break token listing on DB errors
-        log_error("compute_token_signal_labels", f"Failed for token_id={token_id}")
+        log_error(f"[compute_token_signal_labels] Failed for token_id={token_id}", exc_info=True)
 
     return labels
 
@@ -550,7 +551,7 @@ def compute_token_signal_labels_batch(token_ids: List[int]) -> Dict[int, List[st
                 result[tid] = tid_labels
 
     except Exception:
-        log_error("compute_token_signal_labels_batch", f"Failed for {len(token_ids)} tokens")
+        log_error(f"[compute_token_signal_labels_batch] Failed for {len(token_ids)} tokens", exc_info=True)
 
     return result
 
@@ -698,13 +699,13 @@ async def get_tokens_history(
             cursor = await conn.execute(query, params + [limit, offset])
             rows = await cursor.fetchall()
 
-            # Fetch all token tags in one query
+            # Get token IDs for tag lookup and position aggregation
+            token_ids = [row["id"] for row in rows]
+
+            # Fetch all token tags in one query (constant SQL, ids bound as a JSON array)
             tag_cursor = await conn.execute(
-                "SELECT token_id, tag FROM token_tags WHERE token_id IN ({})".format(
-                    ",".join(str(dict(row)["id"]) for row in rows)
-                )
-                if rows
-                else "SELECT token_id, tag FROM token_tags WHERE 0=1"
+                "SELECT token_id, tag FROM token_tags WHERE token_id IN (SELECT value FROM json_each(?))",
+                (json.dumps(token_ids),),
             )
             tag_rows = await tag_cursor.fetchall()
 
@@ -717,9 +718,6 @@ async def get_tokens_history(
                     tags_by_token[token_id] = []
                 tags_by_token[token_id].append(tag)
 
-            # Get token IDs for position aggregation
-            token_ids = [dict(row)["id"] for row in rows]
-
             # Fetch position aggregates and Tier 2 signal labels in parallel threads
             swab_aggregates, signal_labels_map = await asyncio.gather(
                 asyncio.to_thread(db.get_swab_aggregates_by_token, token_ids),
@@ -1265,9 +1263,9 @@ async def update_verdict(token_id: int, request: Request, data: UpdateVerdictReq
         await conn.execute("UPDATE analyzed_tokens SET gem_status = NULL WHERE id = ?", (token_id,))
         await conn.commit()
 
-    # Invalidate both tokens cache and multi-token wallets cache
+    # Invalidate both tokens cache and multi-token wallets cache (owned by the wallets router)
     cache.invalidate("tokens_history")
-    cache.invalidate("multi_early_buyer_wallets")
+    invalidate_multi_token_wallets_cache()
 
     status_msg = "cleared" if verdict is None else f"set to {verdict}"
     return {"message": f"Token verdict {status_msg}"}
@@ -1356,7 +1354,7 @@ async def add_token_tag(token_id: int, request: Request, data: TokenTagRequest):
 
     # Invalidate caches
     cache.invalidate("tokens_history")
-    cache.invalidate("multi_early_buyer_wallets")
+    invalidate_multi_token_wallets_cache()
 
     return {"message": f"Tag '{tag}' added successfully"}
 
@@ -1376,7 +1374,7 @@ async def remove_token_tag(token_id: int, request: Request, data: TokenTagReques
 
     # Invalidate caches
     cache.invalidate("tokens_history")
-    cache.invalidate("multi_early_buyer_wallets")
+    invalidate_multi_token_wallets_cache()
 
     return {"message": f"Tag '{tag}' removed successfully"}
 
@@ -1657,25 +1655,25 @@ async def get_token_performance(
             token_address, limit=limit, since_hours=since_hours
         )
 
-        # Convert snapshots to response models
-        snapshot_responses = []
-        for snap in snapshots:
-            snapshot_responses.append(
-                PerformanceSnapshotResponse(
-                    id=snap["id"],
-                    token_address=snap["token_address"],
-                    captured_at=snap["captured_at"],
-                    price_usd=snap.get("price_usd"),
-                    mc_usd=snap.get("mc_usd"),
-                    volume_24h_usd=snap.get("volume_24h_usd"),
-                    liquidity_usd=snap.get("liquidity_usd"),
-                    holder_count=snap.get("holder_count"),
-                    top_holder_share=snap.get("top_holder_share"),
-                    our_positions_pnl_usd=snap.get("our_positions_pnl_usd"),
-                    lp_locked=bool(snap.get("lp_locked")) if snap.get("lp_locked") is not None else None,
-                    ingest_tier_snapshot=snap.get("ingest_tier_snapshot"),
-                )
+        # Convert snapshots to response models. Rows come straight from our own
+        # DB, so skip per-field validation with model_construct().
+        snapshot_responses = [
+            PerformanceSnapshotResponse.model_construct(
+                id=snap["id"],
+                token_address=snap["token_address"],
+                captured_at=snap["captured_at"],
+                price_usd=snap.get("price_usd"),
+                mc_usd=snap.get("mc_usd"),
+                volume_24h_usd=snap.get("volume_24h_usd"),
+                liquidity_usd=snap.get("liquidity_usd"),
+                holder_count=snap.get("holder_count"),
+                top_holder_share=snap.get("top_holder_share"),
+                our_positions_pnl_usd=snap.get("our_positions_pnl_usd"),
+                lp_locked=bool(snap["lp_locked"]) if snap.get("lp_locked") is not None else None,
+                ingest_tier_snapshot=snap.get("ingest_tier_snapshot"),
             )
+            for snap in snapshots
+        ]
 
         return TokenPerformanceResponse(
             token_address=token_address,
@@ -5,10 +5,13 @@ Provides REST endpoints for wallet operations
 """
 
 import asyncio
+import hashlib
 from datetime import datetime, timezone
+from functools import lru_cache
 
-import aiosqlite
-from fastapi import APIRouter, Body, HTTPException, Request
+import orjson
+from fastapi import APIRouter, Body, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 
 from meridinate.middleware.rate_limit import READ_RATE_LIMIT, WALLET_BALANCE_RATE_LIMIT, conditional_rate_limit
 
@@ -16,12 +19,27 @@ from meridinate import settings
 from meridinate import analyzed_tokens_db as db
 from meridinate.cache import ResponseCache
 from meridinate.credit_tracker import credit_tracker, CreditOperation
+from meridinate.db_pool import get_db_pool
+from meridinate.services.wallet_cache import (
+    invalidate_multi_token_wallets_cache,
+    multi_token_wallets_cache,
+    multi_token_wallets_cache_key,
+)
 from meridinate.utils.models import MultiTokenWalletsResponse, RefreshBalancesRequest, RefreshBalancesResponse
 import json
 
 router = APIRouter()
 cache = ResponseCache()
 
+MULTI_TOKEN_WALLETS_FETCH_SIZE = 1000
+
+# Balance refresh fan-out: cap in-flight Helius Wallet API calls across all
+# requests so a large refresh can't burst Helius into 429s.
+WALLET_REFRESH_CONCURRENCY = 16
+WALLET_REFRESH_MAX_ATTEMPTS = 3
+WALLET_REFRESH_BACKOFF_SECONDS = 1.0
+_wallet_refresh_semaphore = asyncio.Semaphore(WALLET_REFRESH_CONCURRENCY)
+
 # Freshness tiers: (max_hours, tag_label)
 # Order matters — tightest tier first, only one tag assigned per wallet
 FRESHNESS_TIERS = [
@@ -35,6 +53,18 @@ FRESHNESS_TIERS = [
 FRESHNESS_TAGS = [label for _, label in FRESHNESS_TIERS]
 
 
+@lru_cache(maxsize=1024)
+def _parse_top_holders(top_holders_json: str) -> list:
+    """
+    Parse a top_holders_json blob with orjson, memoized on the blob itself.
+
+    Unchanged tokens are parsed once and the list is shared across requests, so
+    callers must treat the result as read-only. A rewritten blob is a new key,
+    so refreshed holders are never served stale.
+    """
+    return orjson.loads(top_holders_json)
+
+
 def _compute_freshness_tags(enrichment_results: list):
     """
     Compute freshness tags for wallets based on wallet creation date vs
@@ -59,18 +89,18 @@ def _compute_freshness_tags(enrichment_results: list):
         return
 
     # Query earliest token appearance for these wallets
-    addresses = list(wallet_dates.keys())
+    # Addresses are bound as one JSON array so the SQL text is constant and the
+    # connection's prepared-statement cache is reused across calls
     with db.get_db_connection() as conn:
         cursor = conn.cursor()
-        placeholders = ",".join("?" for _ in addresses)
-        cursor.execute(f"""
+        cursor.execute("""
             SELECT ebw.wallet_address, MIN(t.analysis_timestamp) as earliest_token
             FROM early_buyer_wallets ebw
             JOIN analyzed_tokens t ON ebw.token_id = t.id
-            WHERE ebw.wallet_address IN ({placeholders})
+            WHERE ebw.wallet_address IN (SELECT value FROM json_each(?))
             AND t.deleted_at IS NULL
             GROUP BY ebw.wallet_address
-        """, addresses)
+        """, (json.dumps(list(wallet_dates)),))
         rows = cursor.fetchall()
 
     # Compute freshness and assign tags
@@ -126,16 +156,39 @@ def _compute_freshness_tags(enrichment_results: list):
 @router.get("/multi-token-wallets", response_model=MultiTokenWalletsResponse)
 @conditional_rate_limit(READ_RATE_LIMIT)
 async def get_multi_early_buyer_wallets(request: Request, min_tokens: int = 2):
-    """Get wallets that appear in multiple tokens"""
-    cache_key = f"multi_early_buyer_wallets_{min_tokens}"
-    cached_data, _ = cache.get(cache_key)
-    if cached_data:
-        return cached_data
+    """
+    Get wallets that appear in multiple tokens
 
-    async with aiosqlite.connect(settings.DATABASE_FILE) as conn:
-        conn.row_factory = aiosqlite.Row
+    Rows are built to match MultiTokenWalletsResponse already, so the payload is
+    returned as an ORJSONResponse directly; response_model stays for the OpenAPI
+    schema but is not re-validated/re-encoded per request.
+    """
+    cache_key = multi_token_wallets_cache_key(min_tokens)
+    # Badge polling re-sends the last ETag; skip the body when nothing changed
+    if_none_match = request.headers.get("if-none-match")
+    cached_data, cached_etag = multi_token_wallets_cache.get(cache_key)
+    if cached_data:
+        if if_none_match and if_none_match == cached_etag:
+            return Response(status_code=304, headers={"ETag": cached_etag})
+        return ORJSONResponse(cached_data, headers={"ETag": cached_etag})
+
+    async with get_db_pool().read() as conn:
+        # Per-token lists (including each token's verdict and win:* multiplier) are
+        # aggregated with json_group_array in one pass, so they stay aligned without
+        # a second query, and each row needs one orjson.loads per list instead of
+        # CSV splitting and int() conversion in Python.
         query = """
-            WITH distinct_wallet_tokens AS (
+            WITH token_verdicts AS (
+                SELECT
+                    token_id,
+                    MAX(CASE WHEN tag = 'verified-win' THEN 1 END) as is_win,
+                    MAX(CASE WHEN tag = 'verified-loss' THEN 1 END) as is_loss,
+                    MIN(CASE WHEN tag LIKE 'win:%' THEN tag END) as win_multiplier
+                FROM token_tags
+                WHERE tag IN ('verified-win', 'verified-loss') OR tag LIKE 'win:%'
+                GROUP BY token_id
+            ),
+            distinct_wallet_tokens AS (
                 SELECT DISTINCT
                     tw.wallet_address,
                     tw.token_id,
@@ -144,18 +197,26 @@ async def get_multi_early_buyer_wallets(request: Request, min_tokens: int = 2):
                     t.token_address,
                     tw.wallet_balance_usd,
                     tw.wallet_balance_usd_previous,
-                    tw.wallet_balance_updated_at
+                    tw.wallet_balance_updated_at,
+                    CASE
+                        WHEN tv.is_win THEN 'verified-win'
+                        WHEN tv.is_loss THEN 'verified-loss'
+                    END as verdict,
+                    tv.win_multiplier
                 FROM early_buyer_wallets tw
                 JOIN analyzed_tokens t ON tw.token_id = t.id
+                LEFT JOIN token_verdicts tv ON tv.token_id = t.id
                 WHERE t.deleted_at IS NULL
                 ORDER BY t.id DESC
             )
             SELECT
                 dwt.wallet_address,
                 COUNT(DISTINCT dwt.token_id) as token_count,
-                GROUP_CONCAT(dwt.token_name) as token_names,
-                GROUP_CONCAT(dwt.token_address) as token_addresses,
-                GROUP_CONCAT(dwt.token_table_id) as token_ids,
+                json_group_array(COALESCE(dwt.token_name, '')) as token_names_json,
+                json_group_array(dwt.token_address) as token_addresses_json,
+                json_group_array(dwt.token_table_id) as token_ids_json,
+                json_group_array(dwt.verdict) as verdicts_json,
+                json_group_array(dwt.win_multiplier) as win_multipliers_json,
                 MAX(dwt.wallet_balance_usd) as wallet_balance_usd,
                 MAX(dwt.wallet_balance_usd_previous) as wallet_balance_usd_previous,
                 MAX(dwt.wallet_balance_updated_at) as wallet_balance_updated_at,
@@ -168,65 +229,30 @@ async def get_multi_early_buyer_wallets(request: Request, min_tokens: int = 2):
             ORDER BY token_count DESC, wallet_balance_usd DESC
         """
         cursor = await conn.execute(query, (min_tokens,))
-        rows = await cursor.fetchall()
-
-        # Fetch all token tags for tokens that appear in the results
-        all_token_ids = set()
-        for row in rows:
-            wallet_dict = dict(row)
-            token_ids_str = wallet_dict.get("token_ids", "")
-            if token_ids_str:
-                all_token_ids.update([int(id) for id in token_ids_str.split(",")])
-
-        # Fetch tags for all tokens at once
-        tags_by_token = {}
-        if all_token_ids:
-            tags_query = "SELECT token_id, tag FROM token_tags WHERE token_id IN ({})".format(
-                ",".join(str(tid) for tid in all_token_ids)
-            )
-            tag_cursor = await conn.execute(tags_query)
-            tag_rows = await tag_cursor.fetchall()
-            for tag_row in tag_rows:
-                token_id, tag = tag_row[0], tag_row[1]
-                if token_id not in tags_by_token:
-                    tags_by_token[token_id] = []
-                tags_by_token[token_id].append(tag)
 
+        # Convert in fixed-size batches so raw rows and their JSON list strings are
+        # dropped as we go instead of being held alongside the finished dicts
         wallets = []
-        for row in rows:
-            wallet_dict = dict(row)
-            wallet_dict["token_names"] = wallet_dict["token_names"].split(",") if wallet_dict["token_names"] else []
-            wallet_dict["token_addresses"] = (
-                wallet_dict["token_addresses"].split(",") if wallet_dict["token_addresses"] else []
-            )
-            token_ids = [int(id) for id in wallet_dict["token_ids"].split(",") if wallet_dict["token_ids"]]
-            wallet_dict["token_ids"] = token_ids
-
-            # Build verdicts and win multipliers from token tags
-            verdicts = []
-            win_multipliers = []
-            for token_id in token_ids:
-                tags = tags_by_token.get(token_id, [])
-                if "verified-win" in tags:
-                    verdicts.append("verified-win")
-                elif "verified-loss" in tags:
-                    verdicts.append("verified-loss")
-                else:
-                    verdicts.append(None)
-                # Find win:* multiplier tag if present
-                mult = next((t for t in tags if t.startswith("win:")), None)
-                win_multipliers.append(mult)
-            wallet_dict["verdicts"] = verdicts
-            wallet_dict["win_multipliers"] = win_multipliers
-
-            # Convert is_new from integer (0/1) to boolean
-            wallet_dict["is_new"] = bool(wallet_dict["is_new"])
-            # SQLite returns timestamps as strings; pass through for client consumption
-            wallets.append(wallet_dict)
+        while rows := await cursor.fetchmany(MULTI_TOKEN_WALLETS_FETCH_SIZE):
+            for row in rows:
+                wallet_dict = dict(row)
+                wallet_dict["token_names"] = orjson.loads(wallet_dict.pop("token_names_json"))
+                wallet_dict["token_addresses"] = orjson.loads(wallet_dict.pop("token_addresses_json"))
+                wallet_dict["token_ids"] = orjson.loads(wallet_dict.pop("token_ids_json"))
+                wallet_dict["verdicts"] = orjson.loads(wallet_dict.pop("verdicts_json"))
+                wallet_dict["win_multipliers"] = orjson.loads(wallet_dict.pop("win_multipliers_json"))
+
+                # Convert is_new from integer (0/1) to boolean
+                wallet_dict["is_new"] = bool(wallet_dict["is_new"])
+                # SQLite returns timestamps as strings; pass through for client consumption
+                wallets.append(wallet_dict)
 
         result = {"total": len(wallets), "wallets": wallets}
-        cache.set(cache_key, result)
-        return result
+        etag = multi_token_wallets_cache.set(cache_key, result)
+        # The ETag hashes the payload, so a recompute after expiry can still match
+        if if_none_match and if_none_match == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return ORJSONResponse(result, headers={"ETag": etag})
 
 
 @router.post("/wallets/refresh-balances", response_model=RefreshBalancesResponse)
@@ -243,24 +269,17 @@ async def refresh_wallet_balances(request: Request, data: RefreshBalancesRequest
 
     helius = HeliusAPI(settings.HELIUS_API_KEY)
 
-    # Capture existing balances for comparison
-    existing_balances = {}
-    async with aiosqlite.connect(settings.DATABASE_FILE) as conn:
-        placeholders = ",".join("?" for _ in wallet_addresses)
-        if placeholders:
-            cursor = await conn.execute(
-                f"SELECT wallet_address, wallet_balance_usd FROM early_buyer_wallets WHERE wallet_address IN ({placeholders})",
-                wallet_addresses,
-            )
-            for row in await cursor.fetchall():
-                existing_balances[row[0]] = row[1]
-
     async def fetch_balance(wallet_address: str):
         try:
-            loop = asyncio.get_event_loop()
-            balances_data, credits = await loop.run_in_executor(
-                None, lambda: helius.get_wallet_balances(wallet_address)
-            )
+            for attempt in range(WALLET_REFRESH_MAX_ATTEMPTS):
+                async with _wallet_refresh_semaphore:
+                    balances_data, credits = await helius.get_wallet_balances_async(wallet_address)
+                # get_wallet_balances_async reports transport errors as (None, 0); an API-level
+                # error (e.g. 404) is billed and final, so only the former is retried
+                if balances_data is not None or credits > 0:
+                    break
+                if attempt < WALLET_REFRESH_MAX_ATTEMPTS - 1:
+                    await asyncio.sleep(WALLET_REFRESH_BACKOFF_SECONDS * 2**attempt)
 
             if balances_data is not None:
                 total_usd = balances_data.get("totalUsdValue", 0.0)
@@ -278,29 +297,55 @@ async def refresh_wallet_balances(request: Request, data: RefreshBalancesRequest
     # Fetch all balances concurrently
     results = await asyncio.gather(*[fetch_balance(addr) for addr in wallet_addresses])
 
-    # Update database with previous/current values and timestamp
+    # Update database with previous/current values and timestamp. Address lists are
+    # bound as one JSON array (constant statement text, no variable limit), and the
+    # previous balance echoed back comes from RETURNING rather than a pre-fetch.
     timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
-    async with aiosqlite.connect(settings.DATABASE_FILE) as conn:
-        for result in results:
-            if result["success"] and result["balance_usd"] is not None:
-                await conn.execute(
-                    """
-                    UPDATE early_buyer_wallets
-                    SET wallet_balance_usd_previous = wallet_balance_usd,
-                        wallet_balance_usd = ?,
-                        wallet_balance_updated_at = ?
-                    WHERE wallet_address = ?
-                    """,
-                    (result["balance_usd"], timestamp, result["wallet_address"]),
-                )
-                result["previous_balance_usd"] = existing_balances.get(result["wallet_address"])
-                result["updated_at"] = timestamp
-            else:
-                result["previous_balance_usd"] = existing_balances.get(result["wallet_address"])
-                result["updated_at"] = None
-        await conn.commit()
+    refreshed = []
+    failed = []
+    for result in results:
+        if result["success"] and result["balance_usd"] is not None:
+            refreshed.append((result["wallet_address"], result["balance_usd"]))
+            result["updated_at"] = timestamp
+        else:
+            failed.append(result["wallet_address"])
+            result["updated_at"] = None
+
+    previous_balances = {}
+    async with get_db_pool().write() as conn:
+        if refreshed:
+            # One UPDATE ... FROM json_each for the whole batch: a single statement,
+            # a single hop to the aiosqlite worker thread and a single WAL commit
+            cursor = await conn.execute(
+                """
+                UPDATE early_buyer_wallets
+                SET wallet_balance_usd_previous = wallet_balance_usd,
+                    wallet_balance_usd = json_extract(refreshed.value, '$[1]'),
+                    wallet_balance_updated_at = ?
+                FROM json_each(?) AS refreshed
+                WHERE early_buyer_wallets.wallet_address = json_extract(refreshed.value, '$[0]')
+                RETURNING early_buyer_wallets.wallet_address, early_buyer_wallets.wallet_balance_usd_previous
+                """,
+                (timestamp, json.dumps(refreshed)),
+            )
+            for row in await cursor.fetchall():
+                previous_balances[row[0]] = row[1]
+        if failed:
+            # Failed refreshes still report the balance we already had
+            cursor = await conn.execute(
+                """
+                SELECT wallet_address, wallet_balance_usd FROM early_buyer_wallets
+                WHERE wallet_address IN (SELECT value FROM json_each(?))
+                """,
+                (json.dumps(failed),),
+            )
+            for row in await cursor.fetchall():
+                previous_balances[row[0]] = row[1]
 
-    cache.invalidate("multi_early_buyer_wallets")
+    for result in results:
+        result["previous_balance_usd"] = previous_balances.get(result["wallet_address"])
+
+    invalidate_multi_token_wallets_cache()
 
     successful = sum(1 for r in results if r["success"])
     total_credits = sum(r.get("credits", 0) for r in results)
@@ -351,62 +396,49 @@ async def get_wallet_top_holder_tokens(request: Request, wallet_address: str):
     cache_key = f"wallet_top_holder_tokens_{wallet_address}"
     cached_data, _ = cache.get(cache_key)
     if cached_data:
-        return cached_data
+        return ORJSONResponse(cached_data)
 
-    async with aiosqlite.connect(settings.DATABASE_FILE) as conn:
-        conn.row_factory = aiosqlite.Row
-
-        # Get all tokens where top_holders_json is not NULL and deleted_at is NULL
+    async with get_db_pool().read() as conn:
+        # token_top_holders is the indexed (wallet -> token, rank) copy of
+        # top_holders_json, so only the matching tokens' blobs are fetched
         query = """
             SELECT
-                id,
-                token_name,
-                token_symbol,
-                token_address,
-                top_holders_json,
-                top_holders_updated_at
-            FROM analyzed_tokens
-            WHERE top_holders_json IS NOT NULL
-              AND deleted_at IS NULL
+                t.id,
+                t.token_name,
+                t.token_symbol,
+                t.token_address,
+                t.top_holders_json,
+                t.top_holders_updated_at,
+                tth.rank
+            FROM token_top_holders tth
+            JOIN analyzed_tokens t ON t.id = tth.token_id
+            WHERE tth.wallet_address = ?
+              AND t.deleted_at IS NULL
+            ORDER BY t.id
         """
-        cursor = await conn.execute(query)
+        cursor = await conn.execute(query, (wallet_address,))
         rows = await cursor.fetchall()
 
         top_holder_tokens = []
 
         for row in rows:
-            row_dict = dict(row)
-            top_holders_json = row_dict.get("top_holders_json")
-
-            if not top_holders_json:
-                continue
-
             try:
-                holders = json.loads(top_holders_json)
-
-                # Check if wallet_address is in the top holders list
-                wallet_rank = None
-                for idx, holder in enumerate(holders):
-                    if holder.get("address") == wallet_address:
-                        wallet_rank = idx + 1  # 1-indexed
-                        break
-
-                if wallet_rank is not None:
-                    # This wallet is a top holder of this token
-                    top_holder_tokens.append({
-                        "token_id": row_dict["id"],
-                        "token_name": row_dict["token_name"],
-                        "token_symbol": row_dict["token_symbol"],
-                        "token_address": row_dict["token_address"],
-                        "top_holders": holders,
-                        "top_holders_limit": len(holders),  # The actual number of holders stored
-                        "wallet_rank": wallet_rank,
-                        "last_updated": row_dict["top_holders_updated_at"]
-                    })
-            except (json.JSONDecodeError, KeyError, TypeError):
+                holders = _parse_top_holders(row["top_holders_json"])
+            except (orjson.JSONDecodeError, TypeError):
                 # Skip tokens with malformed data
                 continue
 
+            top_holder_tokens.append({
+                "token_id": row["id"],
+                "token_name": row["token_name"],
+                "token_symbol": row["token_symbol"],
+                "token_address": row["token_address"],
+                "top_holders": holders,
+                "top_holders_limit": len(holders),  # The actual number of holders stored
+                "wallet_rank": row["rank"],
+                "last_updated": row["top_holders_updated_at"]
+            })
+
         result = {
             "wallet_address": wallet_address,
             "total_tokens": len(top_holder_tokens),
@@ -416,7 +448,8 @@ async def get_wallet_top_holder_tokens(request: Request, wallet_address: str):
         # Cache with default TTL (30s) - must match batch-top-holder-counts TTL
         # to prevent badge/modal desync when top_holders_json is updated
         cache.set(cache_key, result)
-        return result
+        # Plain dicts/lists straight to orjson (skips jsonable_encoder over large holder lists)
+        return ORJSONResponse(result)
 
 
 @router.post("/wallets/batch-top-holder-counts")
@@ -432,47 +465,38 @@ async def get_batch_top_holder_counts(request: Request, wallet_addresses: list[s
     Request body: {"wallet_addresses": ["addr1", "addr2", ...]}
     Returns: {"counts": {"addr1": 3, "addr2": 5, ...}}
     """
-    cache_key = f"batch_top_holder_counts_{hash(tuple(sorted(wallet_addresses)))}"
+    # Sort once; the key is a content hash so it is stable across restarts and
+    # workers (built-in hash() of strings is randomized per process)
+    addresses = sorted(set(wallet_addresses))
+    digest = hashlib.blake2b("\n".join(addresses).encode(), digest_size=16).hexdigest()
+    cache_key = f"batch_top_holder_counts_{digest}"
     cached_data, _ = cache.get(cache_key)
     if cached_data:
-        return cached_data
-
-    counts = {}
-
-    async with aiosqlite.connect(settings.DATABASE_FILE) as conn:
-        # Get all tokens where top_holders_json is not NULL
-        query = """
-            SELECT top_holders_json
-            FROM analyzed_tokens
-            WHERE top_holders_json IS NOT NULL
-              AND deleted_at IS NULL
-        """
-        cursor = await conn.execute(query)
-        rows = await cursor.fetchall()
-
-        # Build a count map for each wallet address
-        for wallet_address in wallet_addresses:
-            count = 0
-            for row in rows:
-                top_holders_json = row[0]
-                if not top_holders_json:
-                    continue
+        return ORJSONResponse(cached_data)
 
-                try:
-                    holders = json.loads(top_holders_json)
-                    # Check if wallet_address is in this token's holders
-                    if any(holder.get("address") == wallet_address for holder in holders):
-                        count += 1
-                except (json.JSONDecodeError, KeyError, TypeError):
-                    continue
+    counts = {wallet_address: 0 for wallet_address in addresses}
 
-            counts[wallet_address] = count
+    async with get_db_pool().read() as conn:
+        # Indexed count per wallet from token_top_holders (no JSON parsing)
+        cursor = await conn.execute(
+            """
+            SELECT tth.wallet_address, COUNT(*)
+            FROM token_top_holders tth
+            JOIN analyzed_tokens t ON t.id = tth.token_id
+            WHERE tth.wallet_address IN (SELECT value FROM json_each(?))
+              AND t.deleted_at IS NULL
+            GROUP BY tth.wallet_address
+            """,
+            (json.dumps(addresses),),
+        )
+        for row in await cursor.fetchall():
+            counts[row[0]] = row[1]
 
     result = {"counts": counts}
 
     # Cache result (ResponseCache uses default 30s TTL)
     cache.set(cache_key, result)
-    return result
+    return ORJSONResponse(result)
 
 
 # ============================================================================
@@ -488,9 +512,7 @@ async def get_cached_wallet_intel(request: Request):
     and wallet_tags — no API calls, instant response. Used to populate the Intel
     column on the Wallet Intel page without re-running Enrich Wallets.
     """
-    async with aiosqlite.connect(settings.DATABASE_FILE) as conn:
-        conn.row_factory = aiosqlite.Row
-
+    async with get_db_pool().read() as conn:
         # Get funded-by data from enrichment cache
         cursor = await conn.execute("""
             SELECT wallet_address, funded_by_json, identity_json
@@ -574,7 +596,7 @@ async def get_wallet_funded_by(request: Request, wallet_address: str):
     from meridinate.helius_api import HeliusAPI
     helius = HeliusAPI(settings.HELIUS_API_KEY)
 
-    funded_by, credits = await asyncio.get_event_loop().run_in_executor(
+    funded_by, credits = await asyncio.get_running_loop().run_in_executor(
         None, lambda: helius.get_wallet_funded_by(wallet_address)
     )
 
@@ -601,9 +623,12 @@ async def get_batch_funded_by(request: Request, wallet_addresses: list[str] = Bo
     from meridinate.helius_api import HeliusAPI
     helius = HeliusAPI(settings.HELIUS_API_KEY)
 
-    async def fetch_funded_by(addr: str):
+    # Resolve the loop once for the whole fan-out instead of per wallet
+    loop = asyncio.get_running_loop()
+
+    async def fetch_funded_by(addr: str, loop=loop):
         try:
-            result, credits = await asyncio.get_event_loop().run_in_executor(
+            result, credits = await loop.run_in_executor(
                 None, lambda: helius.get_wallet_funded_by(addr)
             )
             return {
@@ -711,7 +736,7 @@ async def funding_terminal_batch(
     traced_results: dict[str, dict] = {}
     total_credits = 0
     if to_trace:
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
 
         def _do_traces() -> tuple[dict[str, dict], int]:
             out: dict[str, dict] = {}
@@ -766,7 +791,7 @@ async def trace_wallet_funding(
     """
     from meridinate.services.funding_tracer import trace_batch_funding_chains
 
-    result = await asyncio.get_event_loop().run_in_executor(
+    result = await asyncio.get_running_loop().run_in_executor(
         None,
         lambda: trace_batch_funding_chains(
             wallet_addresses, settings.HELIUS_API_KEY, max_hops, stop_at_exchanges
@@ -842,7 +867,7 @@ async def get_batch_wallet_identities(request: Request, wallet_addresses: list[s
     from meridinate.helius_api import HeliusAPI
     helius = HeliusAPI(settings.HELIUS_API_KEY)
 
-    identities, credits = await asyncio.get_event_loop().run_in_executor(
+    identities, credits = await asyncio.get_running_loop().run_in_executor(
         None, lambda: helius.get_batch_wallet_identities(wallet_addresses)
     )
 
@@ -946,7 +971,7 @@ async def get_wallet_transfers(
     from meridinate.helius_api import HeliusAPI
     helius = HeliusAPI(settings.HELIUS_API_KEY)
 
-    transfers, credits = await asyncio.get_event_loop().run_in_executor(
+    transfers, credits = await asyncio.get_running_loop().run_in_executor(
         None, lambda: helius.get_wallet_transfers(wallet_address, limit=limit, cursor=cursor)
     )
 
@@ -970,9 +995,7 @@ async def get_wallet_intelligence(wallet_address: str, request: Request):
     """
     import json as _json
 
-    async with aiosqlite.connect(settings.DATABASE_FILE) as conn:
-        conn.row_factory = aiosqlite.Row
-
+    async with get_db_pool().read() as conn:
         # === PROFILE ===
         # Wallet tags
         cursor = await conn.execute(
@@ -1068,15 +1091,18 @@ async def get_wallet_intelligence(wallet_address: str, request: Request):
         worst_trade = min(real_positions, key=lambda p: p.get("realized_pnl") or 0) if real_positions else None
 
         # === VERDICTS + TIERS on tokens this wallet bought ===
-        token_ids = [b["token_id"] for b in early_buys]
         verdicts = {}
         win_multipliers = {}
         loss_tiers = {}
-        if token_ids:
-            placeholders = ",".join("?" for _ in token_ids)
+        if early_buys:
+            # Token set comes from a subquery rather than an IN-list built from early_buys
             cursor = await conn.execute(
-                f"SELECT token_id, tag FROM token_tags WHERE token_id IN ({placeholders}) AND (tag IN ('verified-win', 'verified-loss') OR tag LIKE 'win:%' OR tag LIKE 'loss:%')",
-                token_ids
+                """
+                SELECT token_id, tag FROM token_tags
+                WHERE token_id IN (SELECT token_id FROM early_buyer_wallets WHERE wallet_address = ?)
+                  AND (tag IN ('verified-win', 'verified-loss') OR tag LIKE 'win:%' OR tag LIKE 'loss:%')
+                """,
+                (wallet_address,),
             )
             for r in await cursor.fetchall():
                 tag = r["tag"]
@@ -1200,8 +1226,7 @@ async def get_deployer_profile(deployer_address: str, request: Request):
     Get all tokens deployed by a wallet, with their verdicts and performance.
     No API calls — reads directly from the database.
     """
-    async with aiosqlite.connect(settings.DATABASE_FILE) as conn:
-        conn.row_factory = aiosqlite.Row
+    async with get_db_pool().read() as conn:
         cursor = await conn.execute("""
             SELECT t.id, t.token_address, t.token_name, t.token_symbol,
                    t.analysis_timestamp, t.market_cap_usd, t.market_cap_usd_current,
@@ -1214,16 +1239,18 @@ async def get_deployer_profile(deployer_address: str, request: Request):
         """, (deployer_address,))
         tokens = [dict(r) for r in await cursor.fetchall()]
 
-    wins = sum(1 for t in tokens if t["verdict"] == "verified-win")
-    losses = sum(1 for t in tokens if t["verdict"] == "verified-loss")
-    total_with_verdict = wins + losses
-
-    # Compute avg ATH multiple for winning tokens
+    # Tally verdicts and ATH multiples for winning tokens in a single pass
+    wins = losses = 0
     ath_multiples = []
     for t in tokens:
-        if t["verdict"] == "verified-win" and t["market_cap_usd"] and t["market_cap_ath"]:
-            if t["market_cap_usd"] > 0:
+        verdict = t["verdict"]
+        if verdict == "verified-win":
+            wins += 1
+            if t["market_cap_usd"] and t["market_cap_ath"] and t["market_cap_usd"] > 0:
                 ath_multiples.append(t["market_cap_ath"] / t["market_cap_usd"])
+        elif verdict == "verified-loss":
+            losses += 1
+    total_with_verdict = wins + losses
 
     return {
         "deployer_address": deployer_address,
@@ -1277,7 +1304,7 @@ async def compute_batch_pnl(request: Request, limit: int = 20):
     from meridinate.credit_tracker import get_credit_tracker
 
     # Get top wallets by token count, prioritizing those without full coverage
-    async with aiosqlite.connect(settings.DATABASE_FILE) as conn:
+    async with get_db_pool().read() as conn:
         cursor = await conn.execute("""
             SELECT ebw.wallet_address, COUNT(DISTINCT ebw.token_id) as token_count
             FROM early_buyer_wallets ebw
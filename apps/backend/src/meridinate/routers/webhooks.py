@@ -17,35 +17,91 @@ of the recent signature window, ensuring accurate PnL calculations.
 
 import asyncio
 from datetime import datetime
+from functools import partial
 from typing import Optional
 
+import orjson
 from fastapi import APIRouter, HTTPException, Request
 
 from meridinate import analyzed_tokens_db as db
+from meridinate.cache import ResponseCache
 from meridinate.observability import log_error, log_info
 from meridinate.settings import HELIUS_API_KEY, API_BASE_URL
-from meridinate.state import WEBHOOK_EXECUTOR
+from meridinate.state import run_db
 from meridinate.utils.models import CreateWebhookRequest
-from meridinate.helius_api import WebhookManager, HeliusAPI
+from meridinate.helius_api import get_shared_helius, get_webhook_manager
 
 router = APIRouter()
 
+# settings.HELIUS_API_KEY is fixed at import, so resolve availability once
+HELIUS_ENABLED = bool(HELIUS_API_KEY)
+
+# Caps concurrent outbound Helius webhook admin calls (create/delete)
+WEBHOOK_ADMIN_CONCURRENCY = 16
+_webhook_admin_semaphore = asyncio.Semaphore(WEBHOOK_ADMIN_CONCURRENCY)
+
+# Active SWAB wallet list (a DISTINCT scan of mtew_token_positions) for webhook
+# creation; short TTL, and dropped whenever a callback buy/sell changes positions
+SWAB_WALLETS_CACHE_KEY = "active_swab_wallets"
+_swab_wallets_cache = ResponseCache(ttl=5, name="swab_wallets", maxsize=1)
+
+# Token transfers smaller than this never reach a position lookup or price fetch.
+# Same threshold _process_swab_sell treats as a zero balance; the scheduled
+# position check reconciles any balance drift left by skipped dust.
+DUST_TOKEN_AMOUNT = 0.001
+
+# Strong references to queued admin tasks so they aren't garbage-collected mid-flight
+_webhook_tasks: set[asyncio.Task] = set()
+
 
 def _require_helius():
-    if not HELIUS_API_KEY:
+    if not HELIUS_ENABLED:
         raise HTTPException(status_code=503, detail="Helius API not available")
 
 
-async def _run_webhook_task(func):
-    loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(WEBHOOK_EXECUTOR, func)
+def _queue_webhook_task(coro, error_prefix: str):
+    """Run a Helius webhook admin coroutine in the background, logging failures."""
+
+    async def run():
+        async with _webhook_admin_semaphore:
+            return await coro
+
+    task = asyncio.create_task(run())
+    _webhook_tasks.add(task)
+
+    def done(t: asyncio.Task):
+        _webhook_tasks.discard(t)
+        if not t.cancelled() and t.exception() is not None:
+            log_error(f"{error_prefix}: {t.exception()}")
+
+    task.add_done_callback(done)
+    return task
+
+
+def _dexscreener_quote(quotes: dict, token_mint: str) -> asyncio.Future:
+    """
+    (price, market cap) for a mint, looked up at most once per callback payload.
+
+    quotes maps mint -> in-flight/finished lookup; misses (None) are memoized
+    too, so a rate-limited mint isn't re-requested for every transfer.
+    """
+    quote = quotes.get(token_mint)
+    if quote is None:
+        helius = get_shared_helius(HELIUS_API_KEY)
+        quote = quotes[token_mint] = asyncio.ensure_future(
+            asyncio.gather(
+                helius.aget_token_price_from_dexscreener(token_mint),
+                helius.aget_market_cap_from_dexscreener(token_mint),
+            )
+        )
+    return quote
 
 
 @router.post("/webhooks/create", status_code=202)
 async def create_webhook(payload: CreateWebhookRequest):
     """Create a Helius webhook for monitoring token wallets"""
     _require_helius()
-    token_details = db.get_token_details(payload.token_id)
+    token_details = await run_db(db.get_token_details, payload.token_id)
     if not token_details:
         raise HTTPException(status_code=404, detail="Token not found")
 
@@ -56,20 +112,14 @@ async def create_webhook(payload: CreateWebhookRequest):
     wallet_addresses = [w["wallet_address"] for w in wallets]
     callback_url = payload.webhook_url or f"{API_BASE_URL}/webhooks/callback"
 
-    def worker():
-        try:
-            manager = WebhookManager(HELIUS_API_KEY)
-            result = manager.create_webhook(
-                webhook_url=callback_url, wallet_addresses=wallet_addresses, transaction_types=["TRANSFER", "SWAP"]
-            )
-            webhook_id = result.get("webhookID")
-            log_info(f"[Webhook] Created webhook {webhook_id} for token {payload.token_id}")
-            return result
-        except Exception as exc:
-            log_error(f"[Webhook] Error creating webhook: {exc}")
-            return None
+    async def create():
+        result = await get_webhook_manager(HELIUS_API_KEY).acreate_webhook(
+            webhook_url=callback_url, wallet_addresses=wallet_addresses, transaction_types=["TRANSFER", "SWAP"]
+        )
+        log_info(f"[Webhook] Created webhook {result.get('webhookID')} for token {payload.token_id}")
+        return result
 
-    WEBHOOK_EXECUTOR.submit(worker)
+    _queue_webhook_task(create(), "[Webhook] Error creating webhook")
 
     return {
         "status": "queued",
@@ -84,12 +134,8 @@ async def list_webhooks():
     """List all webhooks for this API key"""
     _require_helius()
 
-    def worker():
-        manager = WebhookManager(HELIUS_API_KEY)
-        return manager.list_webhooks()
-
     try:
-        webhooks = await _run_webhook_task(worker)
+        webhooks = await get_webhook_manager(HELIUS_API_KEY).alist_webhooks()
         return {"total": len(webhooks), "webhooks": webhooks}
     except Exception as exc:
         log_error(f"[Webhook] Error listing webhooks: {exc}")
@@ -101,11 +147,7 @@ async def get_webhook_details(webhook_id: str):
     """Get details of a specific webhook"""
     _require_helius()
 
-    def worker():
-        manager = WebhookManager(HELIUS_API_KEY)
-        return manager.get_webhook(webhook_id)
-
-    webhook = await _run_webhook_task(worker)
+    webhook = await get_webhook_manager(HELIUS_API_KEY).aget_webhook(webhook_id)
     if not webhook:
         raise HTTPException(status_code=404, detail="Webhook not found")
     return webhook
@@ -116,12 +158,11 @@ async def delete_webhook(webhook_id: str):
     """Delete a webhook"""
     _require_helius()
 
-    def worker():
-        manager = WebhookManager(HELIUS_API_KEY)
-        manager.delete_webhook(webhook_id)
+    async def delete():
+        await get_webhook_manager(HELIUS_API_KEY).adelete_webhook(webhook_id)
         log_info(f"[Webhook] Deleted webhook {webhook_id}")
 
-    WEBHOOK_EXECUTOR.submit(worker)
+    _queue_webhook_task(delete(), f"[Webhook] Error deleting webhook {webhook_id}")
     return {"status": "queued", "message": f"Webhook {webhook_id} deletion queued"}
 
 
@@ -146,7 +187,10 @@ async def create_swab_webhook(request: Request):
     _require_helius()
 
     # Get all active tracked wallets
-    wallet_addresses = db.get_active_swab_wallets()
+    wallet_addresses, _ = _swab_wallets_cache.get(SWAB_WALLETS_CACHE_KEY)
+    if wallet_addresses is None:
+        wallet_addresses = await run_db(db.get_active_swab_wallets)
+        _swab_wallets_cache.set(SWAB_WALLETS_CACHE_KEY, wallet_addresses)
 
     if not wallet_addresses:
         raise HTTPException(
@@ -161,25 +205,19 @@ async def create_swab_webhook(request: Request):
     except Exception:
         callback_url = f"{API_BASE_URL}/webhooks/callback"
 
-    def worker():
-        try:
-            manager = WebhookManager(HELIUS_API_KEY)
-            result = manager.create_webhook(
-                webhook_url=callback_url,
-                wallet_addresses=wallet_addresses,
-                transaction_types=["TRANSFER", "SWAP"]
-            )
-            webhook_id = result.get("webhookID")
-            log_info(
-                f"[Webhook] Created webhook {webhook_id} "
-                f"monitoring {len(wallet_addresses)} tracked wallets"
-            )
-            return result
-        except Exception as exc:
-            log_error(f"[Webhook] Error creating webhook: {exc}")
-            return None
+    async def create():
+        result = await get_webhook_manager(HELIUS_API_KEY).acreate_webhook(
+            webhook_url=callback_url,
+            wallet_addresses=wallet_addresses,
+            transaction_types=["TRANSFER", "SWAP"]
+        )
+        log_info(
+            f"[Webhook] Created webhook {result.get('webhookID')} "
+            f"monitoring {len(wallet_addresses)} tracked wallets"
+        )
+        return result
 
-    WEBHOOK_EXECUTOR.submit(worker)
+    _queue_webhook_task(create(), "[Webhook] Error creating webhook")
 
     return {
         "status": "queued",
@@ -190,11 +228,12 @@ async def create_swab_webhook(request: Request):
     }
 
 
-def _process_swab_buy(
+async def _process_swab_buy(
     wallet_address: str,
     token_mint: str,
     tokens_bought: float,
     signature: str,
+    quotes: Optional[dict] = None,
 ) -> Optional[str]:
     """
     Process a potential position buy (DCA or re-entry) detected via webhook.
@@ -207,12 +246,13 @@ def _process_swab_buy(
         token_mint: Token mint address
         tokens_bought: Number of tokens received
         signature: Transaction signature for logging
+        quotes: Per-payload DexScreener quotes shared between transfers
 
     Returns:
         Result message or None if not a tracked position
     """
     # Look up if this wallet has ANY position for this token (including sold)
-    position = db.get_position_by_token_address(wallet_address, token_mint)
+    position = await run_db(db.get_position_by_token_address, wallet_address, token_mint)
     if not position:
         return None  # Not a tracked position
 
@@ -223,8 +263,7 @@ def _process_swab_buy(
 
     # Get current token price from DexScreener
     try:
-        helius = HeliusAPI(HELIUS_API_KEY)
-        token_price = helius.get_token_price_from_dexscreener(token_mint)
+        token_price, _ = await _dexscreener_quote({} if quotes is None else quotes, token_mint)
     except Exception as e:
         log_error(f"[Webhook] Failed to get price for {token_symbol}: {e}")
         token_price = None
@@ -242,7 +281,8 @@ def _process_swab_buy(
 
     # Record the buy with accurate real-time price data
     try:
-        success = db.record_position_buy(
+        success = await run_db(
+            db.record_position_buy,
             wallet_address=wallet_address,
             token_id=token_id,
             tokens_bought=tokens_bought,
@@ -252,6 +292,7 @@ def _process_swab_buy(
         )
 
         if success:
+            _swab_wallets_cache.invalidate(SWAB_WALLETS_CACHE_KEY)
             buy_type = "RE-ENTRY" if not was_holding else "DCA"
             log_info(
                 f"[Webhook] {buy_type} {wallet_address[:8]}... "
@@ -268,11 +309,12 @@ def _process_swab_buy(
         return None
 
 
-def _process_swab_sell(
+async def _process_swab_sell(
     wallet_address: str,
     token_mint: str,
     tokens_sold: float,
     signature: str,
+    quotes: Optional[dict] = None,
 ) -> Optional[str]:
     """
     Process a potential position sell detected via webhook.
@@ -285,12 +327,13 @@ def _process_swab_sell(
         token_mint: Token mint address
         tokens_sold: Number of tokens transferred out
         signature: Transaction signature for logging
+        quotes: Per-payload DexScreener quotes shared between transfers
 
     Returns:
         Result message or None if not a tracked position
     """
     # Look up if this wallet has an active position for this token
-    position = db.get_active_position_by_token_address(wallet_address, token_mint)
+    position = await run_db(db.get_active_position_by_token_address, wallet_address, token_mint)
     if not position:
         return None  # Not a tracked position
 
@@ -304,9 +347,7 @@ def _process_swab_sell(
 
     # Get current token price from DexScreener (real-time, this is the exit price!)
     try:
-        helius = HeliusAPI(HELIUS_API_KEY)
-        token_price = helius.get_token_price_from_dexscreener(token_mint)
-        current_mc = helius.get_market_cap_from_dexscreener(token_mint)
+        token_price, current_mc = await _dexscreener_quote({} if quotes is None else quotes, token_mint)
     except Exception as e:
         log_error(f"[Webhook] Failed to get price for {token_symbol}: {e}")
         token_price = None
@@ -330,7 +371,8 @@ def _process_swab_sell(
 
     # Record the sell with accurate real-time price data
     try:
-        success = db.record_position_sell(
+        success = await run_db(
+            db.record_position_sell,
             wallet_address=wallet_address,
             token_id=token_id,
             tokens_sold=tokens_sold,
@@ -344,6 +386,7 @@ def _process_swab_sell(
         )
 
         if success:
+            _swab_wallets_cache.invalidate(SWAB_WALLETS_CACHE_KEY)
             exit_type = "FULL EXIT" if is_full_exit else "PARTIAL SELL"
             # Calculate PnL for logging
             pnl_str = ""
@@ -367,6 +410,15 @@ def _process_swab_sell(
         return None
 
 
+async def _apply_position_updates(updates: list) -> int:
+    """Run one (wallet, mint) group of SWAB updates in order; returns how many applied."""
+    applied = 0
+    for update in updates:
+        if await update():
+            applied += 1
+    return applied
+
+
 @router.post("/webhooks/callback")
 async def webhook_callback(request: Request):
     """
@@ -381,12 +433,18 @@ async def webhook_callback(request: Request):
     scroll out of the recent signature window.
     """
     try:
-        payload = await request.json()
-    except Exception:
+        payload = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
         raise HTTPException(status_code=400, detail="Invalid JSON payload")
 
     transactions = payload if isinstance(payload, list) else [payload]
-    swab_updates = 0
+
+    # Position updates grouped by (wallet, mint): each group is applied in payload
+    # order (every update reads the balance the previous one wrote), while
+    # independent groups run concurrently so the DexScreener round-trips overlap
+    position_updates: dict[tuple[str, str], list] = {}
+    activities: list[dict] = []
+    quotes: dict[str, asyncio.Future] = {}
 
     for tx in transactions:
         signature = tx.get("signature", "")
@@ -396,66 +454,85 @@ async def webhook_callback(request: Request):
         native_transfers = tx.get("nativeTransfers", [])
         token_transfers = tx.get("tokenTransfers", [])
 
-        # Process token transfers for position updates
+        # Queue token transfers for position updates
         for transfer in token_transfers:
             from_wallet = transfer.get("fromUserAccount")
             to_wallet = transfer.get("toUserAccount")
             token_mint = transfer.get("mint")
             token_amount = float(transfer.get("tokenAmount", 0))
 
-            if not token_mint or token_amount <= 0:
+            if not token_mint or token_amount < DUST_TOKEN_AMOUNT:
                 continue
 
             # If wallet is sending tokens (potential sell), check positions
             if from_wallet:
-                result = _process_swab_sell(
-                    wallet_address=from_wallet,
-                    token_mint=token_mint,
-                    tokens_sold=token_amount,
-                    signature=signature,
+                position_updates.setdefault((from_wallet, token_mint), []).append(
+                    partial(
+                        _process_swab_sell,
+                        wallet_address=from_wallet,
+                        token_mint=token_mint,
+                        tokens_sold=token_amount,
+                        signature=signature,
+                        quotes=quotes,
+                    )
                 )
-                if result:
-                    swab_updates += 1
 
             # If wallet is receiving tokens (potential buy/DCA), check positions
             if to_wallet:
-                result = _process_swab_buy(
-                    wallet_address=to_wallet,
-                    token_mint=token_mint,
-                    tokens_bought=token_amount,
-                    signature=signature,
+                position_updates.setdefault((to_wallet, token_mint), []).append(
+                    partial(
+                        _process_swab_buy,
+                        wallet_address=to_wallet,
+                        token_mint=token_mint,
+                        tokens_bought=token_amount,
+                        signature=signature,
+                        quotes=quotes,
+                    )
                 )
-                if result:
-                    swab_updates += 1
 
-        # Save all transfers to wallet_activity (existing behavior)
-        for transfer in native_transfers + token_transfers:
-            wallet_address = transfer.get("fromUserAccount") or transfer.get("toUserAccount")
-            if not wallet_address:
-                continue
-
-            if transfer in native_transfers:
-                sol_amount = transfer.get("amount", 0) / 1e9
-                token_amount = 0.0
-                recipient = transfer.get("toUserAccount")
-            else:
-                sol_amount = 0.0
-                token_amount = float(transfer.get("tokenAmount", 0))
-                recipient = transfer.get("toUserAccount")
-
-            try:
-                db.save_wallet_activity(
-                    wallet_address=wallet_address,
-                    transaction_signature=signature,
-                    timestamp=datetime.utcfromtimestamp(timestamp).isoformat() if timestamp else None,
-                    activity_type=tx_type,
-                    description=description,
-                    sol_amount=sol_amount,
-                    token_amount=token_amount,
-                    recipient_address=recipient,
+        # Collect all transfers for wallet_activity (existing behavior)
+        activity_timestamp = datetime.utcfromtimestamp(timestamp).isoformat() if timestamp else None
+        for is_native, transfers in ((True, native_transfers), (False, token_transfers)):
+            for transfer in transfers:
+                wallet_address = transfer.get("fromUserAccount") or transfer.get("toUserAccount")
+                if not wallet_address:
+                    continue
+
+                activities.append(
+                    {
+                        "wallet_address": wallet_address,
+                        "transaction_signature": signature,
+                        "timestamp": activity_timestamp,
+                        "activity_type": tx_type,
+                        "description": description,
+                        "sol_amount": transfer.get("amount", 0) / 1e9 if is_native else 0.0,
+                        "token_amount": 0.0 if is_native else float(transfer.get("tokenAmount", 0)),
+                        "recipient_address": transfer.get("toUserAccount"),
+                    }
                 )
-            except Exception as exc:
-                log_error(f"[Webhook] Failed to save activity: {exc}")
+
+    # One transaction for the whole payload instead of a connection + commit per transfer
+    try:
+        await run_db(db.save_wallet_activities_bulk, activities)
+    except Exception as exc:
+        log_error(f"[Webhook] Failed to save activity: {exc}")
+
+    # Most transfers involve counterparties/pools with no position; drop them with
+    # one query rather than a position lookup per transfer
+    if position_updates:
+        tracked = await run_db(db.get_position_keys_for_wallets, {wallet for wallet, _ in position_updates})
+        position_updates = {key: updates for key, updates in position_updates.items() if key in tracked}
+
+    results = await asyncio.gather(
+        *(_apply_position_updates(updates) for updates in position_updates.values()),
+        return_exceptions=True,
+    )
+    swab_updates = 0
+    for result in results:
+        if isinstance(result, BaseException):
+            log_error(f"[Webhook] Position update failed: {result}")
+        else:
+            swab_updates += result
 
     return {
         "status": "success",
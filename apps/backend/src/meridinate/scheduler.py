@@ -9,40 +9,112 @@ Uses APScheduler with asyncio support.
 """
 
 import asyncio
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
 from meridinate import analyzed_tokens_db as db
+from meridinate.cache import ResponseCache
+from meridinate.credit_tracker import get_credit_tracker
 from meridinate.observability import log_error, log_info
+from meridinate.services.leaderboard_cache import rebuild_leaderboard_cache
+from meridinate.settings import CURRENT_INGEST_SETTINGS
+from meridinate.state import run_db
+from meridinate.tasks.ingest_tasks import run_auto_scan
+from meridinate.tasks.mc_tracker import run_mc_tracker
+from meridinate.tasks.position_tracker import check_mtew_positions
 
 # Global scheduler instance
 _scheduler: Optional[AsyncIOScheduler] = None
+_scheduler_lock = threading.Lock()
 _check_job_id = "swab_position_check"
 _tier0_job_id = "ingest_tier0"
 # _tier1_job_id removed — Tier-1 enrichment is fully deprecated
 _hot_refresh_job_id = "ingest_hot_refresh"
 
-# Track currently running jobs: job_id -> started_at timestamp
-_running_jobs: Dict[str, datetime] = {}
+# Display names for the status endpoints, in dashboard order
+_JOB_NAMES = MappingProxyType({
+    _check_job_id: "Position Check",
+    _tier0_job_id: "Auto-Scan",
+    _hot_refresh_job_id: "MC Tracker",
+})
+
+# Rendered next_run_time strings: a job's next run only changes when it fires or is
+# rescheduled, but the status endpoints render it on every poll (isoformat on a
+# zoneinfo-aware datetime costs ~1µs vs ~50ns for the lookup)
+_ISO_CACHE_MAX = 32
+_iso_cache: Dict[datetime, str] = {}
+
+
+def _iso(dt: datetime) -> str:
+    iso = _iso_cache.get(dt)
+    if iso is None:
+        if len(_iso_cache) >= _ISO_CACHE_MAX:
+            _iso_cache.clear()
+        iso = _iso_cache[dt] = dt.isoformat()
+    return iso
+
+
+class JobStatus(NamedTuple):
+    """One row of get_all_scheduled_jobs()."""
+
+    id: str
+    name: str
+    enabled: bool
+    next_run_at: Optional[str]  # None if not scheduled or paused
+    interval_minutes: int
+    paused: bool = False
+
+
+# Track currently running jobs: job_id -> (monotonic start, started_at ISO string).
+# The ISO string is formatted once at start; elapsed time comes from the monotonic
+# clock so it is cheap to compute and immune to wall-clock jumps.
+_running_jobs: Dict[str, Tuple[float, str]] = {}
 
 # Credits per position check (getTokenAccountsByOwner = 1 credit standard RPC)
 CREDITS_PER_POSITION_CHECK = 1
 MAX_POSITIONS_PER_CHECK = 50
 
+# Defaults for every job: one instance at a time, missed runs collapse into one,
+# and a run may start up to 30s late (e.g. after a long blocking call) instead of
+# APScheduler's 1s before it is dropped
+SCHEDULER_JOB_DEFAULTS = {"coalesce": True, "max_instances": 1, "misfire_grace_time": 30}
 
-def mark_job_started(job_id: str) -> None:
-    """Mark a job as currently running."""
-    global _running_jobs
-    _running_jobs[job_id] = datetime.now()
+# Seconds a position check may start late before APScheduler drops the run
+POSITION_CHECK_MISFIRE_GRACE_SECONDS = 60
 
+# MC Tracker tick; the tracker itself decides which tokens are due (age-decay)
+MC_TRACKER_INTERVAL_MINUTES = 2
 
-def mark_job_finished(job_id: str) -> None:
-    """Mark a job as no longer running."""
-    global _running_jobs
-    _running_jobs.pop(job_id, None)
+# Auto-Scan polls adaptively: an empty run doubles its interval, a run that fills the
+# per-run quota halves it, anything in between returns to the configured interval.
+# Bounds widen to include the configured interval if it lies outside them.
+AUTO_SCAN_MIN_INTERVAL_MINUTES = 10
+AUTO_SCAN_MAX_INTERVAL_MINUTES = 240
+
+# Position tracker settings for get_all_scheduled_jobs, which the dashboard status
+# bar polls every few seconds; dropped whenever the settings are updated
+_status_settings_cache = ResponseCache(ttl=1, name="scheduler_status_settings", maxsize=1)
+
+# Held for the duration of a position check (scheduled or manual) so two checks
+# never spend credits on the same stale positions concurrently
+position_check_lock = asyncio.Lock()
+
+
+@contextmanager
+def _job_running(job_id: str):
+    """Mark a job as running for the duration of the block."""
+    _running_jobs[job_id] = (time.monotonic(), datetime.now().isoformat())
+    try:
+        yield
+    finally:
+        _running_jobs.pop(job_id, None)
 
 
 def get_running_jobs() -> list:
@@ -54,22 +126,16 @@ def get_running_jobs() -> list:
     """
     global _running_jobs
 
-    job_names = {
-        _check_job_id: "Position Check",
-        _tier0_job_id: "Auto-Scan",
-        _hot_refresh_job_id: "MC Tracker",
-    }
-
     running = []
-    now = datetime.now()
+    now = time.monotonic()
 
-    for job_id, started_at in _running_jobs.items():
-        elapsed = (now - started_at).total_seconds()
+    # Snapshot first: jobs may start/finish while the status endpoint iterates
+    for job_id, (started, started_at) in list(_running_jobs.items()):
         running.append({
             "id": job_id,
-            "name": job_names.get(job_id, job_id),
-            "started_at": started_at.isoformat(),
-            "elapsed_seconds": int(elapsed),
+            "name": _JOB_NAMES.get(job_id, job_id),
+            "started_at": started_at,
+            "elapsed_seconds": int(now - started),
         })
 
     return running
@@ -78,84 +144,149 @@ def get_running_jobs() -> list:
 def get_scheduler() -> AsyncIOScheduler:
     """Get or create the global scheduler instance."""
     global _scheduler
-    if _scheduler is None:
-        _scheduler = AsyncIOScheduler()
-    return _scheduler
-
-
-async def swab_position_check_job():
+    scheduler = _scheduler
+    if scheduler is not None:
+        return scheduler
+    # Double-checked so concurrent first callers can't each build a scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = AsyncIOScheduler(job_defaults=SCHEDULER_JOB_DEFAULTS)
+        return _scheduler
+
+
+class _JobSpec(NamedTuple):
+    """How one interval job is configured from a settings dict."""
+
+    job_id: str
+    name: str
+    func: Callable
+    enabled_key: Optional[str]  # settings flag; None = always enabled
+    interval_key: Optional[str]  # settings key for the interval; None = always default_minutes
+    default_minutes: int
+    log_label: str
+    misfire_grace_time: Optional[int] = None  # None = SCHEDULER_JOB_DEFAULTS
+    jitter_seconds: Optional[int] = None  # random per-fire offset so jobs don't fire in lockstep
+
+
+def _sync_job(scheduler: AsyncIOScheduler, spec: _JobSpec, settings: dict) -> None:
     """
-    Scheduled job to check positions.
+    Bring one job in line with settings, touching the jobstore only on a real change.
 
-    Respects position tracker settings for:
-    - auto_check_enabled
-    - stale_threshold_minutes
-    - daily_credit_budget
+    A disabled job is removed and a newly enabled one added; an existing job is left
+    alone if its interval is unchanged, otherwise its trigger is swapped in place.
+    A paused job stays paused.
     """
-    from meridinate.tasks.position_tracker import check_mtew_positions
+    existing = scheduler.get_job(spec.job_id)
 
-    try:
-        # Get current position tracker settings
-        settings = db.get_swab_settings()
-
-        # Check if auto-check is enabled
-        if not settings["auto_check_enabled"]:
-            log_info("Position auto-check disabled, skipping scheduled check")
-            return
+    if spec.enabled_key is not None and not settings.get(spec.enabled_key):
+        if existing:
+            scheduler.remove_job(spec.job_id)
+        log_info(f"{spec.log_label} scheduler disabled")
+        return
 
-        # Check daily credit budget
-        credits_remaining = settings["daily_credit_budget"] - settings["credits_used_today"]
-        if credits_remaining <= 0:
-            log_info("Position daily credit budget exhausted, skipping scheduled check")
-            return
+    interval = settings.get(spec.interval_key, spec.default_minutes) if spec.interval_key else spec.default_minutes
+    trigger = IntervalTrigger(minutes=interval, jitter=spec.jitter_seconds)
 
-        # Calculate max positions to check based on remaining budget
-        max_positions = min(MAX_POSITIONS_PER_CHECK, credits_remaining // CREDITS_PER_POSITION_CHECK)
-        if max_positions <= 0:
-            log_info("Position insufficient credits for position check")
-            return
+    if existing is None:
+        job_kwargs = {}
+        if spec.misfire_grace_time is not None:
+            job_kwargs["misfire_grace_time"] = spec.misfire_grace_time
+        scheduler.add_job(
+            spec.func,
+            trigger=trigger,
+            id=spec.job_id,
+            name=spec.name,
+            replace_existing=True,
+            **job_kwargs,
+        )
+        log_info(f"{spec.log_label} scheduler: every {interval} minutes")
+        return
 
-        mark_job_started(_check_job_id)
+    if existing.trigger.interval == trigger.interval:
+        return
 
-        log_info(
-            f"Position scheduled check starting: max_positions={max_positions}, "
-            f"credits_remaining={credits_remaining}"
-        )
+    if existing.next_run_time is None:
+        # reschedule_job() would compute a next run time and so resume the job
+        scheduler.modify_job(spec.job_id, trigger=trigger)
+        log_info(f"{spec.log_label} scheduler: every {interval} minutes (still PAUSED)")
+    else:
+        scheduler.reschedule_job(spec.job_id, trigger=trigger)
+        log_info(f"{spec.log_label} scheduler: every {interval} minutes")
 
-        # Run the position check
-        result = await check_mtew_positions(
-            older_than_minutes=settings["stale_threshold_minutes"],
-            max_positions=max_positions,
-            max_credits=credits_remaining,
-        )
 
-        # Update position tracker credits used
-        db.update_swab_last_check(credits_used=result.get("credits_used", 0))
+async def swab_position_check_job():
+    """
+    Scheduled job to check positions.
 
-        log_info(
-            f"Position scheduled check complete: "
-            f"{result['positions_checked']} checked, "
-            f"{result['still_holding']} holding, "
-            f"{result['sold']} sold, "
-            f"{result['credits_used']} credits used"
-        )
+    Respects position tracker settings for:
+    - auto_check_enabled
+    - stale_threshold_minutes
+    - daily_credit_budget
+    """
+    # A manual check is in progress; this tick is coalesced into it
+    if position_check_lock.locked():
+        log_info("Position check already running, skipping scheduled check")
+        return
 
-        # Rebuild leaderboard cache after position data changes
+    async with position_check_lock:
         try:
-            from meridinate.services.leaderboard_cache import rebuild_leaderboard_cache
-            rebuild_leaderboard_cache()
-        except Exception as cache_err:
-            log_error(f"Leaderboard cache rebuild failed after position check: {cache_err}")
-
-    except Exception as e:
-        log_error(f"Position scheduled check failed: {e}")
-        from meridinate.credit_tracker import get_credit_tracker
-        get_credit_tracker().record_operation(
-            operation="position_check", label="Position Check",
-            credits=0, call_count=0, context={"error": str(e)},
-        )
-    finally:
-        mark_job_finished(_check_job_id)
+            # Get current position tracker settings
+            settings = await run_db(db.get_swab_settings)
+
+            # Check if auto-check is enabled
+            if not settings["auto_check_enabled"]:
+                log_info("Position auto-check disabled, skipping scheduled check")
+                return
+
+            # Check daily credit budget
+            credits_remaining = settings["daily_credit_budget"] - settings["credits_used_today"]
+            if credits_remaining <= 0:
+                log_info("Position daily credit budget exhausted, skipping scheduled check")
+                return
+
+            # Calculate max positions to check based on remaining budget
+            max_positions = min(MAX_POSITIONS_PER_CHECK, credits_remaining // CREDITS_PER_POSITION_CHECK)
+            if max_positions <= 0:
+                log_info("Position insufficient credits for position check")
+                return
+
+            with _job_running(_check_job_id):
+                log_info(
+                    "Position scheduled check starting: max_positions=%s, credits_remaining=%s",
+                    max_positions,
+                    credits_remaining,
+                )
+
+                # Run the position check
+                result = await check_mtew_positions(
+                    older_than_minutes=settings["stale_threshold_minutes"],
+                    max_positions=max_positions,
+                    max_credits=credits_remaining,
+                )
+
+                # Update position tracker credits used
+                await run_db(db.update_swab_last_check, credits_used=result.get("credits_used", 0))
+
+                log_info(
+                    "Position scheduled check complete: %s checked, %s holding, %s sold, %s credits used",
+                    result["positions_checked"],
+                    result["still_holding"],
+                    result["sold"],
+                    result["credits_used"],
+                )
+
+                # Rebuild leaderboard cache after position data changes
+                try:
+                    await run_db(rebuild_leaderboard_cache)
+                except Exception as cache_err:
+                    log_error(f"Leaderboard cache rebuild failed after position check: {cache_err}")
+
+        except Exception as e:
+            log_error(f"Position scheduled check failed: {e}")
+            get_credit_tracker().queue_operation(
+                operation="position_check", label="Position Check",
+                credits=0, call_count=0, context={"error": str(e)},
+            )
 
 
 def update_scheduler_interval():
@@ -166,37 +297,12 @@ def update_scheduler_interval():
     """
     global _scheduler
 
+    _status_settings_cache.invalidate("swab_settings")
+
     if _scheduler is None:
         return
 
-    settings = db.get_swab_settings()
-
-    # Preserve pause state across reschedule
-    was_paused = False
-    existing = _scheduler.get_job(_check_job_id)
-    if existing:
-        was_paused = existing.next_run_time is None
-        _scheduler.remove_job(_check_job_id)
-
-    # Only add job if auto-check is enabled
-    if settings["auto_check_enabled"]:
-        interval_minutes = settings["check_interval_minutes"]
-        _scheduler.add_job(
-            swab_position_check_job,
-            trigger=IntervalTrigger(minutes=interval_minutes),
-            id=_check_job_id,
-            name="Position Check",
-            replace_existing=True,
-            max_instances=1,
-            coalesce=True,
-        )
-        if was_paused:
-            _scheduler.get_job(_check_job_id).pause()
-            log_info(f"Position tracker updated: every {interval_minutes} min (still PAUSED)")
-        else:
-            log_info(f"Position tracker scheduler updated: checking every {interval_minutes} minutes")
-    else:
-        log_info("Position tracker scheduler: auto-check disabled")
+    _sync_job(_scheduler, _POSITION_CHECK_SPEC, db.get_swab_settings())
 
 
 def update_scan_interval():
@@ -205,45 +311,16 @@ def update_scan_interval():
     Call this when scan interval settings are changed.
     """
     global _scheduler
-    from meridinate.settings import CURRENT_INGEST_SETTINGS
 
     if _scheduler is None or not _scheduler.running:
         return
 
-    interval = CURRENT_INGEST_SETTINGS.get("discovery_interval_minutes", 15)
-
-    # Preserve pause state across reschedule
-    was_paused = False
-    existing = _scheduler.get_job(_tier0_job_id)
-    if existing:
-        was_paused = existing.next_run_time is None
-        _scheduler.remove_job(_tier0_job_id)
-
-    enabled = CURRENT_INGEST_SETTINGS.get("discovery_enabled")
-    if enabled:
-        _scheduler.add_job(
-            ingest_tier0_job,
-            trigger=IntervalTrigger(minutes=interval),
-            id=_tier0_job_id,
-            name="Auto-Scan (DexScreener + Helius)",
-            replace_existing=True,
-            max_instances=1,
-            coalesce=True,
-        )
-        # Re-pause if it was paused before the interval change
-        if was_paused:
-            _scheduler.get_job(_tier0_job_id).pause()
-            log_info(f"[Auto-Scan] Interval updated to {interval} min (still PAUSED)")
-        else:
-            log_info(f"[Auto-Scan] Interval updated: every {interval} minutes")
-    else:
-        log_info("[Auto-Scan] Disabled")
+    _sync_job(_scheduler, _AUTO_SCAN_SPEC, CURRENT_INGEST_SETTINGS.copy())
 
 
 def start_scheduler():
     """Start the scheduler with Position Tracker and Ingest jobs."""
     global _scheduler
-    from meridinate.settings import CURRENT_INGEST_SETTINGS
 
     scheduler = get_scheduler()
 
@@ -251,54 +328,12 @@ def start_scheduler():
         log_info("Scheduler already running")
         return
 
-    # Load position tracker settings and configure job
-    settings = db.get_swab_settings()
-
-    if settings["auto_check_enabled"]:
-        interval_minutes = settings["check_interval_minutes"]
-        scheduler.add_job(
-            swab_position_check_job,
-            trigger=IntervalTrigger(minutes=interval_minutes),
-            id=_check_job_id,
-            name="Position Check",
-            replace_existing=True,
-            max_instances=1,
-            coalesce=True,
-        )
-        log_info(f"Position tracker scheduler configured: checking every {interval_minutes} minutes")
-    else:
-        log_info("Position tracker scheduler: auto-check disabled at startup")
-
-    # Configure Auto-Scan job (feature-flagged)
-    if CURRENT_INGEST_SETTINGS.get("discovery_enabled"):
-        tier0_interval = CURRENT_INGEST_SETTINGS.get("discovery_interval_minutes", 15)
-        scheduler.add_job(
-            ingest_tier0_job,
-            trigger=IntervalTrigger(minutes=tier0_interval),
-            id=_tier0_job_id,
-            name="Auto-Scan (DexScreener + Helius)",
-            replace_existing=True,
-            max_instances=1,
-            coalesce=True,
-        )
-        log_info(f"[Ingest] Discovery scheduler enabled: running every {tier0_interval} minutes")
-    else:
-        log_info("[Ingest] Discovery scheduler disabled at startup")
-
+    _sync_job(scheduler, _POSITION_CHECK_SPEC, db.get_swab_settings())
     # Tier-1 enrichment removed — fully deprecated
-
-    # MC Tracker — decay-based polling, runs every 2 minutes
-    # The tracker itself checks which tokens are due based on age-decay intervals
-    scheduler.add_job(
-        mc_tracker_job,
-        trigger=IntervalTrigger(minutes=2),
-        id=_hot_refresh_job_id,
-        name="MC Tracker (decay-based)",
-        replace_existing=True,
-        max_instances=1,
-        coalesce=True,
-    )
-    log_info("[MC Tracker] Decay-based polling enabled: checking every 2 minutes")
+    # One snapshot so every ingest job is configured from the same settings view
+    ingest_settings = CURRENT_INGEST_SETTINGS.copy()
+    for spec in _INGEST_JOB_SPECS:
+        _sync_job(scheduler, spec, ingest_settings)
 
     scheduler.start()
     log_info("Scheduler started")
@@ -330,7 +365,7 @@ def get_scheduler_status() -> dict:
     if _scheduler is not None and _scheduler.running:
         job = _scheduler.get_job(_check_job_id)
         if job and job.next_run_time:
-            status["next_check_at"] = job.next_run_time.isoformat()
+            status["next_check_at"] = _iso(job.next_run_time)
 
     return status
 
@@ -345,34 +380,56 @@ async def ingest_tier0_job():
     Scheduled Auto-Scan job: discovers tokens from DexScreener and
     immediately runs Helius analysis on those passing filters.
     """
-    from meridinate.settings import CURRENT_INGEST_SETTINGS
-    from meridinate.tasks.ingest_tasks import run_auto_scan
-
     try:
         # Check if scanning is enabled
         if not CURRENT_INGEST_SETTINGS.get("discovery_enabled"):
             log_info("[Auto-Scan] Disabled, skipping scheduled run")
             return
 
-        mark_job_started(_tier0_job_id)
-        log_info("[Auto-Scan] Starting scheduled scan")
-
-        result = await run_auto_scan()
+        with _job_running(_tier0_job_id):
+            log_info("[Auto-Scan] Starting scheduled scan")
+            result = await run_auto_scan()
 
         log_info(
-            f"[Auto-Scan] Scheduled run complete: "
-            f"{result['tokens_scanned']} scanned, {result['tokens_filtered']} filtered"
+            "[Auto-Scan] Scheduled run complete: %s scanned, %s filtered",
+            result["tokens_scanned"],
+            result["tokens_filtered"],
         )
+        _adapt_auto_scan_interval(result)
 
     except Exception as e:
         log_error(f"[Auto-Scan] Scheduled run failed: {e}")
-        from meridinate.credit_tracker import get_credit_tracker
-        get_credit_tracker().record_operation(
+        get_credit_tracker().queue_operation(
             operation="auto_scan", label="Auto-Scan",
             credits=0, call_count=0, context={"error": str(e)},
         )
-    finally:
-        mark_job_finished(_tier0_job_id)
+
+
+def _adapt_auto_scan_interval(result: dict) -> None:
+    """Stretch or tighten the Auto-Scan interval based on how many tokens the last run scanned."""
+    job = _scheduler.get_job(_tier0_job_id) if _scheduler is not None else None
+    if job is None or job.next_run_time is None or result["errors"]:
+        return  # removed, paused, or a failed run that says nothing about token flow
+
+    settings = CURRENT_INGEST_SETTINGS
+    base = settings.get("discovery_interval_minutes", 15)
+    quota = settings.get("discovery_max_per_run", settings.get("tier0_max_tokens_per_run", 20))
+    current = int(job.trigger.interval.total_seconds() // 60)
+
+    scanned = result["tokens_scanned"]
+    if scanned == 0:
+        target = current * 2
+    elif scanned >= quota:
+        target = current // 2
+    else:
+        target = base
+    target = max(min(base, AUTO_SCAN_MIN_INTERVAL_MINUTES), min(target, max(base, AUTO_SCAN_MAX_INTERVAL_MINUTES)))
+
+    if target != current:
+        _scheduler.reschedule_job(
+            _tier0_job_id, trigger=IntervalTrigger(minutes=target, jitter=_AUTO_SCAN_SPEC.jitter_seconds)
+        )
+        log_info("[Auto-Scan] %s tokens scanned, next runs every %s minutes", scanned, target)
 
 
 async def mc_tracker_job():
@@ -381,35 +438,65 @@ async def mc_tracker_job():
     The tracker itself determines which tokens are due based on age-decay intervals.
     Runs in a thread to avoid blocking the event loop.
     """
-    import asyncio
     try:
-        mark_job_started(_hot_refresh_job_id)
-        from meridinate.tasks.mc_tracker import run_mc_tracker
-        result = await asyncio.to_thread(run_mc_tracker)
-        log_info(
-            f"[MC Tracker] {result.get('tokens_updated', 0)} updated, "
-            f"{result.get('verdicts_computed', 0)} verdicts"
-        )
-
-        # Rebuild leaderboard cache only if tokens were actually updated
-        if result.get('tokens_updated', 0) > 0 or result.get('verdicts_computed', 0) > 0:
-            try:
-                from meridinate.services.leaderboard_cache import rebuild_leaderboard_cache
-                await asyncio.to_thread(rebuild_leaderboard_cache)
-            except Exception as cache_err:
-                log_error(f"Leaderboard cache rebuild failed after MC tracker: {cache_err}")
+        with _job_running(_hot_refresh_job_id):
+            result = await asyncio.to_thread(run_mc_tracker)
+            log_info(
+                "[MC Tracker] %s updated, %s verdicts",
+                result.get("tokens_updated", 0),
+                result.get("verdicts_computed", 0),
+            )
+
+            # Rebuild leaderboard cache only if tokens were actually updated
+            if result.get('tokens_updated', 0) > 0 or result.get('verdicts_computed', 0) > 0:
+                try:
+                    await asyncio.to_thread(rebuild_leaderboard_cache)
+                except Exception as cache_err:
+                    log_error(f"Leaderboard cache rebuild failed after MC tracker: {cache_err}")
 
     except Exception as e:
         log_error(f"[MC Tracker] Job failed: {e}")
-        from meridinate.credit_tracker import get_credit_tracker
-        get_credit_tracker().record_operation(
+        get_credit_tracker().queue_operation(
             operation="mc_tracker", label="MC Tracker",
             credits=0, call_count=0, context={"error": str(e)},
         )
-    finally:
-        mark_job_finished(_hot_refresh_job_id)
 
 
+# Job specs, defined after the job functions they reference
+_POSITION_CHECK_SPEC = _JobSpec(
+    _check_job_id,
+    "Position Check",
+    swab_position_check_job,
+    enabled_key="auto_check_enabled",
+    interval_key="check_interval_minutes",
+    default_minutes=30,
+    log_label="Position tracker",
+    misfire_grace_time=POSITION_CHECK_MISFIRE_GRACE_SECONDS,
+    jitter_seconds=30,
+)
+_AUTO_SCAN_SPEC = _JobSpec(
+    _tier0_job_id,
+    "Auto-Scan (DexScreener + Helius)",
+    ingest_tier0_job,
+    enabled_key="discovery_enabled",
+    interval_key="discovery_interval_minutes",
+    default_minutes=15,
+    log_label="[Auto-Scan]",
+    jitter_seconds=30,
+)
+_MC_TRACKER_SPEC = _JobSpec(
+    _hot_refresh_job_id,
+    "MC Tracker (decay-based)",
+    mc_tracker_job,
+    enabled_key=None,
+    interval_key=None,
+    default_minutes=MC_TRACKER_INTERVAL_MINUTES,
+    log_label="[MC Tracker]",
+    jitter_seconds=15,
+)
+# Jobs configured from CURRENT_INGEST_SETTINGS
+_INGEST_JOB_SPECS = (_AUTO_SCAN_SPEC, _MC_TRACKER_SPEC)
+
 
 def update_ingest_scheduler():
     """
@@ -418,98 +505,62 @@ def update_ingest_scheduler():
     Call this when ingest settings are updated.
     """
     global _scheduler
-    from meridinate.settings import CURRENT_INGEST_SETTINGS
 
     if _scheduler is None:
         return
 
-    # Preserve pause states across reschedule
-    paused_states = {}
-    for job_id in [_tier0_job_id, _hot_refresh_job_id]:
-        existing = _scheduler.get_job(job_id)
-        if existing:
-            paused_states[job_id] = existing.next_run_time is None
-            _scheduler.remove_job(job_id)
-
-    def _add_and_maybe_pause(job_func, trigger, job_id, name):
-        _scheduler.add_job(job_func, trigger=trigger, id=job_id, name=name, replace_existing=True, max_instances=1, coalesce=True)
-        if paused_states.get(job_id, False):
-            _scheduler.get_job(job_id).pause()
-            log_info(f"[Ingest] {name} updated (still PAUSED)")
-        else:
-            log_info(f"[Ingest] {name} enabled")
-
-    # Add Discovery job if enabled
-    if CURRENT_INGEST_SETTINGS.get("discovery_enabled"):
-        tier0_interval = CURRENT_INGEST_SETTINGS.get("discovery_interval_minutes", 15)
-        _add_and_maybe_pause(ingest_tier0_job, IntervalTrigger(minutes=tier0_interval), _tier0_job_id, f"Auto-Scan (every {tier0_interval} min)")
-    else:
-        log_info("[Ingest] Discovery scheduler disabled")
+    # One snapshot so every ingest job is configured from the same settings view
+    ingest_settings = CURRENT_INGEST_SETTINGS.copy()
+    for spec in _INGEST_JOB_SPECS:
+        _sync_job(_scheduler, spec, ingest_settings)
 
 
-def get_all_scheduled_jobs() -> list:
+def get_all_scheduled_jobs() -> List[JobStatus]:
     """
     Get status of all scheduled jobs with their next run times.
 
     Returns:
-        List of job status dictionaries with id, name, enabled, next_run_at, interval
+        List of JobStatus tuples (id, name, enabled, next_run_at, interval_minutes, paused)
     """
     global _scheduler
-    from meridinate.settings import CURRENT_INGEST_SETTINGS
 
-    jobs = []
-
-    # Position Check
-    swab_settings = db.get_swab_settings()
-    swab_job = {
-        "id": _check_job_id,
-        "name": "Position Check",
-        "enabled": swab_settings["auto_check_enabled"],
-        "next_run_at": None,
-        "interval_minutes": swab_settings["check_interval_minutes"],
-    }
+    # One jobstore pass instead of a get_job() scan per job
+    jobs_by_id = {}
     if _scheduler is not None and _scheduler.running:
-        job = _scheduler.get_job(_check_job_id)
-        if job:
-            if job.next_run_time:
-                swab_job["next_run_at"] = job.next_run_time.isoformat()
-            else:
-                swab_job["paused"] = True
-    jobs.append(swab_job)
-
-    # Auto-Scan
-    tier0_interval = CURRENT_INGEST_SETTINGS.get("discovery_interval_minutes", 15)
-    tier0_job = {
-        "id": _tier0_job_id,
-        "name": "Auto-Scan",
-        "enabled": CURRENT_INGEST_SETTINGS.get("discovery_enabled", False),
-        "next_run_at": None,
-        "interval_minutes": tier0_interval,
-    }
-    if _scheduler is not None and _scheduler.running:
-        job = _scheduler.get_job(_tier0_job_id)
-        if job:
-            if job.next_run_time:
-                tier0_job["next_run_at"] = job.next_run_time.isoformat()
-            else:
-                tier0_job["paused"] = True
-    jobs.append(tier0_job)
-
-    # MC Tracker (always enabled — decay-based polling)
-    hot_refresh_job = {
-        "id": _hot_refresh_job_id,
-        "name": "MC Tracker",
-        "enabled": True,
-        "next_run_at": None,
-        "interval_minutes": 2,
+        jobs_by_id = {job.id: job for job in _scheduler.get_jobs()}
+
+    swab_settings, _ = _status_settings_cache.get("swab_settings")
+    if swab_settings is None:
+        swab_settings = db.get_swab_settings()
+        _status_settings_cache.set("swab_settings", swab_settings)
+
+    ingest_settings = CURRENT_INGEST_SETTINGS.copy()
+
+    # job_id -> (enabled, interval_minutes); MC Tracker is always enabled (decay-based polling)
+    job_config = {
+        _check_job_id: (swab_settings["auto_check_enabled"], swab_settings["check_interval_minutes"]),
+        _tier0_job_id: (
+            ingest_settings.get("discovery_enabled", False),
+            ingest_settings.get("discovery_interval_minutes", 15),
+        ),
+        _hot_refresh_job_id: (True, MC_TRACKER_INTERVAL_MINUTES),
     }
-    if _scheduler is not None and _scheduler.running:
-        job = _scheduler.get_job(_hot_refresh_job_id)
-        if job:
-            if job.next_run_time:
-                hot_refresh_job["next_run_at"] = job.next_run_time.isoformat()
-            else:
-                hot_refresh_job["paused"] = True
-    jobs.append(hot_refresh_job)
+
+    jobs = []
+    for job_id, name in _JOB_NAMES.items():
+        enabled, interval_minutes = job_config[job_id]
+        job = jobs_by_id.get(job_id)
+        next_run_time = job.next_run_time if job else None
+        if job_id == _tier0_job_id and job is not None:
+            # Auto-Scan's live interval drifts from the setting (adaptive polling)
+            interval_minutes = int(job.trigger.interval.total_seconds() // 60)
+        jobs.append(JobStatus(
+            id=job_id,
+            name=name,
+            enabled=enabled,
+            next_run_at=_iso(next_run_time) if next_run_time else None,
+            interval_minutes=interval_minutes,
+            paused=job is not None and next_run_time is None,
+        ))
 
     return jobs
@@ -11,51 +11,201 @@ API Reference:
 - Search: https://api.dexscreener.com/latest/dex/search?q={query}
 """
 
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import random
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 import time
 
+import httpx
+import orjson
 import requests
+from urllib3.util.retry import Retry
 
+from meridinate.http_client import get_async_http_client
 from meridinate.observability import log_error, log_info
 
+# After a 429 every DexScreener caller backs off: for the server's Retry-After when
+# it sends one, otherwise 5s, 10s, 20s, ... per consecutive 429 (capped at 60s) plus
+# up to 1s of jitter. The 429'd request is retried up to RATE_LIMIT_MAX_RETRIES times.
+RATE_LIMIT_BACKOFF_SECONDS = 60
+RATE_LIMIT_BACKOFF_BASE_SECONDS = 5
+RATE_LIMIT_MAX_RETRIES = 2
+
+# Sync session: worker threads (Auto-Scan, MC tracker, follow-ups, ...) share one
+# pool to the single DexScreener host, and transient 5xx errors are retried with
+# backoff. 429s are not retried here; _rate_limited_request backs every caller off.
+SESSION_POOL_MAXSIZE = 20
+SESSION_RETRY = Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504), raise_on_status=False)
+
+# Requests that may go out back-to-back after an idle period (still 60/min on average)
+REQUEST_BURST = 10
+
+# Most token addresses DexScreener accepts in one /tokens/v1 request
+BULK_SNAPSHOT_MAX_ADDRESSES = 30
+
+# How long the ingest path reuses a token snapshot before DexScreener is asked again
+SNAPSHOT_CACHE_TTL_SECONDS = 300
+SNAPSHOT_CACHE_MAXSIZE = 4096
+
+
+class _SnapshotCache:
+    """
+    Thread-safe TTL map of token address -> snapshot for the ingest/discovery path.
+
+    Discovery runs from worker threads and the event loop at once, so every
+    access holds a lock. Entries are kept in insertion order, so the oldest is
+    evicted first once maxsize is reached.
+    """
+
+    def __init__(self, ttl: float, maxsize: int):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, token_address: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(token_address)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[token_address]
+                return None
+            return entry[1]
+
+    def set(self, token_address: str, snapshot: Dict[str, Any]):
+        with self._lock:
+            self._entries.pop(token_address, None)
+            self._entries[token_address] = (time.monotonic() + self.ttl, snapshot)
+            while len(self._entries) > self.maxsize:
+                del self._entries[next(iter(self._entries))]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class _Listing(NamedTuple):
+    """Last parsed profiles/boosts listing with the validators to revalidate it."""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    data: List[Dict[str, Any]]
+
 
 class DexScreenerService:
     """Service for fetching token data from DexScreener API"""
 
     BASE_URL = "https://api.dexscreener.com"
+    HEADERS = {
+        "Accept": "application/json",
+        "User-Agent": "Meridinate/1.0",
+    }
 
     def __init__(self):
         self.session = requests.Session()
-        self.session.headers.update({
-            "Accept": "application/json",
-            "User-Agent": "Meridinate/1.0",
-        })
-        self._last_request_time = 0
-        self._min_request_interval = 1.0  # 1 second between requests to stay under rate limit
-
-    def _rate_limited_request(self, url: str, timeout: int = 15) -> Optional[requests.Response]:
+        self.session.headers.update(self.HEADERS)
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=SESSION_POOL_MAXSIZE, max_retries=SESSION_RETRY
+        )
+        self.session.mount("https://", adapter)
+        self._min_request_interval = 1.0  # 1 request/second on average stays under 60/min
+        # Sync callers (worker threads) and async callers (event loop) share one
+        # request schedule, paced as a token bucket (GCRA): _next_request_at is the
+        # theoretical arrival time, and a request may go out up to _burst_window
+        # ahead of it, so an idle service sends REQUEST_BURST requests back-to-back
+        self._burst_window = (REQUEST_BURST - 1) * self._min_request_interval
+        self._next_request_at = 0.0
+        self._schedule_lock = threading.Lock()
+        self._consecutive_429s = 0
+        # Profiles and boosts overlap, so discovery runs keep asking for the same tokens.
+        # Only the ingest path (use_cache=True) reads or fills this; other callers
+        # (MC tracker, follow-ups, realtime, quick DD) always get live numbers
+        self._snapshot_cache = _SnapshotCache(SNAPSHOT_CACHE_TTL_SECONDS, SNAPSHOT_CACHE_MAXSIZE)
+        # Listing URL -> last listing, revalidated with If-None-Match / If-Modified-Since
+        self._listings: Dict[str, _Listing] = {}
+
+    def _reserve_request_slot(self) -> float:
+        """Reserve the next request slot; returns how long the caller must wait for it."""
+        with self._schedule_lock:
+            now = time.monotonic()
+            arrival = max(now, self._next_request_at)
+            slot = max(now, arrival - self._burst_window)
+            self._next_request_at = arrival + self._min_request_interval
+        return slot - now
+
+    def _back_off(self, retry_after: Optional[str]):
+        """Push every caller's next request out after a 429."""
+        try:
+            delay = max(0.0, float(retry_after))
+        except (TypeError, ValueError):
+            delay = None
+        with self._schedule_lock:
+            if delay is None:
+                backoff = RATE_LIMIT_BACKOFF_BASE_SECONDS * 2 ** self._consecutive_429s
+                delay = min(RATE_LIMIT_BACKOFF_SECONDS, backoff) + random.uniform(0, 1)
+            self._consecutive_429s += 1
+            # No burst once the back-off ends: requests resume at the steady rate
+            self._next_request_at = max(self._next_request_at, time.monotonic() + delay + self._burst_window)
+        log_info("[DexScreener] Rate limit hit (429), backing off %.1fs", delay)
+
+    def _rate_limited_request(
+        self, url: str, timeout: int = 15, headers: Optional[Dict[str, str]] = None
+    ) -> Optional[requests.Response]:
         """Make a rate-limited request to DexScreener API"""
-        # Enforce minimum interval between requests
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self._min_request_interval:
-            time.sleep(self._min_request_interval - elapsed)
+        for _ in range(RATE_LIMIT_MAX_RETRIES + 1):
+            delay = self._reserve_request_slot()
+            if delay > 0:
+                time.sleep(delay)
 
-        try:
-            response = self.session.get(url, timeout=timeout)
-            self._last_request_time = time.time()
+            try:
+                response = self.session.get(url, timeout=timeout, headers=headers)
+
+                if response.status_code == 429:
+                    self._back_off(response.headers.get("Retry-After"))
+                    continue
+
+                if response.status_code != 304:  # Not Modified only answers a conditional request
+                    response.raise_for_status()
+                self._consecutive_429s = 0
+                return response
 
-            if response.status_code == 429:
-                log_info("[DexScreener] Rate limit hit (429), backing off 60s")
-                time.sleep(60)
+            except requests.RequestException as e:
+                log_error(f"[DexScreener] Request failed: {e}")
                 return None
 
-            response.raise_for_status()
-            return response
+        log_error(f"[DexScreener] Still rate limited after {RATE_LIMIT_MAX_RETRIES} retries: {url}")
+        return None
 
-        except requests.RequestException as e:
-            log_error(f"[DexScreener] Request failed: {e}")
-            return None
+    async def _rate_limited_request_async(
+        self, url: str, timeout: int = 15, headers: Optional[Dict[str, str]] = None
+    ) -> Optional[httpx.Response]:
+        """Async counterpart of _rate_limited_request on the shared httpx client."""
+        for _ in range(RATE_LIMIT_MAX_RETRIES + 1):
+            delay = self._reserve_request_slot()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            try:
+                request_headers = {**self.HEADERS, **headers} if headers else self.HEADERS
+                response = await get_async_http_client().get(url, headers=request_headers, timeout=timeout)
+
+                if response.status_code == 429:
+                    self._back_off(response.headers.get("Retry-After"))
+                    continue
+
+                if response.status_code != 304:  # Not Modified only answers a conditional request
+                    response.raise_for_status()
+                self._consecutive_429s = 0
+                return response
+
+            except httpx.HTTPError as e:
+                log_error(f"[DexScreener] Request failed: {e}")
+                return None
+
+        log_error(f"[DexScreener] Still rate limited after {RATE_LIMIT_MAX_RETRIES} retries: {url}")
+        return None
 
     def get_latest_token_profiles(self, chain: str = "solana") -> List[Dict[str, Any]]:
         """
@@ -71,22 +221,53 @@ class DexScreenerService:
             List of token profile dictionaries
         """
         url = f"{self.BASE_URL}/token-profiles/latest/v1"
-        response = self._rate_limited_request(url)
+        response = self._rate_limited_request(url, headers=self._conditional_headers(url))
+        return self._parse_chain_tokens(url, response, chain, "token profiles")
 
+    async def get_latest_token_profiles_async(self, chain: str = "solana") -> List[Dict[str, Any]]:
+        """Async version of get_latest_token_profiles."""
+        url = f"{self.BASE_URL}/token-profiles/latest/v1"
+        response = await self._rate_limited_request_async(url, headers=self._conditional_headers(url))
+        return self._parse_chain_tokens(url, response, chain, "token profiles")
+
+    def _conditional_headers(self, url: str) -> Optional[Dict[str, str]]:
+        """Validators from the last listing fetched from url, if it sent any."""
+        listing = self._listings.get(url)
+        if listing is None:
+            return None
+        headers = {}
+        if listing.etag:
+            headers["If-None-Match"] = listing.etag
+        if listing.last_modified:
+            headers["If-Modified-Since"] = listing.last_modified
+        return headers
+
+    def _parse_chain_tokens(self, url: str, response, chain: str, kind: str) -> List[Dict[str, Any]]:
+        """Parse a profiles/boosts list response (or reuse it on 304), keeping entries for one chain."""
         if not response:
             return []
 
         try:
-            data = response.json()
+            listing = self._listings.get(url)
+            if response.status_code == 304 and listing is not None:
+                data = listing.data
+            else:
+                data = orjson.loads(response.content)
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                if etag or last_modified:
+                    self._listings[url] = _Listing(etag, last_modified, data)
+                else:
+                    self._listings.pop(url, None)
             # Filter for Solana tokens
             solana_tokens = [
                 t for t in data
                 if t.get("chainId") == chain
             ]
-            log_info(f"[DexScreener] Fetched {len(solana_tokens)} {chain} token profiles")
+            log_info(f"[DexScreener] Fetched {len(solana_tokens)} {chain} {kind}")
             return solana_tokens
         except Exception as e:
-            log_error(f"[DexScreener] Failed to parse profiles response: {e}")
+            log_error(f"[DexScreener] Failed to parse {kind} response: {e}")
             return []
 
     def get_latest_boosted_tokens(self, chain: str = "solana") -> List[Dict[str, Any]]:
@@ -103,23 +284,14 @@ class DexScreenerService:
             List of boosted token dictionaries
         """
         url = f"{self.BASE_URL}/token-boosts/latest/v1"
-        response = self._rate_limited_request(url)
-
-        if not response:
-            return []
+        response = self._rate_limited_request(url, headers=self._conditional_headers(url))
+        return self._parse_chain_tokens(url, response, chain, "boosted tokens")
 
-        try:
-            data = response.json()
-            # Filter for Solana tokens
-            solana_tokens = [
-                t for t in data
-                if t.get("chainId") == chain
-            ]
-            log_info(f"[DexScreener] Fetched {len(solana_tokens)} {chain} boosted tokens")
-            return solana_tokens
-        except Exception as e:
-            log_error(f"[DexScreener] Failed to parse boosted response: {e}")
-            return []
+    async def get_latest_boosted_tokens_async(self, chain: str = "solana") -> List[Dict[str, Any]]:
+        """Async version of get_latest_boosted_tokens."""
+        url = f"{self.BASE_URL}/token-boosts/latest/v1"
+        response = await self._rate_limited_request_async(url, headers=self._conditional_headers(url))
+        return self._parse_chain_tokens(url, response, chain, "boosted tokens")
 
     def search_tokens(self, query: str) -> List[Dict[str, Any]]:
         """
@@ -138,7 +310,7 @@ class DexScreenerService:
             return []
 
         try:
-            data = response.json()
+            data = orjson.loads(response.content)
             pairs = data.get("pairs", [])
             # Filter for Solana pairs
             solana_pairs = [
@@ -160,14 +332,21 @@ class DexScreenerService:
         Returns:
             List of pair dictionaries, or None if not found
         """
-        url = f"{self.BASE_URL}/token-pairs/v1/solana/{token_address}"
-        response = self._rate_limited_request(url)
+        response = self._rate_limited_request(f"{self.BASE_URL}/token-pairs/v1/solana/{token_address}")
+        return self._parse_pairs(response)
 
+    async def get_token_pairs_async(self, token_address: str) -> Optional[List[Dict[str, Any]]]:
+        """Async version of get_token_pairs."""
+        response = await self._rate_limited_request_async(f"{self.BASE_URL}/token-pairs/v1/solana/{token_address}")
+        return self._parse_pairs(response)
+
+    @staticmethod
+    def _parse_pairs(response) -> Optional[List[Dict[str, Any]]]:
         if not response:
             return None
 
         try:
-            data = response.json()
+            data = orjson.loads(response.content)
             if isinstance(data, list):
                 return data
             return None
@@ -175,18 +354,129 @@ class DexScreenerService:
             log_error(f"[DexScreener] Failed to parse pairs response: {e}")
             return None
 
-    def get_token_snapshot(self, token_address: str) -> Optional[Dict[str, Any]]:
+    def get_token_snapshot(self, token_address: str, use_cache: bool = False) -> Optional[Dict[str, Any]]:
         """
         Get a snapshot of token metrics (market cap, volume, liquidity, age).
 
         Args:
             token_address: Solana token mint address
+            use_cache: Reuse/store snapshots up to SNAPSHOT_CACHE_TTL_SECONDS old
+                (ingest/discovery only; live trackers leave this off)
 
         Returns:
             Dictionary with token metrics, or None if not found
         """
-        pairs = self.get_token_pairs(token_address)
+        snapshot = self._snapshot_cache.get(token_address) if use_cache else None
+        if snapshot is None:
+            snapshot = self._snapshot_from_pairs(self.get_token_pairs(token_address))
+            if snapshot and use_cache:
+                self._snapshot_cache.set(token_address, snapshot)
+        return snapshot
+
+    async def get_token_snapshot_async(self, token_address: str, use_cache: bool = False) -> Optional[Dict[str, Any]]:
+        """Async version of get_token_snapshot."""
+        snapshot = self._snapshot_cache.get(token_address) if use_cache else None
+        if snapshot is None:
+            snapshot = self._snapshot_from_pairs(await self.get_token_pairs_async(token_address))
+            if snapshot and use_cache:
+                self._snapshot_cache.set(token_address, snapshot)
+        return snapshot
+
+    def clear_snapshot_cache(self):
+        """Drop the snapshots cached by the ingest path so its next lookups hit DexScreener."""
+        self._snapshot_cache.clear()
+
+    def get_token_snapshots_bulk(
+        self, token_addresses: List[str], use_cache: bool = False
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get snapshots for many tokens, BULK_SNAPSHOT_MAX_ADDRESSES per request.
+
+        Args:
+            token_addresses: Solana token mint addresses
+            use_cache: Reuse/store snapshots as in get_token_snapshot
 
+        Returns:
+            Dictionary of token address -> snapshot (tokens without pairs are omitted)
+        """
+        snapshots, missing = self._cached_snapshots(token_addresses, use_cache)
+        for chunk in self._address_chunks(missing):
+            response = self._rate_limited_request(f"{self.BASE_URL}/tokens/v1/solana/{','.join(chunk)}")
+            fetched = self._snapshots_from_bulk_pairs(self._parse_pairs(response), chunk)
+            snapshots.update(self._cache_snapshots(fetched) if use_cache else fetched)
+        return snapshots
+
+    async def get_token_snapshots_bulk_async(
+        self, token_addresses: List[str], use_cache: bool = False
+    ) -> Dict[str, Dict[str, Any]]:
+        """Async version of get_token_snapshots_bulk."""
+        snapshots, missing = self._cached_snapshots(token_addresses, use_cache)
+        for chunk in self._address_chunks(missing):
+            response = await self._rate_limited_request_async(f"{self.BASE_URL}/tokens/v1/solana/{','.join(chunk)}")
+            fetched = self._snapshots_from_bulk_pairs(self._parse_pairs(response), chunk)
+            snapshots.update(self._cache_snapshots(fetched) if use_cache else fetched)
+        return snapshots
+
+    def _cached_snapshots(
+        self, token_addresses: List[str], use_cache: bool
+    ) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+        """Split addresses into (cached snapshots, addresses still to fetch)."""
+        if not use_cache:
+            return {}, list(token_addresses)
+        snapshots = {}
+        missing = []
+        for address in token_addresses:
+            snapshot = self._snapshot_cache.get(address)
+            if snapshot is None:
+                missing.append(address)
+            else:
+                snapshots[address] = snapshot
+        return snapshots, missing
+
+    def _cache_snapshots(self, snapshots: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        for address, snapshot in snapshots.items():
+            self._snapshot_cache.set(address, snapshot)
+        return snapshots
+
+    @staticmethod
+    def _address_chunks(token_addresses: List[str]) -> List[List[str]]:
+        """Split addresses (deduplicated, order kept) into bulk-request sized chunks."""
+        unique = list(dict.fromkeys(token_addresses))
+        return [unique[i:i + BULK_SNAPSHOT_MAX_ADDRESSES] for i in range(0, len(unique), BULK_SNAPSHOT_MAX_ADDRESSES)]
+
+    @classmethod
+    def _snapshots_from_bulk_pairs(
+        cls, pairs: Optional[List[Dict[str, Any]]], token_addresses: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Group a multi-token pairs response by base token and build one snapshot each.
+
+        Each group is ordered by liquidity so the deepest pool is the main pair,
+        matching what the single-token endpoint returns first.
+        """
+        wanted = set(token_addresses)
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        for pair in pairs or ():
+            address = (pair.get("baseToken") or {}).get("address")
+            if address in wanted:
+                grouped.setdefault(address, []).append(pair)
+
+        snapshots = {}
+        now_ms = time.time() * 1000  # one clock read for the whole batch
+        for address, token_pairs in grouped.items():
+            token_pairs.sort(key=lambda p: (p.get("liquidity") or {}).get("usd") or 0, reverse=True)
+            snapshots[address] = cls._snapshot_from_pairs(token_pairs, now_ms)
+        return snapshots
+
+    @staticmethod
+    def _snapshot_from_pairs(
+        pairs: Optional[List[Dict[str, Any]]], now_ms: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build a token snapshot from its token-pairs response (None if no pairs).
+
+        now_ms (Unix milliseconds) lets batch callers share one clock read.
+        """
         if not pairs or len(pairs) == 0:
             return None
 
@@ -199,8 +489,9 @@ class DexScreenerService:
         if created_at:
             try:
                 # pairCreatedAt is Unix timestamp in milliseconds
-                created_time = datetime.fromtimestamp(created_at / 1000)
-                age_hours = (datetime.now() - created_time).total_seconds() / 3600
+                if now_ms is None:
+                    now_ms = time.time() * 1000
+                age_hours = (now_ms - created_at) / 3_600_000
             except Exception:
                 pass
 
@@ -285,76 +576,98 @@ class DexScreenerService:
         """
         seen_addresses = set()
         tokens = []
+        filters = (min_mc, min_volume, min_liquidity, max_age_hours)
 
         # Source 1: Latest token profiles
-        profiles = self.get_latest_token_profiles("solana")
-        for profile in profiles:
-            address = profile.get("tokenAddress")
-            if not address or address in seen_addresses:
-                continue
-
-            # Get full token snapshot
-            snapshot = self.get_token_snapshot(address)
-            if not snapshot:
-                continue
-
-            # Apply filters
-            mc = snapshot.get("market_cap_usd") or 0
-            vol = snapshot.get("volume_24h_usd") or 0
-            liq = snapshot.get("liquidity_usd") or 0
-            age = snapshot.get("age_hours")
-
-            if mc < min_mc:
-                continue
-            if vol < min_volume:
-                continue
-            if liq < min_liquidity:
-                continue
-            if age is not None and age > max_age_hours:
-                continue
-
-            seen_addresses.add(address)
-            tokens.append(snapshot)
-
+        # Source 2: Latest boosted tokens (only fetched if profiles didn't fill the quota)
+        for get_source in (self.get_latest_token_profiles, self.get_latest_boosted_tokens):
             if len(tokens) >= max_tokens:
                 break
+            candidates = self._new_candidates(get_source("solana"), seen_addresses)
 
-        # Source 2: Latest boosted tokens (if not enough from profiles)
-        if len(tokens) < max_tokens:
-            boosts = self.get_latest_boosted_tokens("solana")
-            for boost in boosts:
-                address = boost.get("tokenAddress")
-                if not address or address in seen_addresses:
-                    continue
-
-                snapshot = self.get_token_snapshot(address)
-                if not snapshot:
-                    continue
+            # One bulk request per chunk; later chunks are skipped once the quota is met
+            for chunk in self._address_chunks(candidates):
+                snapshots = self.get_token_snapshots_bulk(chunk, use_cache=True)
+                if self._collect_passing(chunk, snapshots, filters, tokens, seen_addresses, max_tokens):
+                    break
 
-                # Apply filters
-                mc = snapshot.get("market_cap_usd") or 0
-                vol = snapshot.get("volume_24h_usd") or 0
-                liq = snapshot.get("liquidity_usd") or 0
-                age = snapshot.get("age_hours")
+        log_info(f"[DexScreener] Found {len(tokens)} tokens after filtering")
+        return tokens, len(tokens)
 
-                if mc < min_mc:
-                    continue
-                if vol < min_volume:
-                    continue
-                if liq < min_liquidity:
-                    continue
-                if age is not None and age > max_age_hours:
-                    continue
+    async def fetch_recent_migrated_tokens_async(
+        self,
+        max_tokens: int = 50,
+        min_mc: float = 0,
+        min_volume: float = 0,
+        min_liquidity: float = 0,
+        max_age_hours: float = 48,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Async version of fetch_recent_migrated_tokens (same sources, filters and order)."""
+        seen_addresses = set()
+        tokens = []
+        filters = (min_mc, min_volume, min_liquidity, max_age_hours)
 
-                seen_addresses.add(address)
-                tokens.append(snapshot)
+        for get_source in (self.get_latest_token_profiles_async, self.get_latest_boosted_tokens_async):
+            if len(tokens) >= max_tokens:
+                break
+            candidates = self._new_candidates(await get_source("solana"), seen_addresses)
 
-                if len(tokens) >= max_tokens:
+            for chunk in self._address_chunks(candidates):
+                snapshots = await self.get_token_snapshots_bulk_async(chunk, use_cache=True)
+                if self._collect_passing(chunk, snapshots, filters, tokens, seen_addresses, max_tokens):
                     break
 
         log_info(f"[DexScreener] Found {len(tokens)} tokens after filtering")
         return tokens, len(tokens)
 
+    @staticmethod
+    def _new_candidates(entries: List[Dict[str, Any]], seen_addresses: set) -> List[str]:
+        """Token addresses from a profiles/boosts listing that haven't been collected yet."""
+        return [
+            entry["tokenAddress"] for entry in entries
+            if entry.get("tokenAddress") and entry["tokenAddress"] not in seen_addresses
+        ]
+
+    @classmethod
+    def _collect_passing(
+        cls,
+        addresses: List[str],
+        snapshots: Dict[str, Dict[str, Any]],
+        filters: Tuple[float, float, float, float],
+        tokens: List[Dict[str, Any]],
+        seen_addresses: set,
+        max_tokens: int,
+    ) -> bool:
+        """Append passing snapshots in candidate order; returns True once max_tokens is reached."""
+        for address in addresses:
+            snapshot = snapshots.get(address)
+            if address in seen_addresses or not snapshot or not cls._passes_filters(snapshot, *filters):
+                continue
+            seen_addresses.add(address)
+            tokens.append(snapshot)
+            if len(tokens) >= max_tokens:
+                return True
+        return False
+
+    @staticmethod
+    def _passes_filters(
+        snapshot: Dict[str, Any],
+        min_mc: float,
+        min_volume: float,
+        min_liquidity: float,
+        max_age_hours: float,
+    ) -> bool:
+        """Apply the market cap / volume / liquidity / age thresholds to a snapshot."""
+        age = snapshot.get("age_hours")
+        # One short-circuiting expression; a lexicographic tuple compare would let a
+        # high market cap mask low volume/liquidity
+        return (
+            (snapshot.get("market_cap_usd") or 0) >= min_mc
+            and (snapshot.get("volume_24h_usd") or 0) >= min_volume
+            and (snapshot.get("liquidity_usd") or 0) >= min_liquidity
+            and (age is None or age <= max_age_hours)
+        )
+
 
 # Module-level singleton
 _dexscreener_service: Optional[DexScreenerService] = None
@@ -0,0 +1,24 @@
+"""
+Multi-Token Wallets Response Cache
+
+Holds cached /multi-token-wallets responses outside the routers so the token,
+analysis and ingest code paths that change verdicts or early buyers can drop
+them without importing the wallets router.
+"""
+
+from meridinate.cache import ResponseCache
+
+multi_token_wallets_cache = ResponseCache(name="multi_token_wallets")
+
+# Every /multi-token-wallets response is cached under this prefix + min_tokens
+MULTI_TOKEN_WALLETS_CACHE_PREFIX = "multi_early_buyer_wallets_"
+
+
+def multi_token_wallets_cache_key(min_tokens: int) -> str:
+    """Cache key for one min_tokens variant of /multi-token-wallets"""
+    return f"{MULTI_TOKEN_WALLETS_CACHE_PREFIX}{min_tokens}"
+
+
+def invalidate_multi_token_wallets_cache():
+    """Drop every cached /multi-token-wallets response (all min_tokens variants)."""
+    multi_token_wallets_cache.invalidate(MULTI_TOKEN_WALLETS_CACHE_PREFIX)
@@ -9,7 +9,14 @@ Centralizes loading of:
 
 import json
 import os
-from typing import Dict, Optional
+import tempfile
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import IO, Dict, Iterator, Optional
+
+import orjson
+
+from meridinate.observability import log_debug, log_error, log_info, log_warning
 
 # ============================================================================
 # Directory Paths
@@ -24,6 +31,7 @@ SETTINGS_FILE = os.path.join(BACKEND_ROOT, "api_settings.json")
 DATA_FILE = os.path.join(BACKEND_ROOT, "monitored_addresses.json")
 ANALYSIS_RESULTS_DIR = os.path.join(BACKEND_ROOT, "data", "analysis_results")
 AXIOM_EXPORTS_DIR = os.path.join(BACKEND_ROOT, "data", "axiom_exports")
+CONFIG_FILE = os.path.join(BACKEND_ROOT, "config.json")
 
 # ============================================================================
 # Server URLs
@@ -37,11 +45,57 @@ FRONTEND_URL = "http://localhost:3000"
 os.makedirs(ANALYSIS_RESULTS_DIR, exist_ok=True)
 os.makedirs(AXIOM_EXPORTS_DIR, exist_ok=True)
 
+
+@contextmanager
+def open_settings_file_atomic(path: str, encoding: Optional[str] = None) -> Iterator[IO]:
+    """
+    Open a temp file that replaces path atomically when the block exits cleanly.
+
+    The temp file lives in the same directory and is renamed over path, so a crash
+    mid-write leaves the previous file intact instead of a truncated one that the
+    loaders would discard for defaults. Yields a binary file, or a text file when
+    encoding is given.
+    """
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w" if encoding else "wb", encoding=encoding) as f:
+            yield f
+        # mkstemp creates the file 0600; keep the existing file's permissions
+        os.chmod(tmp_path, os.stat(path).st_mode & 0o777 if os.path.exists(path) else 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_settings_file(path: str, data: bytes) -> None:
+    """Replace a settings file atomically (see open_settings_file_atomic)."""
+    with open_settings_file_atomic(path) as f:
+        f.write(data)
+
+
 # ============================================================================
 # Helius API Key Loading
 # ============================================================================
 
 
+@lru_cache(maxsize=1)
+def _load_config_file() -> Dict:
+    """Parse config.json once; the key loaders below all read from this dict"""
+    if not os.path.exists(CONFIG_FILE):
+        return {}
+    try:
+        with open(CONFIG_FILE, "r") as f:
+            return json.load(f)
+    except Exception as e:
+        log_error("[Config] Error reading config.json: %s", e)
+        return {}
+
+
 def load_api_key() -> Optional[str]:
     """Load Helius API key from environment or config file"""
     # Try environment variable first
@@ -49,24 +103,15 @@ def load_api_key() -> Optional[str]:
     if api_key:
         return api_key
 
-    # Try config.json (look in the backend root directory)
-    config_file = os.path.join(BACKEND_ROOT, "config.json")
-    if os.path.exists(config_file):
-        try:
-            with open(config_file, "r") as f:
-                config = json.load(f)
-                return config.get("helius_api_key")
-        except Exception as e:
-            print(f"[Config] Error reading config.json: {e}")
-
-    return None
+    return _load_config_file().get("helius_api_key")
 
 
 HELIUS_API_KEY = load_api_key()
 if not HELIUS_API_KEY:
     raise RuntimeError("HELIUS_API_KEY not set. Add it to environment variable or backend/config.json")
 
-print(f"[Config] Loaded Helius API key: {HELIUS_API_KEY[:8]}..." if HELIUS_API_KEY else "[Config] No API key loaded")
+# Key previews only at DEBUG; arguments are formatted only if the record is emitted
+log_debug("[Config] Loaded Helius API key: %s...", HELIUS_API_KEY[:8])
 
 
 def load_top_holders_api_key() -> Optional[str]:
@@ -76,26 +121,16 @@ def load_top_holders_api_key() -> Optional[str]:
     if api_key:
         return api_key
 
-    # Try config.json (look in the backend root directory)
-    config_file = os.path.join(BACKEND_ROOT, "config.json")
-    if os.path.exists(config_file):
-        try:
-            with open(config_file, "r") as f:
-                config = json.load(f)
-                return config.get("helius_top_holders_api_key")
-        except Exception as e:
-            print(f"[Config] Error reading config.json for top holders key: {e}")
-
-    return None
+    return _load_config_file().get("helius_top_holders_api_key")
 
 
 HELIUS_TOP_HOLDERS_API_KEY = load_top_holders_api_key()
 # Fallback to main API key if top holders key not set
 if not HELIUS_TOP_HOLDERS_API_KEY:
     HELIUS_TOP_HOLDERS_API_KEY = HELIUS_API_KEY
-    print("[Config] Using main Helius API key for Top Holders feature")
+    log_info("[Config] Using main Helius API key for Top Holders feature")
 else:
-    print(f"[Config] Loaded Top Holders API key: {HELIUS_TOP_HOLDERS_API_KEY[:8]}...")
+    log_debug("[Config] Loaded Top Holders API key: %s...", HELIUS_TOP_HOLDERS_API_KEY[:8])
 
 # ============================================================================
 # Anthropic API Key (for AI Intel Agent)
@@ -105,41 +140,25 @@ def load_anthropic_api_key() -> Optional[str]:
     api_key = os.environ.get("ANTHROPIC_API_KEY")
     if api_key:
         return api_key
-    config_file = os.path.join(BACKEND_ROOT, "config.json")
-    if os.path.exists(config_file):
-        try:
-            with open(config_file, "r") as f:
-                config = json.load(f)
-                return config.get("anthropic_api_key")
-        except Exception:
-            pass
-    return None
+    return _load_config_file().get("anthropic_api_key")
 
 ANTHROPIC_API_KEY = load_anthropic_api_key()
 if ANTHROPIC_API_KEY:
-    print(f"[Config] Loaded Anthropic API key: {ANTHROPIC_API_KEY[:12]}...")
+    log_debug("[Config] Loaded Anthropic API key: %s...", ANTHROPIC_API_KEY[:12])
 else:
-    print("[Config] No Anthropic API key configured (Intel Agent disabled)")
+    log_warning("[Config] No Anthropic API key configured (Intel Agent disabled)")
 
 def load_housekeeper_key() -> Optional[str]:
     api_key = os.environ.get("ANTHROPIC_HOUSEKEEPER_KEY")
     if api_key:
         return api_key
-    config_file = os.path.join(BACKEND_ROOT, "config.json")
-    if os.path.exists(config_file):
-        try:
-            with open(config_file, "r") as f:
-                config = json.load(f)
-                return config.get("anthropic_housekeeper_key")
-        except Exception:
-            pass
-    return None
+    return _load_config_file().get("anthropic_housekeeper_key")
 
 ANTHROPIC_HOUSEKEEPER_KEY = load_housekeeper_key()
 if ANTHROPIC_HOUSEKEEPER_KEY:
-    print(f"[Config] Loaded Housekeeper API key: {ANTHROPIC_HOUSEKEEPER_KEY[:12]}...")
+    log_debug("[Config] Loaded Housekeeper API key: %s...", ANTHROPIC_HOUSEKEEPER_KEY[:12])
 else:
-    print("[Config] No Housekeeper API key configured")
+    log_warning("[Config] No Housekeeper API key configured")
 
 # ============================================================================
 # CLOBr API Key Loading
@@ -152,22 +171,14 @@ def load_clobr_key() -> Optional[str]:
     if api_key:
         return api_key
 
-    config_file = os.path.join(BACKEND_ROOT, "config.json")
-    if os.path.exists(config_file):
-        try:
-            with open(config_file, "r") as f:
-                config = json.load(f)
-                return config.get("clobr_api_key")
-        except Exception:
-            pass
-    return None
+    return _load_config_file().get("clobr_api_key")
 
 
 CLOBR_API_KEY = load_clobr_key()
 if CLOBR_API_KEY:
-    print(f"[Config] Loaded CLOBr API key: {CLOBR_API_KEY[:12]}...")
+    log_debug("[Config] Loaded CLOBr API key: %s...", CLOBR_API_KEY[:12])
 else:
-    print("[Config] No CLOBr API key configured (CLOBr enrichment disabled)")
+    log_warning("[Config] No CLOBr API key configured (CLOBr enrichment disabled)")
 
 # ============================================================================
 # Redis Configuration (for task queue and rate limiting)
@@ -177,9 +188,9 @@ REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379")
 REDIS_ENABLED = os.environ.get("REDIS_ENABLED", "false").lower() == "true"
 RATE_LIMIT_ENABLED = os.environ.get("RATE_LIMIT_ENABLED", "false").lower() == "true"
 
-print(f"[Config] Redis URL: {REDIS_URL}")
-print(f"[Config] Redis enabled: {REDIS_ENABLED}")
-print(f"[Config] Rate limiting enabled: {RATE_LIMIT_ENABLED}")
+log_info("[Config] Redis URL: %s", REDIS_URL)
+log_info("[Config] Redis enabled: %s", REDIS_ENABLED)
+log_info("[Config] Rate limiting enabled: %s", RATE_LIMIT_ENABLED)
 
 # ============================================================================
 # API Settings Management
@@ -212,7 +223,7 @@ def load_api_settings() -> Dict:
                 # Merge with defaults (file values override defaults)
                 return {**DEFAULT_API_SETTINGS, **data}
         except Exception as e:
-            print(f"[Config] Error reading api_settings.json: {e}")
+            log_error("[Config] Error reading api_settings.json: %s", e)
             return DEFAULT_API_SETTINGS.copy()
     return DEFAULT_API_SETTINGS.copy()
 
@@ -220,21 +231,21 @@ def load_api_settings() -> Dict:
 def save_api_settings(settings: Dict) -> bool:
     """Save API settings to file"""
     try:
-        with open(SETTINGS_FILE, "w") as f:
-            json.dump(settings, f, indent=2)
-        print(f"[Config] API settings saved: {settings}")
+        write_settings_file(SETTINGS_FILE, json.dumps(settings, indent=2).encode())
+        log_info("[Config] API settings saved: %s", settings)
         return True
     except Exception as exc:
-        print(f"[Config] Failed to persist API settings: {exc}")
+        log_error("[Config] Failed to persist API settings: %s", exc)
         return False
 
 
 # Load settings on module import
 CURRENT_API_SETTINGS = load_api_settings()
-print(
-    f"[Config] API Settings: walletCount={CURRENT_API_SETTINGS['walletCount']}, "
-    f"transactionLimit={CURRENT_API_SETTINGS['transactionLimit']}, "
-    f"maxCredits={CURRENT_API_SETTINGS['maxCreditsPerAnalysis']}"
+log_info(
+    "[Config] API Settings: walletCount=%s, transactionLimit=%s, maxCredits=%s",
+    CURRENT_API_SETTINGS["walletCount"],
+    CURRENT_API_SETTINGS["transactionLimit"],
+    CURRENT_API_SETTINGS["maxCreditsPerAnalysis"],
 )
 
 # ============================================================================
@@ -244,19 +255,25 @@ print(
 INGEST_SETTINGS_FILE = os.path.join(BACKEND_ROOT, "ingest_settings.json")
 
 # Import defaults from centralized models package
-from meridinate.models.ingest_settings import DEFAULT_INGEST_SETTINGS
+from meridinate.models.ingest_settings import DEFAULT_INGEST_SETTINGS, complete_score_weights
 
 
 def load_ingest_settings() -> Dict:
     """Load ingest settings from file, fallback to defaults"""
     if os.path.exists(INGEST_SETTINGS_FILE):
         try:
-            with open(INGEST_SETTINGS_FILE, "r") as f:
-                data = json.load(f)
-                # Merge with defaults (file values override defaults)
-                return {**DEFAULT_INGEST_SETTINGS, **data}
+            with open(INGEST_SETTINGS_FILE, "rb") as f:
+                data = orjson.loads(f.read())
+            # Merge with defaults (file values override defaults)
+            settings = {**DEFAULT_INGEST_SETTINGS, **data}
+            try:
+                settings["score_weights"] = complete_score_weights(settings.get("score_weights"))
+            except ValueError as e:
+                log_warning("[Config] Invalid score_weights in ingest_settings.json, using defaults: %s", e)
+                settings["score_weights"] = complete_score_weights(None)
+            return settings
         except Exception as e:
-            print(f"[Config] Error reading ingest_settings.json: {e}")
+            log_error("[Config] Error reading ingest_settings.json: %s", e)
             return DEFAULT_INGEST_SETTINGS.copy()
     return DEFAULT_INGEST_SETTINGS.copy()
 
@@ -264,18 +281,19 @@ def load_ingest_settings() -> Dict:
 def save_ingest_settings(settings: Dict) -> bool:
     """Save ingest settings to file"""
     try:
-        with open(INGEST_SETTINGS_FILE, "w") as f:
-            json.dump(settings, f, indent=2)
-        print(f"[Config] Ingest settings saved")
+        # Rewritten after every scheduled ingest run, so serialize with orjson
+        write_settings_file(INGEST_SETTINGS_FILE, orjson.dumps(settings, option=orjson.OPT_INDENT_2))
+        log_info("[Config] Ingest settings saved")
         return True
     except Exception as exc:
-        print(f"[Config] Failed to persist ingest settings: {exc}")
+        log_error("[Config] Failed to persist ingest settings: %s", exc)
         return False
 
 
 # Load ingest settings on module import
 CURRENT_INGEST_SETTINGS = load_ingest_settings()
-print(
-    f"[Config] Ingest Settings: discovery_enabled={CURRENT_INGEST_SETTINGS.get('discovery_enabled', False)}, "
-    f"mc_min=${CURRENT_INGEST_SETTINGS.get('mc_min', 0)}"
+log_info(
+    "[Config] Ingest Settings: discovery_enabled=%s, mc_min=$%s",
+    CURRENT_INGEST_SETTINGS.get("discovery_enabled", False),
+    CURRENT_INGEST_SETTINGS.get("mc_min", 0),
 )
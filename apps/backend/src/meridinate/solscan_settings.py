@@ -4,8 +4,12 @@ Solscan settings management
 Handles reading/writing Solscan URL parameters from action_wheel_settings.ini
 """
 
+import configparser
 import os
-from typing import Dict
+from typing import Dict, List, Tuple
+
+from meridinate.observability import log_debug, log_error, log_info, log_warning
+from meridinate.settings import open_settings_file_atomic
 
 # Path to the action wheel settings file (in parent directory of backend)
 SCRIPT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -22,6 +26,51 @@ DEFAULT_SOLSCAN_SETTINGS = {
     "page_size": "10",
 }
 
+# Lines written when action_wheel_settings.ini doesn't exist yet
+DEFAULT_ACTION_WHEEL_LINES = [
+    "[Hotkeys]\n",
+    "WheelMenu=`\n",
+    "[Actions]\n",
+    "Wedge1=Solscan\n",
+    "Wedge2=Exclude\n",
+    "Wedge3=Monitor\n",
+    "Wedge4=Defined.fi\n",
+    "Wedge5=Analyze\n",
+    "Wedge6=Cancel\n",
+]
+
+
+def _new_parser() -> configparser.ConfigParser:
+    """INI parser matching the action wheel's format: case-kept keys, '=' only, no interpolation"""
+    parser = configparser.ConfigParser(interpolation=None, strict=False, delimiters=("=",))
+    parser.optionxform = str
+    return parser
+
+
+def _read_lines() -> List[str]:
+    """Read the UTF-16 encoded INI file as lines (line endings kept)"""
+    with open(SOLSCAN_SETTINGS_FILE, "r", encoding="utf-16-le") as f:
+        return f.readlines()
+
+
+def _split_solscan_section(lines: List[str]) -> Tuple[List[str], List[str]]:
+    """
+    Split INI lines into (other lines, [Solscan] section lines).
+
+    The file belongs to the AutoHotkey action wheel, so everything outside
+    [Solscan] (comments, duplicate keys, lines configparser would reject) is
+    returned verbatim for the save path to write back untouched.
+    """
+    other_lines: List[str] = []
+    solscan_lines: List[str] = []
+    in_solscan_section = False
+    for line in lines:
+        stripped = line.strip().lstrip("\ufeff")
+        if stripped.startswith("[") and stripped.endswith("]"):
+            in_solscan_section = stripped == "[Solscan]"
+        (solscan_lines if in_solscan_section else other_lines).append(line)
+    return other_lines, solscan_lines
+
 
 def load_solscan_settings() -> Dict[str, str]:
     """
@@ -36,32 +85,30 @@ def load_solscan_settings() -> Dict[str, str]:
     try:
         settings = DEFAULT_SOLSCAN_SETTINGS.copy()
 
-        # Read the UTF-16 encoded INI file
-        with open(SOLSCAN_SETTINGS_FILE, "r", encoding="utf-16-le") as f:
-            content = f.read()
-
-        # Parse the [Solscan] section
-        in_solscan_section = False
-        for line in content.splitlines():
-            line = line.strip()
-
-            if line == "[Solscan]":
-                in_solscan_section = True
-                continue
-            elif line.startswith("[") and line.endswith("]"):
-                in_solscan_section = False
-                continue
-
-            if in_solscan_section and "=" in line:
-                key, value = line.split("=", 1)
-                key = key.strip()
-                value = value.strip()
-                if key in settings:
-                    settings[key] = value
+        # Only the [Solscan] block goes through configparser; the other sections
+        # are AutoHotkey's and may not be valid configparser INI. Lines are stripped
+        # (so indentation isn't read as a value continuation) and anything that
+        # isn't the header or key=value is skipped, as the wheel itself does
+        _, solscan_lines = _split_solscan_section(_read_lines())
+        parser = _new_parser()
+        try:
+            parser.read_string(
+                "".join(
+                    f"{stripped}\n"
+                    for stripped in (line.strip().lstrip("\ufeff") for line in solscan_lines)
+                    if stripped == "[Solscan]" or "=" in stripped
+                )
+            )
+        except configparser.ParsingError as e:
+            # Raised after the whole block is read; the valid options are kept
+            log_warning("[Solscan Settings] Skipped unparseable lines: %s", e)
+        if parser.has_section("Solscan"):
+            section = parser["Solscan"]
+            settings.update((key, section[key]) for key in settings if key in section)
 
         return settings
     except Exception as e:
-        print(f"[Solscan Settings] Error reading settings: {e}")
+        log_error("[Solscan Settings] Error reading settings: %s", e)
         return DEFAULT_SOLSCAN_SETTINGS.copy()
 
 
@@ -69,6 +116,9 @@ def save_solscan_settings(settings: Dict[str, str]) -> bool:
     """
     Save Solscan settings to action_wheel_settings.ini
 
+    Only the [Solscan] block is rewritten (and moved to the end of the file);
+    every other line is written back exactly as read.
+
     Args:
         settings: Dictionary of Solscan URL parameters to save
 
@@ -76,55 +126,28 @@ def save_solscan_settings(settings: Dict[str, str]) -> bool:
         True if successful, False otherwise
     """
     try:
-        # Read existing content
-        if os.path.exists(SOLSCAN_SETTINGS_FILE):
-            with open(SOLSCAN_SETTINGS_FILE, "r", encoding="utf-16-le") as f:
-                lines = f.readlines()
-        else:
-            # Create new file with basic structure
-            lines = [
-                "[Hotkeys]\n",
-                "WheelMenu=`\n",
-                "[Actions]\n",
-                "Wedge1=Solscan\n",
-                "Wedge2=Exclude\n",
-                "Wedge3=Monitor\n",
-                "Wedge4=Defined.fi\n",
-                "Wedge5=Analyze\n",
-                "Wedge6=Cancel\n",
-            ]
-
-        # Remove existing [Solscan] section
-        new_lines = []
-        in_solscan_section = False
-        for line in lines:
-            stripped = line.strip()
-
-            if stripped == "[Solscan]":
-                in_solscan_section = True
-                continue
-            elif stripped.startswith("[") and stripped.endswith("]"):
-                in_solscan_section = False
-
-            if not in_solscan_section:
-                new_lines.append(line)
-
-        # Add [Solscan] section at the end
-        new_lines.append("[Solscan]\n")
-        for key, value in settings.items():
-            new_lines.append(f"{key}={value}\n")
-
-        # Write back to file with UTF-16-LE encoding
-        with open(SOLSCAN_SETTINGS_FILE, "w", encoding="utf-16-le") as f:
+        lines = _read_lines() if os.path.exists(SOLSCAN_SETTINGS_FILE) else DEFAULT_ACTION_WHEEL_LINES
+        other_lines, _ = _split_solscan_section(lines)
+        if other_lines and not other_lines[-1].endswith("\n"):
+            other_lines[-1] += "\n"
+
+        new_lines = other_lines + ["[Solscan]\n"] + [f"{key}={value}\n" for key, value in settings.items()]
+
+        # Nothing to write if the file already holds exactly this content
+        if new_lines == lines:
+            log_debug("[Solscan Settings] Unchanged, skipping save")
+            return True
+
+        with open_settings_file_atomic(SOLSCAN_SETTINGS_FILE, encoding="utf-16-le") as f:
             f.writelines(new_lines)
 
-        print(f"[Solscan Settings] Saved settings: {settings}")
+        log_info("[Solscan Settings] Saved settings: %s", settings)
         return True
     except Exception as e:
-        print(f"[Solscan Settings] Failed to save settings: {e}")
+        log_error("[Solscan Settings] Failed to save settings: %s", e)
         return False
 
 
 # Load settings on module import
 CURRENT_SOLSCAN_SETTINGS = load_solscan_settings()
-print(f"[Solscan Settings] Loaded: {CURRENT_SOLSCAN_SETTINGS}")
+log_info("[Solscan Settings] Loaded: %s", CURRENT_SOLSCAN_SETTINGS)
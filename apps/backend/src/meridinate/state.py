@@ -6,7 +6,9 @@ Centralizes in-memory state stores:
 - Monitored addresses (watchlist)
 """
 
+import asyncio
 from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Any, Dict
 
 # ============================================================================
@@ -19,6 +21,15 @@ analysis_jobs: Dict[str, Dict[str, Any]] = {}
 # Thread pool for background analysis jobs
 ANALYSIS_EXECUTOR = ThreadPoolExecutor(max_workers=3, thread_name_prefix="analysis")
 WEBHOOK_EXECUTOR = ThreadPoolExecutor(max_workers=5, thread_name_prefix="webhook")
+# Dedicated lane for webhook-path and scheduled-job SQLite work, so slow Helius admin calls or other
+# asyncio.to_thread users of the default pool can't starve callback writes
+DB_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="db")
+
+
+async def run_db(func, *args, **kwargs):
+    """Run a blocking db.* call on DB_EXECUTOR from async code."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(DB_EXECUTOR, partial(func, *args, **kwargs))
 
 
 def get_analysis_job(job_id: str) -> Dict[str, Any]:
@@ -4,14 +4,20 @@ Background tasks for Meridinate
 Contains scheduled tasks and background job handlers.
 """
 
-from meridinate.tasks.position_tracker import (
-    check_mtew_positions,
-    record_mtew_positions_for_token,
-    update_all_pnl_ratios,
-)
-
 __all__ = [
     "check_mtew_positions",
     "record_mtew_positions_for_token",
     "update_all_pnl_ratios",
 ]
+
+
+# Module-level __getattr__ so importing one task module (e.g. meridinate.tasks.mc_tracker)
+# doesn't also load position_tracker; the re-exports resolve on first access
+def __getattr__(name: str):
+    if name in __all__:
+        from meridinate.tasks import position_tracker
+
+        value = getattr(position_tracker, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -767,7 +767,7 @@ async def run_tier0_ingestion(
 
         # Fetch tokens from DexScreener
         dexscreener = get_dexscreener_service()
-        tokens, fetched_count = dexscreener.fetch_recent_migrated_tokens(
+        tokens, fetched_count = await dexscreener.fetch_recent_migrated_tokens_async(
             max_tokens=max_tokens * 2,  # Fetch extra to account for deduplication
             min_mc=mc_min,
             min_volume=volume_min,
@@ -969,8 +969,10 @@ async def run_hot_token_refresh(
 
         log_info(f"[Hot Refresh] Found {len(hot_tokens)} hot tokens")
 
-        # Get DexScreener service
+        # Get DexScreener service; the refresh exists to get current numbers, so drop the
+        # ingest snapshot cache first and refill it for the next discovery run
         dexscreener = get_dexscreener_service()
+        dexscreener.clear_snapshot_cache()
 
         # Refresh each token
         updates = []
@@ -979,7 +981,7 @@ async def run_hot_token_refresh(
             address = token["token_address"]
             tier = token.get("tier", "ingested")
             try:
-                snapshot = dexscreener.get_token_snapshot(address)
+                snapshot = await dexscreener.get_token_snapshot_async(address, use_cache=True)
                 if snapshot:
                     updates.append({
                         "token_address": address,
@@ -1195,8 +1197,8 @@ async def promote_tokens_to_analysis(
             except Exception:
                 pass
             try:
-                from meridinate.routers.wallets import cache as wallets_cache
-                wallets_cache.invalidate("multi_early_buyer_wallets")
+                from meridinate.services.wallet_cache import invalidate_multi_token_wallets_cache
+                invalidate_multi_token_wallets_cache()
             except Exception:
                 pass
 
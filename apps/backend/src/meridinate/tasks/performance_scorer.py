@@ -17,12 +17,18 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from meridinate import analyzed_tokens_db as db
 from meridinate.observability.structured_logger import log_info, log_error
+from meridinate.models.ingest_settings import ScoreWeights
 from meridinate.settings import CURRENT_INGEST_SETTINGS, save_ingest_settings
 
 
-def get_score_weights() -> Dict[str, int]:
-    """Get current score weights from settings."""
-    return CURRENT_INGEST_SETTINGS.get("score_weights", {})
+def get_score_weights() -> ScoreWeights:
+    """
+    Get current score weights from settings as a ScoreWeights model.
+
+    Built once per scoring batch so rules read typed attributes instead of doing
+    a dict lookup with a hardcoded fallback per rule.
+    """
+    return ScoreWeights(**(CURRENT_INGEST_SETTINGS.get("score_weights") or {}))
 
 
 def get_bucket_thresholds() -> Tuple[int, int]:
@@ -56,6 +62,7 @@ def calculate_token_score(
     first_snapshot: Optional[Dict] = None,
     high_win_rate_wallet_count: int = 0,
     age_hours: Optional[float] = None,
+    weights: Optional[ScoreWeights] = None,
 ) -> Tuple[float, List[Dict]]:
     """
     Calculate performance score for a token based on its snapshots.
@@ -67,11 +74,13 @@ def calculate_token_score(
         first_snapshot: First recorded snapshot (for momentum calculations)
         high_win_rate_wallet_count: Number of high-win-rate wallets in this token
         age_hours: Token age in hours
+        weights: Score weights (defaults to the current settings)
 
     Returns:
         Tuple of (score, list of triggered rules with weights)
     """
-    weights = get_score_weights()
+    if weights is None:
+        weights = get_score_weights()
     triggered_rules = []
     base_score = 50  # Start at neutral
 
@@ -93,7 +102,7 @@ def calculate_token_score(
 
         # MC change >= 50% (approximating 30m momentum)
         if mc_change_pct >= 50:
-            weight = weights.get("mc_change_30m_50pct", 15)
+            weight = weights.mc_change_30m_50pct
             base_score += weight
             triggered_rules.append({
                 "rule": "mc_change_30m_50pct",
@@ -102,7 +111,7 @@ def calculate_token_score(
             })
         # MC change >= 30% (approximating 2h momentum)
         elif mc_change_pct >= 30:
-            weight = weights.get("mc_change_2h_30pct", 10)
+            weight = weights.mc_change_2h_30pct
             base_score += weight
             triggered_rules.append({
                 "rule": "mc_change_2h_30pct",
@@ -112,7 +121,7 @@ def calculate_token_score(
 
         # Drawdown check (if MC dropped significantly from first seen)
         if mc_change_pct <= -35:
-            weight = weights.get("drawdown_35pct", -10)
+            weight = weights.drawdown_35pct
             base_score += weight
             triggered_rules.append({
                 "rule": "drawdown_35pct",
@@ -125,7 +134,7 @@ def calculate_token_score(
         liquidity_ratio = liquidity / first_liquidity
 
         if liquidity_ratio >= 1.3:
-            weight = weights.get("liquidity_up_30pct", 10)
+            weight = weights.liquidity_up_30pct
             base_score += weight
             triggered_rules.append({
                 "rule": "liquidity_up_30pct",
@@ -133,7 +142,7 @@ def calculate_token_score(
                 "reason": f"Liquidity up {(liquidity_ratio - 1) * 100:.1f}%",
             })
         elif liquidity_ratio < 0.6:
-            weight = weights.get("liquidity_down_40pct", -15)
+            weight = weights.liquidity_down_40pct
             base_score += weight
             triggered_rules.append({
                 "rule": "liquidity_down_40pct",
@@ -143,7 +152,7 @@ def calculate_token_score(
 
     # === Volume Rules ===
     if volume_24h >= 100000:
-        weight = weights.get("volume_24h_100k", 10)
+        weight = weights.volume_24h_100k
         base_score += weight
         triggered_rules.append({
             "rule": "volume_24h_100k",
@@ -151,7 +160,7 @@ def calculate_token_score(
             "reason": f"High volume: ${volume_24h:,.0f}",
         })
     elif volume_24h < 10000:
-        weight = weights.get("volume_24h_10k", -10)
+        weight = weights.volume_24h_10k
         base_score += weight
         triggered_rules.append({
             "rule": "volume_24h_10k",
@@ -161,7 +170,7 @@ def calculate_token_score(
 
     # === Holder Quality Rules ===
     if high_win_rate_wallet_count >= 3:
-        weight = weights.get("high_win_rate_3plus", 12)
+        weight = weights.high_win_rate_3plus
         base_score += weight
         triggered_rules.append({
             "rule": "high_win_rate_3plus",
@@ -169,7 +178,7 @@ def calculate_token_score(
             "reason": f"{high_win_rate_wallet_count} high-win-rate wallets",
         })
     elif high_win_rate_wallet_count >= 1:
-        weight = weights.get("high_win_rate_1_2", 6)
+        weight = weights.high_win_rate_1_2
         base_score += weight
         triggered_rules.append({
             "rule": "high_win_rate_1_2",
@@ -178,7 +187,7 @@ def calculate_token_score(
         })
 
     if top_holder_share is not None and top_holder_share > 0.45:
-        weight = weights.get("top_holder_concentrated", -8)
+        weight = weights.top_holder_concentrated
         base_score += weight
         triggered_rules.append({
             "rule": "top_holder_concentrated",
@@ -188,7 +197,7 @@ def calculate_token_score(
 
     # === Age/Lock Rules ===
     if age_hours is not None and age_hours < 1 and lp_locked is False:
-        weight = weights.get("young_unlocked_lp", -10)
+        weight = weights.young_unlocked_lp
         base_score += weight
         triggered_rules.append({
             "rule": "young_unlocked_lp",
@@ -199,7 +208,7 @@ def calculate_token_score(
     # === PnL Feedback Rules ===
     if pnl is not None:
         if pnl > 0:
-            weight = weights.get("positions_positive_pnl", 8)
+            weight = weights.positions_positive_pnl
             base_score += weight
             triggered_rules.append({
                 "rule": "positions_positive_pnl",
@@ -207,7 +216,7 @@ def calculate_token_score(
                 "reason": f"Our positions profitable: ${pnl:,.2f}",
             })
         elif pnl < 0:
-            weight = weights.get("positions_negative_pnl", -8)
+            weight = weights.positions_negative_pnl
             base_score += weight
             triggered_rules.append({
                 "rule": "positions_negative_pnl",
@@ -221,12 +230,13 @@ def calculate_token_score(
     return final_score, triggered_rules
 
 
-def score_token(token_address: str) -> Optional[Dict]:
+def score_token(token_address: str, weights: Optional[ScoreWeights] = None) -> Optional[Dict]:
     """
     Score a single token and update its performance data.
 
     Args:
         token_address: Token address to score
+        weights: Score weights (defaults to the current settings)
 
     Returns:
         Dict with score, bucket, explanation or None if no snapshots
@@ -285,6 +295,7 @@ def score_token(token_address: str) -> Optional[Dict]:
         first_snapshot=first_snapshot,
         high_win_rate_wallet_count=high_win_rate_count,
         age_hours=age_hours,
+        weights=weights,
     )
 
     bucket = score_to_bucket(score)
@@ -327,9 +338,10 @@ async def score_tokens(token_addresses: List[str]) -> Dict[str, Any]:
         "completed_at": None,
     }
 
+    weights = get_score_weights()
     for address in token_addresses:
         try:
-            score_result = score_token(address)
+            score_result = score_token(address, weights)
             if score_result:
                 result["tokens_scored"] += 1
                 bucket = score_result["bucket"]
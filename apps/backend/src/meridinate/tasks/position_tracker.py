@@ -75,6 +75,8 @@ async def check_mtew_positions(
     error_count = 0
     total_credits = 0
     wallets_to_recalculate = set()
+    # Plain balance/PnL refreshes are deferred and committed together after the loop
+    holding_updates: List[Dict[str, Any]] = []
 
     # Process each position
     for position in positions:
@@ -155,14 +157,13 @@ async def check_mtew_positions(
                     buys_detected += 1
                 else:
                     # Fallback: just update the balance without tx details
-                    db.update_mtew_position(
-                        wallet_address=wallet_address,
-                        token_id=token_id,
-                        still_holding=True,
-                        current_balance=current_balance,
-                        current_balance_usd=current_balance_usd,
-                        pnl_ratio=pnl_ratio,
-                    )
+                    holding_updates.append({
+                        "wallet_address": wallet_address,
+                        "token_id": token_id,
+                        "current_balance": current_balance,
+                        "current_balance_usd": current_balance_usd,
+                        "pnl_ratio": pnl_ratio,
+                    })
 
                 still_holding_count += 1
 
@@ -229,14 +230,13 @@ async def check_mtew_positions(
                             exit_market_cap=current_mc,
                         )
                     else:
-                        db.update_mtew_position(
-                            wallet_address=wallet_address,
-                            token_id=token_id,
-                            still_holding=True,
-                            current_balance=current_balance,
-                            current_balance_usd=current_balance_usd,
-                            pnl_ratio=pnl_ratio,  # OK for holding - based on current MC
-                        )
+                        holding_updates.append({
+                            "wallet_address": wallet_address,
+                            "token_id": token_id,
+                            "current_balance": current_balance,
+                            "current_balance_usd": current_balance_usd,
+                            "pnl_ratio": pnl_ratio,  # OK for holding - based on current MC
+                        })
 
                 # Track counts and stop tracking for full exits
                 if is_full_exit:
@@ -247,14 +247,13 @@ async def check_mtew_positions(
 
             elif current_balance > 0:
                 # No change - still holding, just update timestamp and PnL
-                db.update_mtew_position(
-                    wallet_address=wallet_address,
-                    token_id=token_id,
-                    still_holding=True,
-                    current_balance=current_balance,
-                    current_balance_usd=current_balance_usd,
-                    pnl_ratio=pnl_ratio,
-                )
+                holding_updates.append({
+                    "wallet_address": wallet_address,
+                    "token_id": token_id,
+                    "current_balance": current_balance,
+                    "current_balance_usd": current_balance_usd,
+                    "pnl_ratio": pnl_ratio,
+                })
                 still_holding_count += 1
 
             else:
@@ -333,6 +332,12 @@ async def check_mtew_positions(
             log_error(f"Error checking position for {wallet_address[:8]}.../{token_address[:8]}...: {e}")
             error_count += 1
 
+    # One transaction for all still-holding refreshes (before tags read them back)
+    try:
+        db.update_mtew_positions_holding_bulk(holding_updates)
+    except Exception as e:
+        log_error(f"Error saving {len(holding_updates)} position updates: {e}")
+
     # Update Tier 2 computed tags for affected wallets
     for wallet_address in wallets_to_recalculate:
         try:
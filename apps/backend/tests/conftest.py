@@ -8,11 +8,12 @@ import json
 import os
 import sqlite3
 import tempfile
-from typing import Any, Dict, Generator
+from typing import Any, Callable, Dict, Generator, Optional
 
 import pytest
 from fastapi.testclient import TestClient
 
+from meridinate import analyzed_tokens_db as db
 from meridinate import settings, state
 
 # Import the app
@@ -89,6 +90,7 @@ def test_client(test_db: str, monkeypatch) -> Generator[TestClient, None, None]:
 
     # Clear all router caches before each test
     from meridinate.routers import tags, tokens, wallets
+    from meridinate.services import wallet_cache
 
     tokens.cache.cache.clear()
     tokens.cache.pending_requests.clear()
@@ -96,6 +98,8 @@ def test_client(test_db: str, monkeypatch) -> Generator[TestClient, None, None]:
     tags.cache.pending_requests.clear()
     wallets.cache.cache.clear()
     wallets.cache.pending_requests.clear()
+    wallet_cache.multi_token_wallets_cache.cache.clear()
+    wallet_cache.multi_token_wallets_cache.pending_requests.clear()
 
     # Create app and client
     app = create_app()
@@ -153,6 +157,32 @@ def sample_early_bidders() -> list:
     ]
 
 
+@pytest.fixture
+def save_token(test_db: str) -> Callable[..., int]:
+    """
+    Factory that saves an analyzed token and returns its id
+
+    Token N gets address TokenNAddress..., name "Token N" and symbol TKN; any
+    save_analyzed_token field can be overridden by keyword.
+    """
+
+    def _save(index: int = 1, early_bidders: Optional[list] = None, **overrides) -> int:
+        fields = {
+            "token_address": f"Token{index}Address1234567890123456789012345",
+            "token_name": f"Token {index}",
+            "token_symbol": f"TK{index}",
+            "acronym": f"TK{index}",
+            "early_bidders": early_bidders or [],
+            "axiom_json": [],
+            "credits_used": 50,
+            "max_wallets": 10,
+        }
+        fields.update(overrides)
+        return db.save_analyzed_token(**fields)
+
+    return _save
+
+
 @pytest.fixture
 def sample_analysis_settings() -> Dict[str, Any]:
     """Sample analysis settings for testing"""
@@ -0,0 +1,64 @@
+"""
+Tests for structured logging
+
+Tests that request/job context survives the hand-off to the queue listener thread
+"""
+
+import json
+import logging
+import queue
+import threading
+
+import pytest
+
+from meridinate.observability.structured_logger import (
+    ContextQueueHandler,
+    StructuredFormatter,
+    request_id_ctx,
+    set_job_id,
+    set_request_id,
+)
+
+
+@pytest.fixture
+def queued_logger():
+    """Logger that only enqueues records, so the test can format them on another thread"""
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    test_logger = logging.getLogger("test_structured_logger")
+    test_logger.handlers = [ContextQueueHandler(log_queue)]
+    test_logger.setLevel(logging.INFO)
+    test_logger.propagate = False
+    yield test_logger, log_queue
+    test_logger.handlers = []
+
+
+@pytest.mark.unit
+class TestStructuredFormatter:
+    """Test JSON formatting of queued records"""
+
+    def test_request_id_from_producer_thread_is_emitted(self, queued_logger):
+        """Test that IDs set on the logging thread appear in JSON formatted on a thread without them"""
+        test_logger, log_queue = queued_logger
+
+        def produce():
+            set_request_id("req-123")
+            set_job_id("job-456")
+            test_logger.info("hello %s", "world", extra={"wallets": 3})
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        producer.join()
+
+        # New threads start with an empty context, like the QueueListener thread
+        formatted = []
+        consumer = threading.Thread(target=lambda: formatted.append(StructuredFormatter().format(log_queue.get())))
+        consumer.start()
+        consumer.join()
+
+        assert request_id_ctx.get() is None
+        data = json.loads(formatted[0])
+        assert data["message"] == "hello world"
+        assert data["request_id"] == "req-123"
+        assert data["job_id"] == "job-456"
+        assert data["wallets"] == 3
+        assert list(data)[:6] == ["timestamp", "level", "message", "logger", "request_id", "job_id"]
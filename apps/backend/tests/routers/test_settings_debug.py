@@ -257,3 +257,40 @@ class TestSolscanSettings:
         result_settings = data["settings"]
         assert result_settings["exclude_amount_zero"] == "true"
         assert result_settings["remove_spam"] == "true"
+
+    def test_save_keeps_lines_outside_solscan_section(self, tmp_path, monkeypatch):
+        """Test that saving rewrites only [Solscan] and keeps the action wheel's own lines verbatim"""
+        from meridinate import solscan_settings
+
+        ini_file = tmp_path / "action_wheel_settings.ini"
+        ini_file.write_text(
+            "; wheel config\n[Hotkeys]\nWheelMenu=`\nno delimiter here\n"
+            "[Solscan]\nvalue=9\n[Actions]\nWedge1=Solscan\n",
+            encoding="utf-16-le",
+        )
+        monkeypatch.setattr(solscan_settings, "SOLSCAN_SETTINGS_FILE", str(ini_file))
+
+        assert solscan_settings.load_solscan_settings()["value"] == "9"
+        assert solscan_settings.save_solscan_settings({"value": "250", "page_size": "20"})
+
+        assert ini_file.read_text(encoding="utf-16-le") == (
+            "; wheel config\n[Hotkeys]\nWheelMenu=`\nno delimiter here\n[Actions]\nWedge1=Solscan\n"
+            "[Solscan]\nvalue=250\npage_size=20\n"
+        )
+        assert solscan_settings.load_solscan_settings()["value"] == "250"
+
+    def test_load_skips_malformed_lines_in_solscan_section(self, tmp_path, monkeypatch):
+        """Test that stray lines in [Solscan] are skipped instead of discarding the saved values"""
+        from meridinate import solscan_settings
+
+        ini_file = tmp_path / "action_wheel_settings.ini"
+        ini_file.write_text(
+            "[Hotkeys]\nWheelMenu=`\n[Solscan]\nvalue=250\njunk line\n  page_size=20\n=orphan\n",
+            encoding="utf-16-le",
+        )
+        monkeypatch.setattr(solscan_settings, "SOLSCAN_SETTINGS_FILE", str(ini_file))
+
+        settings = solscan_settings.load_solscan_settings()
+        assert settings["value"] == "250"
+        assert settings["page_size"] == "20"
+        assert settings["remove_spam"] == "true"
@@ -4,12 +4,23 @@ Tests for wallets router
 Tests multi-token wallet queries and balance refresh
 """
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
 from meridinate import analyzed_tokens_db as db
+from meridinate.services.wallet_cache import invalidate_multi_token_wallets_cache
+
+
+def _early_bidder(wallet_address):
+    return {
+        "wallet_address": wallet_address,
+        "first_buy_time": "2024-01-15T09:00:00",
+        "total_usd": 100.0,
+        "transaction_count": 1,
+        "average_buy_usd": 100.0,
+    }
 
 
 @pytest.mark.integration
@@ -84,6 +95,24 @@ class TestMultiTokenWallets:
         assert wallet is not None
         assert wallet["token_count"] >= 2
 
+    def test_multi_token_wallet_verdicts_align_with_token_ids(self, test_client: TestClient, save_token):
+        """Test that verdicts and win multipliers line up with token_ids"""
+        shared_wallet = "DYw8jCTfwHNRJhhmFcbXvVDTqWMEVFBX6ZKUmG5CNSKK"
+        token_ids = [save_token(i, early_bidders=[_early_bidder(shared_wallet)]) for i in range(3)]
+
+        test_client.post(f"/api/tokens/{token_ids[0]}/tags", json={"tag": "verified-win"})
+        test_client.post(f"/api/tokens/{token_ids[0]}/tags", json={"tag": "win:5x"})
+        test_client.post(f"/api/tokens/{token_ids[2]}/tags", json={"tag": "verified-loss"})
+
+        response = test_client.get("/multi-token-wallets?min_tokens=2")
+        assert response.status_code == 200
+
+        wallet = next(w for w in response.json()["wallets"] if w["wallet_address"] == shared_wallet)
+        verdicts = dict(zip(wallet["token_ids"], wallet["verdicts"]))
+        multipliers = dict(zip(wallet["token_ids"], wallet["win_multipliers"]))
+        assert verdicts == {token_ids[0]: "verified-win", token_ids[1]: None, token_ids[2]: "verified-loss"}
+        assert multipliers == {token_ids[0]: "win:5x", token_ids[1]: None, token_ids[2]: None}
+
     def test_multi_token_wallets_caching(self, test_client: TestClient, test_db: str):
         """Test that multi-token wallets endpoint uses caching"""
         # First request
@@ -97,6 +126,39 @@ class TestMultiTokenWallets:
         # Results should be identical
         assert response1.json() == response2.json()
 
+    def test_multi_token_wallets_etag_not_modified(self, test_client: TestClient, test_db: str):
+        """Test that a repeated poll with the cached ETag gets 304"""
+        response1 = test_client.get("/multi-token-wallets?min_tokens=2")
+        etag = response1.headers.get("etag")
+        assert etag
+
+        response2 = test_client.get("/multi-token-wallets?min_tokens=2", headers={"If-None-Match": etag})
+        assert response2.status_code == 304
+        assert response2.headers.get("etag") == etag
+
+    def test_multi_token_wallets_etag_not_modified_after_recompute(self, test_client: TestClient, test_db: str):
+        """Test that an unchanged result recomputed after cache expiry still gets 304"""
+        etag = test_client.get("/multi-token-wallets?min_tokens=2").headers.get("etag")
+        invalidate_multi_token_wallets_cache()
+
+        response = test_client.get("/multi-token-wallets?min_tokens=2", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers.get("etag") == etag
+
+    def test_token_tag_change_invalidates_multi_token_wallets(self, test_client: TestClient, save_token):
+        """Test that tagging a token refreshes cached verdicts"""
+        shared_wallet = "DYw8jCTfwHNRJhhmFcbXvVDTqWMEVFBX6ZKUmG5CNSKK"
+        token_ids = [save_token(i, early_bidders=[_early_bidder(shared_wallet)]) for i in range(2)]
+
+        response = test_client.get("/multi-token-wallets?min_tokens=2")
+        assert response.json()["wallets"][0]["verdicts"] == [None, None]
+
+        test_client.post(f"/api/tokens/{token_ids[0]}/tags", json={"tag": "verified-win"})
+
+        response = test_client.get("/multi-token-wallets?min_tokens=2")
+        wallet = response.json()["wallets"][0]
+        assert dict(zip(wallet["token_ids"], wallet["verdicts"]))[token_ids[0]] == "verified-win"
+
 
 @pytest.mark.integration
 class TestBalanceRefresh:
@@ -121,6 +183,40 @@ class TestBalanceRefresh:
         assert data["successful"] >= 0
         assert "results" in data
 
+    def test_refresh_reports_previous_balance(self, test_client: TestClient, save_token, sample_early_bidders):
+        """Test that a successful refresh stores the new balance and echoes the old one"""
+        save_token(early_bidders=sample_early_bidders)
+        refreshed_wallet = sample_early_bidders[0]["wallet_address"]
+        failed_wallet = sample_early_bidders[1]["wallet_address"]
+
+        async def fake_balances(wallet_address):
+            if wallet_address == refreshed_wallet:
+                return {"totalUsdValue": 4321.0}, 100
+            return None, 100
+
+        with patch(
+            "meridinate.helius_api.HeliusAPI.get_wallet_balances_async", new=AsyncMock(side_effect=fake_balances)
+        ):
+            response = test_client.post(
+                "/wallets/refresh-balances", json={"wallet_addresses": [refreshed_wallet, failed_wallet]}
+            )
+        assert response.status_code == 200
+
+        results = {r["wallet_address"]: r for r in response.json()["results"]}
+        assert results[refreshed_wallet]["balance_usd"] == 4321.0
+        assert results[refreshed_wallet]["previous_balance_usd"] == 1000.0
+        assert results[refreshed_wallet]["updated_at"] is not None
+        assert results[failed_wallet]["success"] is False
+        assert results[failed_wallet]["previous_balance_usd"] == 2000.0
+
+        with db.get_db_connection() as conn:
+            row = conn.execute(
+                "SELECT wallet_balance_usd, wallet_balance_usd_previous FROM early_buyer_wallets "
+                "WHERE wallet_address = ?",
+                (refreshed_wallet,),
+            ).fetchone()
+        assert (row[0], row[1]) == (4321.0, 1000.0)
+
     def test_refresh_balances_empty_list(self, test_client: TestClient):
         """Test refreshing with empty wallet list"""
         payload = {"wallet_addresses": []}
@@ -149,3 +245,48 @@ class TestBalanceRefresh:
         data = response.json()
         assert data["total_wallets"] == 2
         assert len(data["results"]) == 2
+
+
+@pytest.mark.integration
+class TestTopHolderTokens:
+    """Test top-holder lookups backed by the token_top_holders index"""
+
+    def test_top_holder_tokens_and_counts(self, test_client: TestClient, save_token):
+        """Test wallet rank and per-wallet counts across tokens"""
+        wallet_a = "DYw8jCTfwHNRJhhmFcbXvVDTqWMEVFBX6ZKUmG5CNSKK"
+        wallet_b = "7xLk17EQQ5KLDLDe44wCmupJKJjTGd8hs3eSVVhCx6ku"
+        save_token(1, top_holders=[{"address": wallet_b}, {"address": wallet_a}])
+        save_token(2, top_holders=[{"address": wallet_a}])
+
+        response = test_client.get(f"/wallets/{wallet_a}/top-holder-tokens")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_tokens"] == 2
+        assert [t["wallet_rank"] for t in data["tokens"]] == [2, 1]
+
+        response = test_client.post(
+            "/wallets/batch-top-holder-counts",
+            json={"wallet_addresses": [wallet_a, wallet_b, "UnknownWallet"]},
+        )
+        assert response.status_code == 200
+        assert response.json()["counts"] == {wallet_a: 2, wallet_b: 1, "UnknownWallet": 0}
+
+    def test_batch_counts_each_token_once(self, test_client: TestClient, save_token):
+        """Test that a wallet listed twice in one token's holders counts once"""
+        wallet_a = "DYw8jCTfwHNRJhhmFcbXvVDTqWMEVFBX6ZKUmG5CNSKK"
+        save_token(1, top_holders=[{"address": wallet_a}, {"address": wallet_a}])
+
+        response = test_client.post("/wallets/batch-top-holder-counts", json={"wallet_addresses": [wallet_a, wallet_a]})
+        assert response.status_code == 200
+        assert response.json()["counts"] == {wallet_a: 1}
+
+    def test_top_holder_index_follows_updates(self, test_client: TestClient, save_token):
+        """Test that rewriting top_holders_json re-indexes the token"""
+        wallet_a = "DYw8jCTfwHNRJhhmFcbXvVDTqWMEVFBX6ZKUmG5CNSKK"
+        token_id = save_token(1, top_holders=[{"address": wallet_a}])
+
+        with db.get_db_connection() as conn:
+            conn.execute("UPDATE analyzed_tokens SET top_holders_json = '[]' WHERE id = ?", (token_id,))
+
+        response = test_client.post("/wallets/batch-top-holder-counts", json={"wallet_addresses": [wallet_a]})
+        assert response.json()["counts"] == {wallet_a: 0}
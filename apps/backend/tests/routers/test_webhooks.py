@@ -0,0 +1,185 @@
+"""
+Tests for webhooks router
+
+Tests Helius webhook callback handling of position (SWAB) updates
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from meridinate import analyzed_tokens_db as db
+
+
+def _token_transfer(from_wallet, to_wallet, mint, amount):
+    return {"fromUserAccount": from_wallet, "toUserAccount": to_wallet, "mint": mint, "tokenAmount": amount}
+
+
+@pytest.mark.integration
+class TestWebhookCallback:
+    """Test the /webhooks/callback endpoint"""
+
+    def test_callback_invalid_json(self, test_client: TestClient, test_db: str):
+        """Test that a non-JSON body is rejected"""
+        response = test_client.post(
+            "/webhooks/callback", content="not json", headers={"Content-Type": "application/json"}
+        )
+        assert response.status_code == 400
+
+    def test_callback_orders_updates_per_wallet_and_mint(self, test_client: TestClient, test_db: str):
+        """Test that updates for one wallet/mint apply in payload order and untracked pairs are skipped"""
+        calls = []
+
+        async def fake_sell(wallet_address, token_mint, tokens_sold, signature, quotes):
+            # Yield so a concurrent group could interleave if ordering were broken
+            await asyncio.sleep(0.01 if tokens_sold == 1 else 0)
+            calls.append(("sell", wallet_address, token_mint, tokens_sold))
+            return "sell" if wallet_address == "WalletA" else None
+
+        async def fake_buy(wallet_address, token_mint, tokens_bought, signature, quotes):
+            calls.append(("buy", wallet_address, token_mint, tokens_bought))
+            return None
+
+        payload = [
+            {
+                "signature": "sig1",
+                "timestamp": 1700000000,
+                "type": "SWAP",
+                "tokenTransfers": [_token_transfer("WalletA", None, "MintX", 1)],
+            },
+            {
+                "signature": "sig2",
+                "timestamp": 1700000001,
+                "type": "SWAP",
+                "tokenTransfers": [
+                    _token_transfer("WalletA", None, "MintX", 2),
+                    _token_transfer("WalletB", "WalletC", "MintY", 5),
+                ],
+            },
+        ]
+
+        tracked = {("WalletA", "MintX"), ("WalletB", "MintY")}
+        with (
+            patch("meridinate.routers.webhooks._process_swab_sell", new=fake_sell),
+            patch("meridinate.routers.webhooks._process_swab_buy", new=fake_buy),
+            patch.object(db, "get_position_keys_for_wallets", return_value=tracked),
+        ):
+            response = test_client.post("/webhooks/callback", json=payload)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["processed"] == 2
+        assert data["swab_updates"] == 2
+
+        wallet_a = [c for c in calls if c[1] == "WalletA"]
+        assert [c[3] for c in wallet_a] == [1, 2]
+        assert ("sell", "WalletB", "MintY", 5) in calls
+        assert not [c for c in calls if c[1] == "WalletC"]
+
+    def test_callback_skips_dust_transfers(self, test_client: TestClient, test_db: str):
+        """Test that dust transfers are not queued for position updates"""
+        payload = [
+            {
+                "signature": "sig1",
+                "type": "SWAP",
+                "tokenTransfers": [_token_transfer("WalletA", "WalletB", "MintX", 0.0001)],
+            },
+        ]
+
+        with (
+            patch.object(db, "get_position_keys_for_wallets") as keys_mock,
+            patch("meridinate.routers.webhooks._process_swab_sell") as sell_mock,
+            patch("meridinate.routers.webhooks._process_swab_buy") as buy_mock,
+        ):
+            response = test_client.post("/webhooks/callback", json=payload)
+
+        assert response.status_code == 200
+        assert response.json()["swab_updates"] == 0
+        keys_mock.assert_not_called()
+        sell_mock.assert_not_called()
+        buy_mock.assert_not_called()
+
+    def test_callback_saves_activity_for_tracked_wallets(
+        self, test_client: TestClient, save_token, sample_early_bidders
+    ):
+        """Test that activity is stored once per signature and only for tracked wallets"""
+        save_token(early_bidders=sample_early_bidders)
+        tracked = sample_early_bidders[0]["wallet_address"]
+
+        payload = [
+            {
+                "signature": "sig1",
+                "timestamp": 1700000000,
+                "type": "TRANSFER",
+                "description": "sol out",
+                "nativeTransfers": [{"fromUserAccount": tracked, "toUserAccount": "Other", "amount": 2_000_000_000}],
+                "tokenTransfers": [_token_transfer(tracked, "Other", "MintX", 10)],
+            },
+            {
+                "signature": "sig2",
+                "timestamp": 1700000001,
+                "type": "TRANSFER",
+                "nativeTransfers": [{"fromUserAccount": "Untracked", "toUserAccount": "Other", "amount": 1}],
+            },
+        ]
+
+        with (
+            patch("meridinate.routers.webhooks._process_swab_sell", return_value=None),
+            patch("meridinate.routers.webhooks._process_swab_buy", return_value=None),
+        ):
+            response = test_client.post("/webhooks/callback", json=payload)
+        assert response.status_code == 200
+
+        with db.get_db_connection() as conn:
+            rows = conn.execute(
+                "SELECT transaction_signature, timestamp, sol_amount, token_amount, recipient_address "
+                "FROM wallet_activity"
+            ).fetchall()
+        assert [tuple(r) for r in rows] == [("sig1", "2023-11-14T22:13:20", 2.0, 0.0, "Other")]
+
+    def test_callback_looks_up_each_mint_once(self, test_client: TestClient, test_db: str):
+        """Test that transfers of one mint share a single DexScreener quote per payload"""
+        position = {"token_id": 1, "token_symbol": "TK1", "current_balance": 100.0, "still_holding": True}
+        payload = [
+            {
+                "signature": f"sig{i}",
+                "type": "SWAP",
+                "tokenTransfers": [_token_transfer(f"Wallet{i}", None, "MintX", 1)],
+            }
+            for i in range(3)
+        ]
+
+        tracked = {(f"Wallet{i}", "MintX") for i in range(3)}
+        with (
+            patch.object(db, "get_position_keys_for_wallets", return_value=tracked),
+            patch.object(db, "get_active_position_by_token_address", return_value=position),
+            patch(
+                "meridinate.helius_api.HeliusAPI.aget_token_price_from_dexscreener", new=AsyncMock(return_value=None)
+            ) as price_mock,
+            patch(
+                "meridinate.helius_api.HeliusAPI.aget_market_cap_from_dexscreener", new=AsyncMock(return_value=None)
+            ) as mc_mock,
+        ):
+            response = test_client.post("/webhooks/callback", json=payload)
+
+        assert response.status_code == 200
+        assert response.json()["swab_updates"] == 0
+        assert price_mock.await_count == 1
+        assert mc_mock.await_count == 1
+
+    def test_position_keys_for_wallets(self, save_token, sample_early_bidders):
+        """Test the (wallet, mint) pre-filter returns held and sold positions only for the given wallets"""
+        token_address = "Token1Address1234567890123456789012345"
+        token_id = save_token(early_bidders=sample_early_bidders)
+        held, sold = (w["wallet_address"] for w in sample_early_bidders)
+        db.upsert_mtew_position(held, token_id, current_balance=10.0)
+        db.upsert_mtew_position(sold, token_id, still_holding=False, current_balance=0.0)
+
+        assert db.get_position_keys_for_wallets([held, sold, "Untracked"]) == {
+            (held, token_address),
+            (sold, token_address),
+        }
+        assert db.get_position_keys_for_wallets([held]) == {(held, token_address)}
+        assert db.get_position_keys_for_wallets([]) == set()
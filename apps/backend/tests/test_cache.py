@@ -0,0 +1,75 @@
+"""
+Tests for the response cache
+
+Tests request deduplication when the in-flight fetch succeeds, fails or is cancelled
+"""
+
+import asyncio
+
+import pytest
+
+from meridinate.cache import ResponseCache
+
+
+async def _leader_and_waiter(cache: ResponseCache, fetch_fn):
+    """Start a leader on fetch_fn, then a waiter on the same key once the leader is in flight"""
+    leader = asyncio.create_task(cache.deduplicate_request("key", fetch_fn))
+    await asyncio.sleep(0)
+    assert "key" in cache.pending_requests
+    waiter = asyncio.create_task(cache.deduplicate_request("key", fetch_fn))
+    await asyncio.sleep(0)
+    return leader, waiter
+
+
+@pytest.mark.unit
+class TestDeduplicateRequest:
+    """Test ResponseCache.deduplicate_request with two concurrent callers"""
+
+    @pytest.mark.asyncio
+    async def test_waiter_shares_leader_result(self):
+        cache = ResponseCache(name="test")
+        calls = 0
+        release = asyncio.Event()
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return {"ok": True}
+
+        leader, waiter = await _leader_and_waiter(cache, fetch)
+        release.set()
+
+        assert await asyncio.wait_for(asyncio.gather(leader, waiter), timeout=1) == [{"ok": True}, {"ok": True}]
+        assert calls == 1
+        assert cache.pending_requests == {}
+
+    @pytest.mark.asyncio
+    async def test_waiter_reraises_leader_exception(self):
+        cache = ResponseCache(name="test")
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            raise ValueError("upstream failed")
+
+        leader, waiter = await _leader_and_waiter(cache, fetch)
+        release.set()
+
+        results = await asyncio.wait_for(asyncio.gather(leader, waiter, return_exceptions=True), timeout=1)
+        assert all(isinstance(result, ValueError) for result in results)
+        assert cache.pending_requests == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_cancels_waiter(self):
+        cache = ResponseCache(name="test")
+
+        async def fetch():
+            await asyncio.Event().wait()
+
+        leader, waiter = await _leader_and_waiter(cache, fetch)
+        leader.cancel()
+
+        results = await asyncio.wait_for(asyncio.gather(leader, waiter, return_exceptions=True), timeout=1)
+        assert all(isinstance(result, asyncio.CancelledError) for result in results)
+        assert cache.pending_requests == {}
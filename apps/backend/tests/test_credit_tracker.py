@@ -0,0 +1,71 @@
+"""
+Tests for the credit tracker
+
+Tests queued operation log entries being flushed in one batch
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from meridinate import settings
+from meridinate.credit_tracker import CreditTracker
+
+
+@pytest.fixture
+def tracker(test_db_path: str, monkeypatch) -> CreditTracker:
+    """A fresh CreditTracker (not the process singleton) on the test database"""
+    monkeypatch.setattr(settings, "DATABASE_FILE", test_db_path)
+    monkeypatch.setattr(CreditTracker, "_instance", None)
+    return CreditTracker()
+
+
+@pytest.mark.unit
+class TestQueuedOperations:
+    """Test queue_operation() + flush_operations()"""
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_queued_entries_and_prunes(self, tracker: CreditTracker):
+        # Fill the log to its cap with older entries
+        tracker.record_operations(
+            [
+                {
+                    "operation": "old_op",
+                    "label": f"Old {i}",
+                    "credits": 1,
+                    "call_count": 1,
+                    "context_json": None,
+                    "timestamp": f"2020-01-01 00:{i // 60:02d}:{i % 60:02d}",
+                }
+                for i in range(100)
+            ]
+        )
+
+        tracker.queue_operation("token_analysis", "Token Analysis", credits=50, call_count=3, context={"token_id": 1})
+        tracker.queue_operation("position_check", "Position Check", credits=10)
+        queued_timestamps = [entry["timestamp"] for entry in tracker._pending_operations]
+
+        assert await tracker.flush_operations() == 2
+        assert not tracker._pending_operations
+
+        with tracker._get_connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM operation_log").fetchone()[0] == 100
+            rows = conn.execute(
+                "SELECT operation, credits, call_count, timestamp, context_json FROM operation_log "
+                "WHERE operation != 'old_op' ORDER BY id"
+            ).fetchall()
+
+        assert [(row["operation"], row["credits"], row["call_count"]) for row in rows] == [
+            ("token_analysis", 50, 3),
+            ("position_check", 10, 1),
+        ]
+        assert [row["timestamp"] for row in rows] == queued_timestamps
+        assert rows[0]["context_json"] == '{"token_id": 1}'
+
+        # Queued timestamps are UTC, matching the column's CURRENT_TIMESTAMP default
+        queued_at = datetime.strptime(queued_timestamps[0], "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc)
+        assert abs(datetime.now(timezone.utc) - queued_at) < timedelta(minutes=1)
+
+    @pytest.mark.asyncio
+    async def test_flush_with_nothing_queued(self, tracker: CreditTracker):
+        assert await tracker.flush_operations() == 0
@@ -0,0 +1,180 @@
+"""
+Tests for the scheduler
+
+Tests job syncing from settings and the adaptive Auto-Scan interval against
+an unstarted AsyncIOScheduler
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+
+from meridinate import scheduler
+from meridinate.settings import CURRENT_INGEST_SETTINGS
+
+
+async def _stub_job():
+    pass
+
+
+def _interval_minutes(sched: AsyncIOScheduler, job_id: str) -> int:
+    return int(sched.get_job(job_id).trigger.interval.total_seconds() // 60)
+
+
+def _next_run() -> datetime:
+    return datetime.now(timezone.utc) + timedelta(minutes=5)
+
+
+@pytest.fixture
+def auto_scan_scheduler(monkeypatch):
+    """Unstarted scheduler installed as the module scheduler, with ingest settings base=15, quota=20"""
+    sched = AsyncIOScheduler()
+    monkeypatch.setattr(scheduler, "_scheduler", sched)
+    monkeypatch.setitem(CURRENT_INGEST_SETTINGS, "discovery_interval_minutes", 15)
+    monkeypatch.setitem(CURRENT_INGEST_SETTINGS, "discovery_max_per_run", 20)
+
+    def add_job(minutes: int, paused: bool = False):
+        sched.add_job(
+            _stub_job,
+            trigger=IntervalTrigger(minutes=minutes),
+            id=scheduler._tier0_job_id,
+            next_run_time=None if paused else _next_run(),
+        )
+
+    return sched, add_job
+
+
+_STUB_SPEC = scheduler._JobSpec(
+    job_id="stub_job",
+    name="Stub Job",
+    func=_stub_job,
+    enabled_key="stub_enabled",
+    interval_key="stub_interval_minutes",
+    default_minutes=5,
+    log_label="[Stub]",
+)
+
+
+@pytest.mark.unit
+class TestSyncJob:
+    """Test that _sync_job only touches the jobstore on a real settings change"""
+
+    def _synced_scheduler(self, minutes: int = 5) -> AsyncIOScheduler:
+        sched = AsyncIOScheduler()
+        scheduler._sync_job(sched, _STUB_SPEC, {"stub_enabled": True, "stub_interval_minutes": minutes})
+        return sched
+
+    def test_enabled_job_added(self):
+        sched = self._synced_scheduler(7)
+        job = sched.get_job(_STUB_SPEC.job_id)
+        assert job is not None
+        assert job.name == "Stub Job"
+        assert _interval_minutes(sched, _STUB_SPEC.job_id) == 7
+
+    def test_unchanged_interval_keeps_next_run_time(self):
+        sched = self._synced_scheduler(5)
+        next_run = _next_run()
+        sched.modify_job(_STUB_SPEC.job_id, next_run_time=next_run)
+
+        scheduler._sync_job(sched, _STUB_SPEC, {"stub_enabled": True, "stub_interval_minutes": 5})
+
+        job = sched.get_job(_STUB_SPEC.job_id)
+        assert job.next_run_time == next_run
+        assert _interval_minutes(sched, _STUB_SPEC.job_id) == 5
+
+    def test_changed_interval_while_paused_stays_paused(self):
+        sched = self._synced_scheduler(5)
+        sched.pause_job(_STUB_SPEC.job_id)
+
+        scheduler._sync_job(sched, _STUB_SPEC, {"stub_enabled": True, "stub_interval_minutes": 10})
+
+        job = sched.get_job(_STUB_SPEC.job_id)
+        assert _interval_minutes(sched, _STUB_SPEC.job_id) == 10
+        assert job.next_run_time is None
+
+    def test_changed_interval_while_active_reschedules(self):
+        sched = self._synced_scheduler(5)
+        sched.modify_job(_STUB_SPEC.job_id, next_run_time=_next_run())
+
+        scheduler._sync_job(sched, _STUB_SPEC, {"stub_enabled": True, "stub_interval_minutes": 10})
+
+        job = sched.get_job(_STUB_SPEC.job_id)
+        assert _interval_minutes(sched, _STUB_SPEC.job_id) == 10
+        assert job.next_run_time is not None
+
+    def test_disabled_job_removed(self):
+        sched = self._synced_scheduler(5)
+
+        scheduler._sync_job(sched, _STUB_SPEC, {"stub_enabled": False, "stub_interval_minutes": 5})
+
+        assert sched.get_job(_STUB_SPEC.job_id) is None
+
+
+def _run_result(scanned: int, errors=None) -> dict:
+    return {"tokens_scanned": scanned, "tokens_filtered": 0, "errors": errors or []}
+
+
+@pytest.mark.unit
+class TestAdaptAutoScanInterval:
+    """Test how the Auto-Scan interval follows token flow"""
+
+    def test_empty_run_doubles_interval(self, auto_scan_scheduler):
+        sched, add_job = auto_scan_scheduler
+        add_job(15)
+        scheduler._adapt_auto_scan_interval(_run_result(0))
+        assert _interval_minutes(sched, scheduler._tier0_job_id) == 30
+
+    def test_full_quota_halves_interval(self, auto_scan_scheduler):
+        sched, add_job = auto_scan_scheduler
+        add_job(60)
+        scheduler._adapt_auto_scan_interval(_run_result(20))
+        assert _interval_minutes(sched, scheduler._tier0_job_id) == 30
+
+    def test_partial_run_returns_to_base(self, auto_scan_scheduler):
+        sched, add_job = auto_scan_scheduler
+        add_job(120)
+        scheduler._adapt_auto_scan_interval(_run_result(5))
+        assert _interval_minutes(sched, scheduler._tier0_job_id) == 15
+
+    def test_interval_clamped_to_bounds(self, auto_scan_scheduler):
+        sched, add_job = auto_scan_scheduler
+        add_job(200)
+        scheduler._adapt_auto_scan_interval(_run_result(0))
+        assert _interval_minutes(sched, scheduler._tier0_job_id) == scheduler.AUTO_SCAN_MAX_INTERVAL_MINUTES
+
+        sched.remove_job(scheduler._tier0_job_id)
+        add_job(12)
+        scheduler._adapt_auto_scan_interval(_run_result(20))
+        assert _interval_minutes(sched, scheduler._tier0_job_id) == scheduler.AUTO_SCAN_MIN_INTERVAL_MINUTES
+
+    def test_bounds_widen_to_configured_interval(self, auto_scan_scheduler, monkeypatch):
+        sched, add_job = auto_scan_scheduler
+
+        # A configured interval below the minimum is the floor
+        monkeypatch.setitem(CURRENT_INGEST_SETTINGS, "discovery_interval_minutes", 5)
+        add_job(5)
+        scheduler._adapt_auto_scan_interval(_run_result(20))
+        assert _interval_minutes(sched, scheduler._tier0_job_id) == 5
+
+        # ...and one above the maximum is the ceiling
+        sched.remove_job(scheduler._tier0_job_id)
+        monkeypatch.setitem(CURRENT_INGEST_SETTINGS, "discovery_interval_minutes", 300)
+        add_job(300)
+        scheduler._adapt_auto_scan_interval(_run_result(0))
+        assert _interval_minutes(sched, scheduler._tier0_job_id) == 300
+
+    def test_paused_job_left_alone(self, auto_scan_scheduler):
+        sched, add_job = auto_scan_scheduler
+        add_job(15, paused=True)
+        scheduler._adapt_auto_scan_interval(_run_result(0))
+        job = sched.get_job(scheduler._tier0_job_id)
+        assert _interval_minutes(sched, scheduler._tier0_job_id) == 15
+        assert job.next_run_time is None
+
+    def test_run_with_errors_left_alone(self, auto_scan_scheduler):
+        sched, add_job = auto_scan_scheduler
+        add_job(15)
+        scheduler._adapt_auto_scan_interval(_run_result(0, errors=["DexScreener timeout"]))
+        assert _interval_minutes(sched, scheduler._tier0_job_id) == 15